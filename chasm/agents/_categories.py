@@ -0,0 +1,55 @@
+"""Component category heuristics shared by the insight extractors.
+
+Maps free-text component names (as returned by the LLM) onto a
+`ComponentCategory` by keyword.
+"""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+
+from chasm.models.schema import ComponentCategory
+
+# Map common component mentions to a category
+CATEGORY_MAP: dict[str, ComponentCategory] = {
+    "battery": ComponentCategory.ELECTRICAL,
+    "motor": ComponentCategory.ELECTRICAL,
+    "power": ComponentCategory.ELECTRICAL,
+    "charger": ComponentCategory.ELECTRICAL,
+    "esc": ComponentCategory.ELECTRICAL,
+    "sensor": ComponentCategory.ELECTRICAL,
+    "camera": ComponentCategory.ELECTRICAL,
+    "gimbal": ComponentCategory.MECHANICAL,
+    "hinge": ComponentCategory.MECHANICAL,
+    "propeller": ComponentCategory.MECHANICAL,
+    "arm": ComponentCategory.MECHANICAL,
+    "landing gear": ComponentCategory.MECHANICAL,
+    "frame": ComponentCategory.MECHANICAL,
+    "screen": ComponentCategory.ELECTRICAL,
+    "firmware": ComponentCategory.FIRMWARE,
+    "software": ComponentCategory.FIRMWARE,
+    "app": ComponentCategory.FIRMWARE,
+    "box": ComponentCategory.PACKAGING,
+    "packaging": ComponentCategory.PACKAGING,
+}
+
+
+# All keywords compiled into one alternation so a name is scanned once.  The
+# lookahead makes matches overlap, so every keyword occurring in the name is
+# seen; the earliest entry in CATEGORY_MAP wins, as with a linear scan.
+_KEYWORD_PRIORITY: dict[str, int] = {kw: i for i, kw in enumerate(CATEGORY_MAP)}
+_KEYWORD_RE = re.compile(
+    "(?=(" + "|".join(re.escape(kw) for kw in CATEGORY_MAP) + "))"
+)
+_CATEGORIES: list[ComponentCategory] = list(CATEGORY_MAP.values())
+
+
+@lru_cache(maxsize=1024)
+def guess_category(component_name: str) -> ComponentCategory:
+    """Best-effort category mapping from a free-text component name."""
+    best = min(
+        (_KEYWORD_PRIORITY[m.group(1)] for m in _KEYWORD_RE.finditer(component_name.lower())),
+        default=None,
+    )
+    return ComponentCategory.UNKNOWN if best is None else _CATEGORIES[best]
@@ -6,18 +6,20 @@ Google Gemini to extract structured `Product` entities from the combined text.
 
 from __future__ import annotations
 
-import json
+import asyncio
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List
 from urllib.parse import urljoin, urlparse
 from uuid import uuid4
 
 import trafilatura
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
 from chasm.core.config import settings
-from chasm.core.llm import GeminiAgent
+from chasm.core.http import cached_fetch
+from chasm.core.llm import GeminiAgent, parse_json_array
 from chasm.core.logger import get_logger
 from chasm.models.schema import Product
 
@@ -37,6 +39,25 @@ _EXTRACTION_PROMPT = (
     '[{"name": "Widget Pro", "description": "A compact industrial sensor."}]'
 )
 
+# Patterns that usually indicate product-related pages
+_PRODUCT_PATTERNS = re.compile(
+    r"/(product|drone|camera|robomaster|store|shop|mavic|phantom|inspire|mini|air|avata|neo|flip)",
+    re.IGNORECASE,
+)
+
+# Only anchors matter for link discovery — the parser skips everything else
+_ANCHORS_ONLY = SoupStrainer("a", href=True)
+
+# hrefs that can never point at a product page
+_SKIP_HREF_PREFIXES = ("#", "mailto:", "tel:", "javascript:")
+
+# Input budget for product extraction, and the least scraped text worth a call
+_MAX_INPUT_TOKENS = 8_000
+_MIN_SITE_TEXT_CHARS = 500
+
+# Upper bound on concurrent sub-page fetches
+_MAX_FETCH_WORKERS = 8
+
 
 class ProductCataloger(GeminiAgent):
     """Scrape a company website and extract `Product` entities via Gemini."""
@@ -50,34 +71,56 @@ class ProductCataloger(GeminiAgent):
         """Extract clean text from raw HTML via trafilatura."""
         return trafilatura.extract(html) or ""
 
+    @classmethod
+    def _fetch_and_extract(cls, link: str) -> tuple[str, str | None]:
+        """Fetch *link* and extract its text; returns ``(link, None)`` on failure."""
+        try:
+            html = cached_fetch(link)
+            if html:
+                return link, cls._extract_text(html) or None
+        except Exception as exc:
+            logger.warning("  ✗ %s failed: %s", link, exc)
+        return link, None
+
     @staticmethod
     def _find_product_links(html: str, base_url: str, max_links: int = 8) -> list[str]:
         """Parse the homepage HTML to find likely product-page links."""
-        soup = BeautifulSoup(html, "html.parser")
-        base_domain = urlparse(base_url).netloc
+        soup = BeautifulSoup(html, "lxml", parse_only=_ANCHORS_ONLY)
+        parsed_base = urlparse(base_url)
+        base_domain = parsed_base.netloc
+        base_prefix = f"{parsed_base.scheme}://{base_domain}"
         seen: set[str] = set()
         product_links: list[str] = []
 
-        # Patterns that usually indicate product-related pages
-        product_patterns = re.compile(
-            r"/(product|drone|camera|robomaster|store|shop|mavic|phantom|inspire|mini|air|avata|neo|flip)",
-            re.IGNORECASE,
-        )
-
         for tag in soup.find_all("a", href=True):
-            href: str = tag["href"]
-            full = urljoin(base_url, href)
-            parsed = urlparse(full)
-
-            # Stay on the same domain, skip anchors / duplicates
-            if parsed.netloc != base_domain:
+            href: str = tag["href"].strip()
+            if not href or href.startswith(_SKIP_HREF_PREFIXES):
                 continue
-            path = parsed.path.rstrip("/")
+
+            # Fast paths avoid urljoin/urlparse for the common link shapes.
+            if href[0] == "/" and not href.startswith("//"):
+                # Site-relative link: same domain by construction.
+                full = base_prefix + href
+                path = href.split("#", 1)[0].split("?", 1)[0]
+            elif href.startswith(base_prefix) and href[len(base_prefix):][:1] in ("", "/", "?", "#"):
+                # Absolute link on the same origin.
+                full = href
+                path = href[len(base_prefix):].split("#", 1)[0].split("?", 1)[0]
+            else:
+                full = urljoin(base_url, href)
+                parsed = urlparse(full)
+                # Stay on the same domain
+                if parsed.netloc != base_domain:
+                    continue
+                path = parsed.path
+
+            # Skip anchors / duplicates
+            path = path.rstrip("/")
             if path in seen or not path or path == "/":
                 continue
             seen.add(path)
 
-            if product_patterns.search(path):
+            if _PRODUCT_PATTERNS.search(path):
                 product_links.append(full)
                 if len(product_links) >= max_links:
                     break
@@ -94,7 +137,7 @@ class ProductCataloger(GeminiAgent):
             RuntimeError: If the base page could not be fetched.
         """
         logger.info("Scraping %s …", base_url)
-        homepage_html = trafilatura.fetch_url(base_url)
+        homepage_html = cached_fetch(base_url)
 
         if homepage_html is None:
             raise RuntimeError(f"Failed to download content from {base_url}")
@@ -110,16 +153,13 @@ class ProductCataloger(GeminiAgent):
         sub_links = self._find_product_links(homepage_html, base_url)
         logger.info("Found %d product-related sub-page(s) to scrape", len(sub_links))
 
-        for link in sub_links:
-            try:
-                html = trafilatura.fetch_url(link)
-                if html:
-                    page_text = self._extract_text(html)
+        if sub_links:
+            # Sub-page fetches are independent network round-trips — overlap them.
+            with ThreadPoolExecutor(max_workers=min(len(sub_links), _MAX_FETCH_WORKERS)) as pool:
+                for link, page_text in pool.map(self._fetch_and_extract, sub_links):
                     if page_text:
                         texts.append(page_text)
                         logger.info("  + %s → %d chars", link, len(page_text))
-            except Exception as exc:
-                logger.warning("  ✗ %s failed: %s", link, exc)
 
         combined = "\n\n---\n\n".join(texts)
 
@@ -147,28 +187,49 @@ class ProductCataloger(GeminiAgent):
         Returns:
             A list of validated `Product` models.
         """
+        prompt = self._products_request(site_text, base_url)
+        if prompt is None:
+            return []
+
         logger.info("Prompting Gemini (%s) to extract products …", self.model)
+        response = self._generate(prompt, system_instruction=_EXTRACTION_PROMPT)
+        return self._parse_products(response.text or "[]", base_url)
 
-        response = self.client.models.generate_content(
-            model=self.model,
-            contents=f"{_EXTRACTION_PROMPT}\n\nText:\n{site_text[:30_000]}",
-        )
+    async def extract_products_async(
+        self,
+        site_text: str,
+        base_url: str,
+    ) -> List[Product]:
+        """Async twin of `extract_products`."""
+        # Token budgeting may call count_tokens (blocking) on first use.
+        prompt = await asyncio.to_thread(self._products_request, site_text, base_url)
+        if prompt is None:
+            return []
 
-        raw = response.text or "[]"
-        logger.debug("Raw Gemini response:\n%s", raw)
+        logger.info("Prompting Gemini (%s) to extract products …", self.model)
+        response = await self._generate_async(prompt, system_instruction=_EXTRACTION_PROMPT)
+        return self._parse_products(response.text or "[]", base_url)
+
+    def _products_request(self, site_text: str, base_url: str) -> str | None:
+        """Build the extraction prompt, or None if there's too little text."""
+        site_text = site_text.strip()
+        if len(site_text) < _MIN_SITE_TEXT_CHARS:
+            logger.warning(
+                "Only %d chars of text from %s — skipping product extraction.",
+                len(site_text),
+                base_url,
+            )
+            return None
+        return f"Text:\n{self._truncate_to_tokens(site_text, _MAX_INPUT_TOKENS)}"
 
-        # The model sometimes wraps JSON in markdown fences — strip them.
-        json_match = re.search(r"\[.*\]", raw, re.DOTALL)
-        if json_match:
-            raw = json_match.group(0)
-        else:
-            logger.error("No JSON array found in Gemini response:\n%s", raw)
-            return []
+    @staticmethod
+    def _parse_products(raw: str, base_url: str) -> List[Product]:
+        logger.debug("Raw Gemini response:\n%s", raw)
 
-        try:
-            items: list[dict] = json.loads(raw)
-        except json.JSONDecodeError:
-            logger.error("Gemini returned unparseable JSON:\n%s", raw)
+        # The model sometimes wraps JSON in markdown fences or prose.
+        items = parse_json_array(raw)
+        if items is None:
+            logger.error("No parseable JSON array in Gemini response:\n%s", raw)
             return []
 
         products: List[Product] = []
@@ -192,3 +253,8 @@ class ProductCataloger(GeminiAgent):
         """End-to-end: scrape ➜ extract ➜ return products."""
         text = self.scrape_company_site(base_url)
         return self.extract_products(text, base_url)
+
+    async def discover_async(self, base_url: str) -> List[Product]:
+        """Async `discover`, so several sites can be gathered concurrently."""
+        text = await asyncio.to_thread(self.scrape_company_site, base_url)
+        return await self.extract_products_async(text, base_url)
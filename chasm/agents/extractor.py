@@ -7,71 +7,153 @@ typed Pydantic models ready for graph injection.
 
 from __future__ import annotations
 
-import json
-import re
+import asyncio
+import os
+from collections.abc import Iterator
+from functools import lru_cache
+from hashlib import blake2b
 from pathlib import Path
-from uuid import uuid4
+from secrets import token_hex
 
+import numpy as np
+import orjson
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+from chasm.agents._categories import guess_category as _guess_category
 from chasm.core.config import settings
-from chasm.core.llm import GeminiAgent
+from chasm.core.llm import GeminiAgent, iter_json_array, parse_json_array, run_sync
 from chasm.core.logger import get_logger
-from chasm.models.schema import (
-    Component,
-    ComponentCategory,
-    Insight,
-)
+from chasm.models.schema import Component, Insight
 
 logger = get_logger(__name__)
 
+# Per-directory record of each file's body hash as of its last extraction.
+MANIFEST_NAME = ".manifest.json"
+
 # ---------------------------------------------------------------------------
 # Extraction prompt template
 # ---------------------------------------------------------------------------
 
+# Static instructions (sent as the system prompt, so they can be cached) and
+# the per-call request that follows them.
 _EXTRACTION_PROMPT = """\
-You are a Hardware Product Manager analyzing customer feedback for the {product_name}.
+You are a Hardware Product Manager analyzing customer feedback for the product named below.
 Read the following text and extract specific actionable insights.
 Return ONLY a valid JSON list of objects with the following keys:
 - "component_name" (str): The physical part being discussed (e.g., "Battery", "Screen", "Hinge"). Use "General" if it's about the whole product.
 - "summary" (str): A concise 1-sentence summary of the feedback.
 - "sentiment" (float): A score from -1.0 (very negative) to 1.0 (very positive).
-- "tags" (list of str): 2-3 categorical tags (e.g., ["thermal", "safety"]).
+- "tags" (list of str): 2-3 categorical tags (e.g., ["thermal", "safety"])."""
+
+_EXTRACTION_REQUEST = """\
+Product: {product_name}
 
 Text to analyze:
 {text_content}"""
 
-# Map common component mentions to a category
-_CATEGORY_MAP: dict[str, ComponentCategory] = {
-    "battery": ComponentCategory.ELECTRICAL,
-    "motor": ComponentCategory.ELECTRICAL,
-    "power": ComponentCategory.ELECTRICAL,
-    "charger": ComponentCategory.ELECTRICAL,
-    "esc": ComponentCategory.ELECTRICAL,
-    "sensor": ComponentCategory.ELECTRICAL,
-    "camera": ComponentCategory.ELECTRICAL,
-    "gimbal": ComponentCategory.MECHANICAL,
-    "hinge": ComponentCategory.MECHANICAL,
-    "propeller": ComponentCategory.MECHANICAL,
-    "arm": ComponentCategory.MECHANICAL,
-    "landing gear": ComponentCategory.MECHANICAL,
-    "frame": ComponentCategory.MECHANICAL,
-    "screen": ComponentCategory.ELECTRICAL,
-    "firmware": ComponentCategory.FIRMWARE,
-    "software": ComponentCategory.FIRMWARE,
-    "app": ComponentCategory.FIRMWARE,
-    "box": ComponentCategory.PACKAGING,
-    "packaging": ComponentCategory.PACKAGING,
-}
-
-
-def _guess_category(component_name: str) -> ComponentCategory:
-    """Best-effort category mapping from a free-text component name."""
-    lower = component_name.lower()
-    for keyword, cat in _CATEGORY_MAP.items():
-        if keyword in lower:
-            return cat
-    return ComponentCategory.UNKNOWN
+# Variant used when several documents are packed into one request.
+_BATCH_EXTRACTION_PROMPT = _EXTRACTION_PROMPT + """
+- "file_id" (str): The id of the document the insight came from, copied exactly \
+from its "=== file_id: ... ===" header.
+
+Several documents follow, each introduced by its own header. Return a single \
+JSON list covering all of them."""
+
+_BATCH_DOCUMENT = """\
+=== file_id: {file_id} ===
+{text_content}"""
+
+def _sanitize_items(items: list) -> list[dict]:
+    """Normalise LLM insight dicts to the field types the schema expects.
+
+    Drops non-dict entries and coerces ``component_name``, ``summary``,
+    ``sentiment`` and ``tags``, so models can be built from the result with
+    ``model_construct`` instead of a second validation pass.  Sentiment is
+    range-clamped separately by ``_clamp_sentiments``.
+    """
+    clean: list[dict] = []
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        try:
+            sentiment = float(item.get("sentiment", 0.0))
+        except (TypeError, ValueError):
+            sentiment = 0.0
+        if sentiment != sentiment:  # NaN
+            sentiment = 0.0
+        tags = item.get("tags")
+        clean.append({
+            **item,
+            "component_name": str(item.get("component_name") or "General"),
+            "summary": str(item.get("summary") or ""),
+            "sentiment": sentiment,
+            "tags": [str(tag) for tag in tags] if isinstance(tags, list) else [],
+        })
+    return clean
+
+
+def _clamp_sentiments(values: list) -> list[float]:
+    """Coerce raw LLM sentiment values to floats clamped to [-1, 1], in one pass."""
+    return np.clip(np.asarray(values, dtype=np.float64), -1.0, 1.0).tolist()
+
+
+# Enough to hold the frontmatter the harvesters write
+_FRONTMATTER_READ_BYTES = 8192
+
+
+@lru_cache(maxsize=512)
+def _parse_markdown_cached(path: str, mtime_ns: int, size: int) -> tuple[dict, str]:
+    """Parse a Markdown file into ``(frontmatter, content)``.
+
+    Keyed on modification time and size as well as path, so an edited file
+    is re-read while unchanged files are parsed only once per process.
+    """
+    with open(path, "rb") as fh:
+        # Frontmatter sits at the top — look for the closing "---" in the
+        # first block only, then read the body from just past it.
+        head = fh.read(_FRONTMATTER_READ_BYTES)
+        if head.startswith(b"---"):
+            end = head.find(b"\n---", 3)
+            if end < 0 and len(head) == _FRONTMATTER_READ_BYTES:
+                head += fh.read()  # unusually long frontmatter
+                end = head.find(b"\n---", 3)
+            if end >= 0:
+                frontmatter = yaml.load(head[3:end].decode("utf-8"), Loader=_YamlLoader) or {}
+                fh.seek(end + 4)
+                content = fh.read().decode("utf-8").strip()
+                return frontmatter, content
+
+        frontmatter = {}
+        content = (head + fh.read()).decode("utf-8").strip()
+
+    return frontmatter, content
+
+
+def _read_manifest(raw_dir: Path) -> dict[str, str]:
+    try:
+        return orjson.loads((raw_dir / MANIFEST_NAME).read_bytes())
+    except FileNotFoundError:
+        return {}
+    except (OSError, orjson.JSONDecodeError) as exc:
+        logger.warning("Ignoring unreadable extraction manifest in %s: %s", raw_dir, exc)
+        return {}
+
+
+def write_manifest(raw_dir: Path, hashes: dict[str, str]) -> None:
+    """Record *hashes* (from `InsightExtractor.process_directory`) for *raw_dir*.
+
+    Call only once the extracted insights are persisted: files listed here
+    are skipped by the next ``skip_unchanged`` run.
+    """
+    path = raw_dir / MANIFEST_NAME
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(orjson.dumps(hashes, option=orjson.OPT_SORT_KEYS))
+    os.replace(tmp, path)
 
 
 class InsightExtractor(GeminiAgent):
@@ -91,18 +173,13 @@ class InsightExtractor(GeminiAgent):
         Returns:
             ``{"frontmatter": dict, "content": str}``
         """
-        text = Path(filepath).read_text(encoding="utf-8")
-
-        # Split on the YAML delimiters (--- ... ---)
-        parts = text.split("---", maxsplit=2)
-        if len(parts) >= 3:
-            frontmatter = yaml.safe_load(parts[1]) or {}
-            content = parts[2].strip()
-        else:
-            frontmatter = {}
-            content = text.strip()
-
-        return {"frontmatter": frontmatter, "content": content}
+        path = Path(filepath)
+        stat = path.stat()
+        frontmatter, content = _parse_markdown_cached(
+            str(path.resolve()), stat.st_mtime_ns, stat.st_size
+        )
+        # Copy so callers can't mutate the cached frontmatter.
+        return {"frontmatter": dict(frontmatter), "content": content}
 
     # ------------------------------------------------------------------
     # 2. Extract insights via LLM
@@ -118,35 +195,144 @@ class InsightExtractor(GeminiAgent):
         Returns:
             A list of dicts with keys: component_name, summary, sentiment, tags.
         """
-        prompt = _EXTRACTION_PROMPT.format(
+        items = list(self.iter_insights(text_content, product_name))
+        logger.info("Extracted %d insight(s).", len(items))
+        return items
+
+    def iter_insights(self, text_content: str, product_name: str) -> Iterator[dict]:
+        """Stream insight dicts as the model emits them.
+
+        Same output as `extract_insights`, but each dict is yielded as soon
+        as its JSON object is complete in the streamed response.
+        """
+        logger.info("Extracting insights for '%s' …", product_name)
+        chunks = self._generate_stream(
+            self._single_request(text_content, product_name),
+            system_instruction=_EXTRACTION_PROMPT,
+        )
+        for item in iter_json_array(chunks):
+            yield from _sanitize_items([item])
+
+    async def extract_insights_async(self, text_content: str, product_name: str) -> list[dict]:
+        """Async twin of `extract_insights`."""
+        return await self._extract_async(text_content, product_name) or []
+
+    async def _extract_async(self, text_content: str, product_name: str) -> list[dict] | None:
+        """`extract_insights_async`, but None when the response had no parseable array."""
+        logger.info("Extracting insights for '%s' …", product_name)
+        response = await self._generate_async(
+            self._single_request(text_content, product_name),
+            system_instruction=_EXTRACTION_PROMPT,
+        )
+
+        items = self._parse_items(response.text or "[]")
+        logger.info("Extracted %d insight(s).", len(items or ()))
+        return items
+
+    def extract_insights_batch(
+        self,
+        documents: list[tuple[str, str]],
+        product_name: str,
+    ) -> dict[str, list[dict]]:
+        """Extract insights from several documents with a single LLM request.
+
+        Args:
+            documents: ``(file_id, text_content)`` pairs; the caller keeps
+                the combined text within the per-request budget.
+            product_name: Product name for prompt context.
+
+        Returns:
+            Insight dicts grouped by ``file_id``.  Items the model attributed
+            to an unknown id are dropped.
+        """
+        logger.info(
+            "Extracting insights for '%s' from %d document(s) …",
+            product_name,
+            len(documents),
+        )
+        response = self._generate(
+            self._batch_request(documents, product_name),
+            system_instruction=_BATCH_EXTRACTION_PROMPT,
+        )
+        return self._group_by_file(documents, self._parse_items(response.text or "[]") or [])
+
+    async def extract_insights_batch_async(
+        self,
+        documents: list[tuple[str, str]],
+        product_name: str,
+    ) -> dict[str, list[dict]]:
+        """Async twin of `extract_insights_batch`."""
+        grouped = await self._extract_batch_async(documents, product_name)
+        return grouped if grouped is not None else self._group_by_file(documents, [])
+
+    async def _extract_batch_async(
+        self,
+        documents: list[tuple[str, str]],
+        product_name: str,
+    ) -> dict[str, list[dict]] | None:
+        """`extract_insights_batch_async`, but None when the response had no parseable array."""
+        logger.info(
+            "Extracting insights for '%s' from %d document(s) …",
+            product_name,
+            len(documents),
+        )
+        response = await self._generate_async(
+            self._batch_request(documents, product_name),
+            system_instruction=_BATCH_EXTRACTION_PROMPT,
+        )
+        items = self._parse_items(response.text or "[]")
+        return None if items is None else self._group_by_file(documents, items)
+
+    @staticmethod
+    def _single_request(text_content: str, product_name: str) -> str:
+        return _EXTRACTION_REQUEST.format(
             product_name=product_name,
             text_content=text_content[:15_000],  # cap context
         )
 
-        logger.info("Extracting insights for '%s' …", product_name)
+    @staticmethod
+    def _batch_request(documents: list[tuple[str, str]], product_name: str) -> str:
+        body = "\n\n".join(
+            _BATCH_DOCUMENT.format(file_id=file_id, text_content=text)
+            for file_id, text in documents
+        )
+        return _EXTRACTION_REQUEST.format(product_name=product_name, text_content=body)
 
-        response = self.client.models.generate_content(
-            model=self.model,
-            contents=prompt,
+    @staticmethod
+    def _group_by_file(
+        documents: list[tuple[str, str]],
+        items: list[dict],
+    ) -> dict[str, list[dict]]:
+        """Split a batched response's items into per-document insight lists."""
+        grouped: dict[str, list[dict]] = {file_id: [] for file_id, _ in documents}
+        for item in items:
+            bucket = grouped.get(str(item.pop("file_id", "")))
+            if bucket is None:
+                logger.debug("Dropping insight with unknown file_id: %s", item)
+                continue
+            bucket.append(item)
+
+        logger.info(
+            "Extracted %d insight(s) from %d document(s).",
+            sum(len(v) for v in grouped.values()),
+            len(documents),
         )
+        return grouped
 
-        raw = response.text or "[]"
-        logger.debug("Raw LLM response:\n%s", raw)
+    @staticmethod
+    def _parse_items(raw: str) -> list[dict] | None:
+        """Pull the JSON list of insight dicts out of a raw LLM response.
 
-        # Find the JSON array
-        match = re.search(r"\[.*\]", raw, re.DOTALL)
-        if not match:
-            logger.error("No JSON array in LLM response:\n%s", raw)
-            return []
+        Returns None when the response holds no parseable array.
+        """
+        logger.debug("Raw LLM response:\n%s", raw)
 
-        try:
-            items: list[dict] = json.loads(match.group(0))
-        except json.JSONDecodeError:
-            logger.error("Unparseable JSON from LLM:\n%s", raw)
-            return []
+        items = parse_json_array(raw)
+        if items is None:
+            logger.error("No parseable JSON array in LLM response:\n%s", raw)
+            return None
 
-        logger.info("Extracted %d insight(s).", len(items))
-        return items
+        return _sanitize_items(items)
 
     # ------------------------------------------------------------------
     # 3. Process a directory of scraped files
@@ -157,6 +343,8 @@ class InsightExtractor(GeminiAgent):
         raw_dir: str,
         product_id: str,
         product_name: str,
+        skip_unchanged: bool = False,
+        manifest: dict[str, str] | None = None,
     ) -> list[tuple[Component, Insight, str]]:
         """Process all ``.md`` files in a directory and return typed models.
 
@@ -164,13 +352,38 @@ class InsightExtractor(GeminiAgent):
             raw_dir: Path to the directory containing scraped Markdown files.
             product_id: The product these files belong to.
             product_name: Human-readable product name for prompts.
+            skip_unchanged: Skip files whose body is unchanged since they were
+                last extracted (tracked in ``MANIFEST_NAME`` in *raw_dir*), so
+                re-scraped pages don't cost tokens or duplicate insights.
+            manifest: If given, filled with the body hashes to record: the
+                skipped files plus those whose response parsed.  Pass it to
+                `write_manifest` once the results are persisted.
 
         Returns:
             A list of ``(Component, Insight, source_url)`` tuples ready for
             injection into ``ChasmGraph``.
         """
+        return run_sync(
+            self.process_directory_async(raw_dir, product_id, product_name, skip_unchanged, manifest)
+        )
+
+    async def process_directory_async(
+        self,
+        raw_dir: str,
+        product_id: str,
+        product_name: str,
+        skip_unchanged: bool = False,
+        manifest: dict[str, str] | None = None,
+    ) -> list[tuple[Component, Insight, str]]:
+        """Async implementation of `process_directory`.
+
+        Up to ``settings.llm_concurrency`` extraction requests are in flight
+        at once.
+        """
         raw_path = Path(raw_dir)
         md_files = sorted(raw_path.glob("*.md"))
+        recorded = _read_manifest(raw_path) if skip_unchanged else {}
+        hashes: dict[str, str] = {}
         logger.info(
             "Processing %d file(s) in %s for product '%s'",
             len(md_files),
@@ -178,34 +391,84 @@ class InsightExtractor(GeminiAgent):
             product_name,
         )
 
-        results: list[tuple[Component, Insight, str]] = []
-
+        # Parse everything up front, then pack files into batches whose
+        # combined text stays under the per-request budget.
+        source_urls: list[str] = []
+        names: list[str] = []
+        batches: list[list[tuple[str, str]]] = []
+        budget = settings.extraction_batch_chars
+        used = budget
+        skipped = 0
         for md_file in md_files:
             parsed = self.parse_markdown_file(str(md_file))
-            source_url = parsed["frontmatter"].get("source_url", str(md_file))
-
-            raw_insights = self.extract_insights(parsed["content"], product_name)
-
-            for item in raw_insights:
-                comp_name = item.get("component_name", "General")
-                component = Component(
-                    id=f"comp-{uuid4().hex[:8]}",
-                    name=comp_name,
-                    category=_guess_category(comp_name),
-                )
-
-                sentiment_val = item.get("sentiment", 0.0)
-                # Clamp to [-1, 1]
-                sentiment_val = max(-1.0, min(1.0, float(sentiment_val)))
-
-                insight = Insight(
-                    id=f"ins-{uuid4().hex[:8]}",
-                    summary=item.get("summary", ""),
-                    sentiment=sentiment_val,
-                    tags=item.get("tags", []),
-                )
-
-                results.append((component, insight, source_url))
+            # Body only: frontmatter carries a fresh date_scraped each run.
+            digest = blake2b(parsed["content"].encode("utf-8"), digest_size=16).hexdigest()
+            hashes[md_file.name] = digest
+            if recorded.get(md_file.name) == digest:
+                skipped += 1
+                continue
+            idx = len(source_urls)
+            names.append(md_file.name)
+            source_urls.append(parsed["frontmatter"].get("source_url", str(md_file)))
+            content = parsed["content"][:budget]
+            if used + len(content) > budget:
+                batches.append([])
+                used = 0
+            batches[-1].append((str(idx), content))
+            used += len(content)
+        if skipped:
+            logger.info("Skipping %d file(s) unchanged since their last extraction.", skipped)
+
+        semaphore = asyncio.Semaphore(max(1, settings.llm_concurrency))
+
+        async def _run(batch: list[tuple[str, str]]) -> dict[str, list[dict]] | None:
+            async with semaphore:
+                if len(batch) == 1:
+                    file_id, content = batch[0]
+                    items = await self._extract_async(content, product_name)
+                    return None if items is None else {file_id: items}
+                return await self._extract_batch_async(batch, product_name)
+
+        # Batches are independent requests — keep several in flight at once.
+        # Files whose response didn't parse stay out of the manifest.
+        per_file: dict[str, list[dict]] = {}
+        for batch, grouped in zip(batches, await asyncio.gather(*(_run(batch) for batch in batches))):
+            if grouped is None:
+                for file_id, _ in batch:
+                    del hashes[names[int(file_id)]]
+            else:
+                per_file.update(grouped)
+
+        # Flatten to parallel columns so the sentiment clamp is one vector op.
+        rows = [
+            (item, source_url)
+            for idx, source_url in enumerate(source_urls)
+            for item in per_file.get(str(idx), [])
+        ]
+        sentiments = _clamp_sentiments([item["sentiment"] for item, _ in rows])
+
+        results: list[tuple[Component, Insight, str]] = []
+
+        # Items were sanitised in _parse_items, so skip re-validation.
+        for (item, source_url), sentiment_val in zip(rows, sentiments):
+            comp_name = item["component_name"]
+            component = Component.model_construct(
+                id=f"comp-{token_hex(4)}",
+                name=comp_name,
+                category=_guess_category(comp_name),
+            )
+
+            insight = Insight.model_construct(
+                id=f"ins-{token_hex(4)}",
+                summary=item["summary"],
+                sentiment=sentiment_val,
+                tags=item["tags"],
+            )
+
+            results.append((component, insight, source_url))
+
+        if manifest is not None:
+            manifest.update(hashes)
 
         logger.info(
             "Directory processing complete: %d (Component, Insight) pairs.",
@@ -11,51 +11,17 @@ transcripts into structured (Component, Insight) pairs.
 
 from __future__ import annotations
 
-import json
-import re
-from uuid import uuid4
+from collections.abc import Iterator
+from secrets import token_hex
 
-from chasm.core.llm import GeminiAgent
+from chasm.agents._categories import guess_category as _guess_category
+from chasm.agents.extractor import _clamp_sentiments, _sanitize_items
+from chasm.core.llm import GeminiAgent, iter_json_array, parse_json_array
 from chasm.core.logger import get_logger
-from chasm.models.schema import Component, ComponentCategory, Insight
+from chasm.models.schema import Component, Insight
 
 logger = get_logger(__name__)
 
-# ---------------------------------------------------------------------------
-# Category mapping (reused from extractor.py)
-# ---------------------------------------------------------------------------
-
-_CATEGORY_MAP: dict[str, ComponentCategory] = {
-    "battery": ComponentCategory.ELECTRICAL,
-    "motor": ComponentCategory.ELECTRICAL,
-    "power": ComponentCategory.ELECTRICAL,
-    "charger": ComponentCategory.ELECTRICAL,
-    "esc": ComponentCategory.ELECTRICAL,
-    "sensor": ComponentCategory.ELECTRICAL,
-    "camera": ComponentCategory.ELECTRICAL,
-    "gimbal": ComponentCategory.MECHANICAL,
-    "hinge": ComponentCategory.MECHANICAL,
-    "propeller": ComponentCategory.MECHANICAL,
-    "arm": ComponentCategory.MECHANICAL,
-    "landing gear": ComponentCategory.MECHANICAL,
-    "frame": ComponentCategory.MECHANICAL,
-    "screen": ComponentCategory.ELECTRICAL,
-    "firmware": ComponentCategory.FIRMWARE,
-    "software": ComponentCategory.FIRMWARE,
-    "app": ComponentCategory.FIRMWARE,
-    "box": ComponentCategory.PACKAGING,
-    "packaging": ComponentCategory.PACKAGING,
-}
-
-
-def _guess_category(component_name: str) -> ComponentCategory:
-    lower = component_name.lower()
-    for keyword, cat in _CATEGORY_MAP.items():
-        if keyword in lower:
-            return cat
-    return ComponentCategory.UNKNOWN
-
-
 # ---------------------------------------------------------------------------
 # System prompts
 # ---------------------------------------------------------------------------
@@ -94,8 +60,9 @@ Return ONLY a valid JSON list of objects with the following keys:
 - "component_name" (str): The physical part or system discussed (e.g., "Battery", "Screen", "Firmware"). Use "General" for whole-product or company-level feedback.
 - "summary" (str): A concise 1-sentence summary of the insight.
 - "sentiment" (float): A score from -1.0 (very negative) to 1.0 (very positive).
-- "tags" (list of str): 2-3 categorical tags.
+- "tags" (list of str): 2-3 categorical tags."""
 
+_EXTRACTION_REQUEST = """\
 Known products: {product_names}
 
 Interview transcript:
@@ -109,6 +76,9 @@ Interview transcript:
 class Interviewer(GeminiAgent):
     """Conversational AI agent that conducts employee interviews."""
 
+    # A person is waiting on every turn.
+    service_tier = "priority"
+
     def start_interview(self, product_names: str) -> str:
         """Generate the opening greeting for a new interview.
 
@@ -120,11 +90,11 @@ class Interviewer(GeminiAgent):
         """
         system = _INTERVIEW_SYSTEM.format(product_names=product_names)
 
-        response = self.client.models.generate_content(
-            model=self.model,
-            contents=[
-                {"role": "user", "parts": [{"text": system + "\n\nPlease begin the interview with a friendly greeting."}]},
+        response = self._generate(
+            [
+                {"role": "user", "parts": [{"text": "Please begin the interview with a friendly greeting."}]},
             ],
+            system_instruction=system,
         )
         return (response.text or "").strip()
 
@@ -144,22 +114,17 @@ class Interviewer(GeminiAgent):
         """
         system = _INTERVIEW_SYSTEM.format(product_names=product_names)
 
-        # Build the Gemini contents array
-        contents = []
-
-        # First message includes the system prompt
-        for i, msg in enumerate(conversation_history):
-            role = "model" if msg["role"] == "assistant" else "user"
-            text = msg["content"]
-            if i == 0 and role == "model":
-                # Prepend system prompt context to the first assistant message
-                text = f"[System: {system}]\n\n{text}"
-            contents.append({"role": role, "parts": [{"text": text}]})
-
-        response = self.client.models.generate_content(
-            model=self.model,
-            contents=contents,
-        )
+        # Build the Gemini contents array; the interview rules travel as the
+        # system prompt so only the conversation itself is sent per turn.
+        contents = [
+            {
+                "role": "model" if msg["role"] == "assistant" else "user",
+                "parts": [{"text": msg["content"]}],
+            }
+            for msg in conversation_history
+        ]
+
+        response = self._generate(contents, system_instruction=system)
         return (response.text or "").strip()
 
 
@@ -184,48 +149,77 @@ class InterviewInsightExtractor(GeminiAgent):
         Returns:
             List of (Component, Insight, product_name_hint) tuples.
         """
-        prompt = _EXTRACTION_PROMPT.format(
-            product_names=product_names,
-            transcript=transcript[:20_000],
-        )
+        results = list(self.iter_from_transcript(transcript, product_names))
+        logger.info("Extracted %d insight(s) from interview.", len(results))
+        return results
+
+    def iter_from_transcript(
+        self,
+        transcript: str,
+        product_names: str,
+    ) -> Iterator[tuple[Component, Insight, str]]:
+        """Stream ``(Component, Insight, product_name_hint)`` tuples.
 
+        Each tuple is yielded as soon as its JSON object is complete in the
+        streamed LLM response.
+        """
         logger.info("Extracting insights from interview transcript …")
-        response = self.client.models.generate_content(
-            model=self.model,
-            contents=prompt,
+        chunks = self._generate_stream(
+            self._transcript_request(transcript, product_names),
+            system_instruction=_EXTRACTION_PROMPT,
         )
+        for item in iter_json_array(chunks):
+            yield from self._build_results(_sanitize_items([item]))
 
+    async def extract_from_transcript_async(
+        self,
+        transcript: str,
+        product_names: str,
+    ) -> list[tuple[Component, Insight, str]]:
+        """Async twin of `extract_from_transcript`."""
+        logger.info("Extracting insights from interview transcript …")
+        response = await self._generate_async(
+            self._transcript_request(transcript, product_names),
+            system_instruction=_EXTRACTION_PROMPT,
+        )
         raw = response.text or "[]"
-        match = re.search(r"\[.*\]", raw, re.DOTALL)
-        if not match:
-            logger.error("No JSON array in LLM response:\n%s", raw)
+        parsed = parse_json_array(raw)
+        if parsed is None:
+            logger.error("No parseable JSON array in LLM response:\n%s", raw)
             return []
 
-        try:
-            items: list[dict] = json.loads(match.group(0))
-        except json.JSONDecodeError:
-            logger.error("Unparseable JSON from LLM:\n%s", raw)
-            return []
+        results = self._build_results(_sanitize_items(parsed))
+        logger.info("Extracted %d insight(s) from interview.", len(results))
+        return results
+
+    @staticmethod
+    def _transcript_request(transcript: str, product_names: str) -> str:
+        return _EXTRACTION_REQUEST.format(
+            product_names=product_names,
+            transcript=transcript[:20_000],
+        )
+
+    @staticmethod
+    def _build_results(items: list[dict]) -> list[tuple[Component, Insight, str]]:
+        """Build typed models from sanitised insight dicts."""
+        sentiments = _clamp_sentiments([item["sentiment"] for item in items])
 
         results: list[tuple[Component, Insight, str]] = []
-        for item in items:
-            comp_name = item.get("component_name", "General")
-            component = Component(
-                id=f"comp-{uuid4().hex[:8]}",
+        for item, sentiment_val in zip(items, sentiments):
+            comp_name = item["component_name"]
+            component = Component.model_construct(
+                id=f"comp-{token_hex(4)}",
                 name=comp_name,
                 category=_guess_category(comp_name),
             )
 
-            sentiment_val = max(-1.0, min(1.0, float(item.get("sentiment", 0.0))))
-            insight = Insight(
-                id=f"ins-interview-{uuid4().hex[:8]}",
-                summary=item.get("summary", ""),
+            insight = Insight.model_construct(
+                id=f"ins-interview-{token_hex(4)}",
+                summary=item["summary"],
                 sentiment=sentiment_val,
-                tags=item.get("tags", []),
+                tags=item["tags"],
             )
 
             product_hint = item.get("product_name", "General")
             results.append((component, insight, product_hint))
-
-        logger.info("Extracted %d insight(s) from interview.", len(results))
         return results
@@ -7,8 +7,10 @@ summarisation, and saves the resulting Markdown report to disk.
 from __future__ import annotations
 
 import json
+import os
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from typing import Any
 
 
 from chasm.core.config import settings
@@ -18,6 +20,21 @@ from chasm.graph.builder import ChasmGraph
 
 logger = get_logger(__name__)
 
+REPORT_INDEX_NAME = "_index.json"
+
+_INSIGHT_LINE = "{index}. [{component}] {summary} (sentiment: {sentiment}, tags: {tags})"
+
+
+def _format_insight_line(index: int, insight: dict) -> str:
+    return _INSIGHT_LINE.format(
+        index=index,
+        component=insight.get("component_name", "General"),
+        summary=insight.get("summary", ""),
+        sentiment=insight.get("sentiment", 0.0),
+        tags=", ".join(insight.get("tags", [])),
+    )
+
+
 # ---------------------------------------------------------------------------
 # Briefing prompt template
 # ---------------------------------------------------------------------------
@@ -40,10 +57,28 @@ things engineering thinks are 'fine').
 
 Keep the tone professional, data-driven, and brief."""
 
+# Split once around the (possibly very large) insight list so building a
+# prompt is two concatenations; only the short head has a placeholder left.
+_BRIEFING_HEAD, _BRIEFING_TAIL = _BRIEFING_PROMPT.split("{insights}")
+
+
+def _briefing_prompt(product_name: str, insights_text: str) -> str:
+    return _BRIEFING_HEAD.format(product_name=product_name) + insights_text + _BRIEFING_TAIL
+
+
+# Map step for large weeks: each chunk of insights is condensed first, and the
+# digests replace the raw list in _BRIEFING_PROMPT.
+_CHUNK_DIGEST_PROMPT = """You are helping a Hardware Product Manager prepare a weekly briefing on '{product_name}'. Condense the raw insights below into at most 8 bullet points. Group related complaints or praise by component, note how many insights back each point and their overall sentiment, and keep any specific failure modes. Return only the bullet points.
+
+{insights}"""
+
 
 class WeeklyBriefing(GeminiAgent):
     """Generate and save executive-level weekly briefings from graph insights."""
 
+    # Weekly batch report — latency doesn't matter, cost does.
+    service_tier = "flex"
+
     # ------------------------------------------------------------------
     # 1. Query the graph for recent insights
     # ------------------------------------------------------------------
@@ -55,8 +90,8 @@ class WeeklyBriefing(GeminiAgent):
     ) -> list[dict]:
         """Collect Insight nodes added within the last *days_back* days.
 
-        For each Insight, also resolves the related Component name via the
-        outgoing ABOUT edge and the Source sentiment.
+        For each Insight, also resolves the related Component name (ABOUT)
+        and the Source URL (YIELDS).
 
         Args:
             graph: A populated ChasmGraph.
@@ -68,33 +103,21 @@ class WeeklyBriefing(GeminiAgent):
         """
         cutoff = datetime.now(timezone.utc) - timedelta(days=days_back)
         results: list[dict] = []
-
-        for nid, data in graph.graph.nodes(data=True):
-            if data.get("node_type") != "Insight":
-                continue
-
-            # Check date_added if present, otherwise include everything
-            date_added = data.get("date_added")
-            if date_added:
-                try:
-                    if datetime.fromisoformat(str(date_added)) < cutoff:
-                        continue
-                except (ValueError, TypeError):
-                    pass
-
-            # Resolve component via ABOUT edge
-            component_name = "General"
-            source_url = ""
-            for _, target, edge_data in graph.graph.out_edges(nid, data=True):
-                if edge_data.get("relation") == "ABOUT":
-                    target_data = graph.graph.nodes.get(target, {})
-                    component_name = target_data.get("name", "General")
-
-            # Resolve source via incoming YIELDS edge
-            for src, _, edge_data in graph.graph.in_edges(nid, data=True):
-                if edge_data.get("relation") == "YIELDS":
-                    src_data = graph.graph.nodes.get(src, {})
-                    source_url = src_data.get("url", "")
+        nodes = graph.graph.nodes
+
+        # Only the recent slice of the date index is visited.
+        for nid in graph.insights_since(cutoff):
+            data = nodes[nid]
+
+            # add_insight stores both on the node; older graphs need the links.
+            component_name = data.get("component_name")
+            source_url = data.get("source_url")
+            if component_name is None or source_url is None:
+                relations = graph.get_node_relations(nid)
+                about = nodes[relations["ABOUT"]] if "ABOUT" in relations else {}
+                source = nodes[relations["YIELDS"]] if "YIELDS" in relations else {}
+                component_name = about.get("name", "General")
+                source_url = source.get("url") or ""
 
             results.append({
                 "id": nid,
@@ -123,6 +146,9 @@ class WeeklyBriefing(GeminiAgent):
     ) -> str:
         """Send insights to Gemini and return a formatted Monday Morning Briefing.
 
+        Weeks with more than ``settings.briefing_chunk_size`` insights are
+        condensed chunk by chunk first, so the final call stays small.
+
         Args:
             product_name: Human-readable product name.
             insights: List of insight dicts (from get_new_insights).
@@ -130,36 +156,68 @@ class WeeklyBriefing(GeminiAgent):
         Returns:
             Markdown string with the full briefing.
         """
-        # Format insights as a readable list for the prompt
-        insight_lines: list[str] = []
-        for i, ins in enumerate(insights, 1):
-            sentiment = ins.get("sentiment", 0.0)
-            component = ins.get("component_name", "General")
-            summary = ins.get("summary", "")
-            tags = ", ".join(ins.get("tags", []))
-            insight_lines.append(
-                f"{i}. [{component}] {summary} "
-                f"(sentiment: {sentiment}, tags: {tags})"
-            )
-
-        insights_text = "\n".join(insight_lines) if insight_lines else "(No insights this week)"
-
-        prompt = _BRIEFING_PROMPT.format(
-            product_name=product_name,
-            insights=insights_text,
-        )
+        chunk_size = settings.briefing_chunk_size
+        insights_text = None
+        if len(insights) > chunk_size:
+            insights_text = self._digest_insights(product_name, insights, chunk_size)
+        if insights_text is None:
+            # Format insights as a readable list for the prompt
+            insights_text = "\n".join(
+                _format_insight_line(i, ins) for i, ins in enumerate(insights, 1)
+            ) or "(No insights this week)"
+
+        prompt = _briefing_prompt(product_name, insights_text)
 
         logger.info("Generating Monday Morning Briefing for '%s' …", product_name)
 
-        response = self.client.models.generate_content(
-            model=self.model,
-            contents=prompt,
-        )
+        response = self._generate(prompt)
 
         report = response.text or "(No report generated)"
         logger.info("Briefing generated (%d chars).", len(report))
         return report
 
+    def _digest_insights(
+        self,
+        product_name: str,
+        insights: list[dict],
+        chunk_size: int,
+    ) -> str | None:
+        """Condense *insights* chunk by chunk in one batch job (map step).
+
+        Returns:
+            The digests joined for use as the briefing's insight list, or
+            None if the batch failed and the raw list should be sent instead.
+        """
+        prompts: dict[str, str] = {}
+        for start in range(0, len(insights), chunk_size):
+            chunk = insights[start:start + chunk_size]
+            prompts[str(start)] = _CHUNK_DIGEST_PROMPT.format(
+                product_name=product_name,
+                insights="\n".join(
+                    _format_insight_line(i, ins) for i, ins in enumerate(chunk, start + 1)
+                ),
+            )
+
+        logger.info(
+            "Condensing %d insight(s) in %d chunk(s) for '%s' …",
+            len(insights),
+            len(prompts),
+            product_name,
+        )
+        try:
+            digests = self._run_batch(prompts, display_name="chasm-briefing-digest")
+        except Exception as exc:
+            logger.warning("Insight digest batch failed (%s); sending raw insights.", exc)
+            return None
+
+        sections = []
+        for key in prompts:
+            start = int(key)
+            end = min(start + chunk_size, len(insights))
+            digest = digests.get(key, "").strip() or "(digest unavailable)"
+            sections.append(f"Insights {start + 1}-{end}:\n{digest}")
+        return "\n\n".join(sections)
+
     # ------------------------------------------------------------------
     # 3. Save report to disk
     # ------------------------------------------------------------------
@@ -180,6 +238,62 @@ class WeeklyBriefing(GeminiAgent):
         date_str = datetime.now().strftime("%Y-%m-%d")
         filepath = out_dir / f"weekly_briefing_{date_str}.md"
 
-        filepath.write_text(report_md, encoding="utf-8")
+        _write_file(filepath, report_md.encode("utf-8"))
         logger.info("Report saved to %s (%d bytes)", filepath, len(report_md))
+        self._update_report_index(out_dir, {
+            "filename": filepath.name,
+            "date": date_str,
+            "bytes": len(report_md),
+        })
         return filepath
+
+    @staticmethod
+    def _update_report_index(out_dir: Path, entry: dict[str, Any]) -> None:
+        """Record *entry* in the product's report index, newest first.
+
+        A re-run on the same day overwrites that day's report, so it
+        replaces the existing entry rather than adding a second one.  With
+        no usable index yet, it is seeded from the reports already on disk,
+        since readers trust the index over a directory listing.
+        """
+        existing = read_report_index(out_dir)
+        if existing is None:
+            existing = [
+                {
+                    "filename": md_file.name,
+                    "date": md_file.stem.removeprefix("weekly_briefing_"),
+                    "bytes": md_file.stat().st_size,
+                }
+                for md_file in sorted(out_dir.glob("*.md"))
+            ]
+        entries = [e for e in existing if e.get("filename") != entry["filename"]]
+        entries.append(entry)
+        entries.sort(key=lambda e: e["filename"], reverse=True)
+
+        index_path = out_dir / REPORT_INDEX_NAME
+        tmp = index_path.with_name(f"{index_path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(entries, indent=2), encoding="utf-8")
+        os.replace(tmp, index_path)
+
+
+def _write_file(path: Path, data: bytes) -> None:
+    """Write *data* to *path* straight through an fd, with no buffered file object."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:  # os.write may write less than asked
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def read_report_index(reports_dir: Path) -> list[dict[str, Any]] | None:
+    """Return the report index for *reports_dir*, or None if it is missing or unreadable."""
+    try:
+        entries = json.loads((reports_dir / REPORT_INDEX_NAME).read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as exc:
+        logger.warning("Ignoring unreadable report index in %s: %s", reports_dir, exc)
+        return None
+    return entries if isinstance(entries, list) else None
@@ -6,52 +6,62 @@ and hardware forums for a given product.
 
 from __future__ import annotations
 
-import json
-import re
+import asyncio
 from pathlib import Path
 
-
 from chasm.core.config import settings
-from chasm.core.llm import GeminiAgent
+from chasm.core.llm import GeminiAgent, parse_json_array, run_sync
 from chasm.core.logger import get_logger
 
 logger = get_logger(__name__)
 
+_SUBREDDITS_PROMPT = (
+    "You are a hardware research assistant. What are the top 3-5 "
+    "subreddits where people discuss the hardware, components, or "
+    "issues of {product_name} or its specific category? "
+    "Return ONLY a valid JSON list of strings "
+    "(e.g., [\"r/drones\", \"r/hardware\"])."
+)
+
+_REVIEW_SITES_PROMPT = (
+    "What are the top 3 authoritative review websites, teardown "
+    "sites, or hardware forums for {product_name}? "
+    "Return ONLY a valid JSON list of domain names "
+    "(e.g., [\"rtings.com\", \"ifixit.com\"])."
+)
+
 
 class SourceScout(GeminiAgent):
     """Discover online sources of hardware feedback via LLM."""
 
+    # Runs from onboarding / the weekly pipeline — nobody is waiting on it.
+    service_tier = "flex"
+
     # ------------------------------------------------------------------
     # Internal helper
     # ------------------------------------------------------------------
 
     def _ask_json_list(self, prompt: str) -> list[str]:
         """Send a prompt to Gemini and parse the response as a JSON list of strings."""
-        response = self.client.models.generate_content(
-            model=self.model,
-            contents=prompt,
-        )
+        response = self._generate(prompt)
+        return self._parse_json_list(response.text or "[]")
 
-        raw = response.text or "[]"
-        logger.debug("Raw LLM response:\n%s", raw)
+    async def _ask_json_list_async(self, prompt: str) -> list[str]:
+        """Async twin of `_ask_json_list`."""
+        response = await self._generate_async(prompt)
+        return self._parse_json_list(response.text or "[]")
 
-        # Strip markdown fences if present
-        raw = re.sub(r"```(?:json)?\s*", "", raw).strip()
+    @staticmethod
+    def _parse_json_list(raw: str) -> list[str]:
+        """Parse an LLM response as a JSON list of strings."""
+        logger.debug("Raw LLM response:\n%s", raw)
 
-        # Find the JSON array in the response
-        match = re.search(r"\[.*?\]", raw, re.DOTALL)
-        if not match:
+        # Linear scan past fences/prose to the first complete array
+        result = parse_json_array(raw)
+        if result is None:
             logger.error("No JSON array found in LLM response:\n%s", raw)
             return []
-
-        try:
-            result = json.loads(match.group(0))
-            if isinstance(result, list):
-                return [str(item) for item in result]
-            return []
-        except json.JSONDecodeError:
-            logger.error("Failed to parse JSON from LLM response:\n%s", raw)
-            return []
+        return [str(item) for item in result]
 
     # ------------------------------------------------------------------
     # Public methods
@@ -66,13 +76,7 @@ class SourceScout(GeminiAgent):
         Returns:
             A list of subreddit names (e.g. ``["r/drones", "r/dji"]``).
         """
-        prompt = (
-            f"You are a hardware research assistant. What are the top 3-5 "
-            f"subreddits where people discuss the hardware, components, or "
-            f"issues of {product_name} or its specific category? "
-            f"Return ONLY a valid JSON list of strings "
-            f"(e.g., [\"r/drones\", \"r/hardware\"])."
-        )
+        prompt = _SUBREDDITS_PROMPT.format(product_name=product_name)
         logger.info("Identifying subreddits for: %s", product_name)
         results = self._ask_json_list(prompt)
         logger.info("Found %d subreddit(s) for %s", len(results), product_name)
@@ -87,13 +91,84 @@ class SourceScout(GeminiAgent):
         Returns:
             A list of domain names (e.g. ``["rtings.com", "ifixit.com"]``).
         """
-        prompt = (
-            f"What are the top 3 authoritative review websites, teardown "
-            f"sites, or hardware forums for {product_name}? "
-            f"Return ONLY a valid JSON list of domain names "
-            f"(e.g., [\"rtings.com\", \"ifixit.com\"])."
-        )
+        prompt = _REVIEW_SITES_PROMPT.format(product_name=product_name)
         logger.info("Finding review sites for: %s", product_name)
         results = self._ask_json_list(prompt)
         logger.info("Found %d review site(s) for %s", len(results), product_name)
         return results
+
+    def discover_all(self, product_names: list[str]) -> dict[str, dict[str, list[str]]]:
+        """Find subreddits and review sites for many products in one batch job.
+
+        Submits every question as a single Gemini Batch Mode job, which is
+        cheaper than one call per question but can take a while, so use it
+        for background runs.  Falls back to per-call requests if the batch
+        fails.
+
+        Args:
+            product_names: Products to research.
+
+        Returns:
+            ``{product_name: {"subreddits": [...], "review_sites": [...]}}``
+        """
+        names = list(dict.fromkeys(product_names))
+        if not names:
+            return {}
+
+        prompts: dict[str, str] = {}
+        for idx, name in enumerate(names):
+            prompts[f"{idx}:subreddits"] = _SUBREDDITS_PROMPT.format(product_name=name)
+            prompts[f"{idx}:review_sites"] = _REVIEW_SITES_PROMPT.format(product_name=name)
+
+        logger.info("Discovering sources for %d product(s) via batch job", len(names))
+        try:
+            answers = self._run_batch(prompts, display_name="chasm-source-scout")
+        except Exception as exc:
+            logger.warning("Batch source discovery failed (%s); asking per product.", exc)
+            return run_sync(self.discover_all_async(names))
+
+        results: dict[str, dict[str, list[str]]] = {}
+        for idx, name in enumerate(names):
+            results[name] = {
+                kind: self._parse_json_list(answers.get(f"{idx}:{kind}", "[]"))
+                for kind in ("subreddits", "review_sites")
+            }
+        return results
+
+    async def discover_all_async(
+        self, product_names: list[str]
+    ) -> dict[str, dict[str, list[str]]]:
+        """Find subreddits and review sites for many products with concurrent calls.
+
+        The interactive counterpart to `discover_all`: every question is sent
+        at once (bounded by ``settings.llm_concurrency``), so the wall time is
+        roughly one round trip instead of two per product.
+
+        Args:
+            product_names: Products to research.
+
+        Returns:
+            ``{product_name: {"subreddits": [...], "review_sites": [...]}}``
+        """
+        names = list(dict.fromkeys(product_names))
+        semaphore = asyncio.Semaphore(settings.llm_concurrency)
+
+        async def ask(prompt: str) -> list[str]:
+            async with semaphore:
+                try:
+                    return await self._ask_json_list_async(prompt)
+                except Exception as exc:
+                    logger.warning("Source discovery request failed: %s", exc)
+                    return []
+
+        logger.info("Discovering sources for %d product(s) concurrently", len(names))
+        answers = await asyncio.gather(*(
+            ask(template.format(product_name=name))
+            for name in names
+            for template in (_SUBREDDITS_PROMPT, _REVIEW_SITES_PROMPT)
+        ))
+
+        return {
+            name: {"subreddits": answers[2 * idx], "review_sites": answers[2 * idx + 1]}
+            for idx, name in enumerate(names)
+        }
@@ -2,12 +2,32 @@
 
 from __future__ import annotations
 
+import orjson
+from networkx.readwrite import json_graph
+
 from chasm.graph.builder import ChasmGraph
 
 # Singleton graph instance shared across all route modules.
 _graph = ChasmGraph()
 
+# (graph version, node-link JSON) for the last serialisation of _graph.
+_cached_graph_json: tuple[int, bytes] | None = None
+
 
 def get_graph() -> ChasmGraph:
     """Return the global ChasmGraph instance."""
     return _graph
+
+
+def get_graph_json() -> bytes:
+    """Return the global graph as node-link JSON, re-serialised only after changes."""
+    global _cached_graph_json
+    snapshot = _graph.snapshot()
+    version = snapshot.version
+    if _cached_graph_json is None or _cached_graph_json[0] != version:
+        data = json_graph.node_link_data(snapshot.graph)
+        # Node attributes may carry non-JSON values (datetimes, int-keyed
+        # dicts); stringify them in the same pass.
+        payload = orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS)
+        _cached_graph_json = (version, payload)
+    return _cached_graph_json[1]
@@ -6,7 +6,9 @@ and weekly briefings as HTTP endpoints.
 
 from __future__ import annotations
 
-from contextlib import asynccontextmanager
+import asyncio
+import os
+from contextlib import asynccontextmanager, suppress
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -14,7 +16,11 @@ from fastapi.middleware.cors import CORSMiddleware
 from chasm.api.deps import get_graph
 from chasm.core.config import settings
 from chasm.core.logger import get_logger
-from chasm.graph.persistence import load_graph_from_disk, save_graph_to_disk
+from chasm.graph.persistence import (
+    load_graph_from_disk,
+    run_debounced_saver,
+    save_graph_to_disk,
+)
 
 logger = get_logger(__name__)
 
@@ -27,8 +33,12 @@ logger = get_logger(__name__)
 async def lifespan(app: FastAPI):
     """Load graph on startup, save on shutdown."""
     load_graph_from_disk(get_graph())
+    saver = asyncio.create_task(run_debounced_saver(get_graph()))
     logger.info("Chasm API started.")
     yield
+    saver.cancel()
+    with suppress(asyncio.CancelledError):
+        await saver
     save_graph_to_disk(get_graph())
     logger.info("Chasm API shut down.")
 
@@ -44,24 +54,26 @@ app = FastAPI(
 )
 
 # CORS — allow local dev and production deployment
-_DEFAULT_ORIGINS = [
+_DEFAULT_ORIGINS: tuple[str, ...] = (
     "http://localhost:3000",
     "http://localhost:5173",
     "http://127.0.0.1:3000",
     "http://127.0.0.1:5173",
-]
+)
 
 # Read CORS_ORIGINS from settings (pydantic-settings) or fall back to os.environ
-import os
 _extra = settings.cors_origins or os.environ.get("CORS_ORIGINS", "")
-if _extra:
-    _DEFAULT_ORIGINS.extend(o.strip() for o in _extra.split(",") if o.strip())
+_EXTRA_ORIGINS = tuple(o.strip() for o in _extra.split(",") if o.strip())
+
+# Starlette checks ``origin in allow_origins`` on every request; a frozenset
+# makes that a hash lookup.
+_ORIGIN_SET = frozenset(_DEFAULT_ORIGINS + _EXTRA_ORIGINS)
 
-logger.info("CORS allowed origins: %s", _DEFAULT_ORIGINS)
+logger.info("CORS allowed origins: %s", sorted(_ORIGIN_SET))
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=_DEFAULT_ORIGINS,
+    allow_origins=_ORIGIN_SET,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import re
+from dataclasses import asdict
+
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
@@ -10,9 +13,9 @@ from chasm.agents.interviewer import Interviewer
 from chasm.core.logger import get_logger
 from chasm.interviews.sessions import (
     ChatMessage,
+    append_to_session,
     create_session,
     load_session,
-    save_session,
     complete_session,
 )
 
@@ -23,6 +26,12 @@ router = APIRouter(prefix="/api", tags=["interviews"])
 # Cache the Interviewer agent so we don't re-init on every request
 _interviewer: Interviewer | None = None
 
+# The interviewer's system prompt asks it to close with this phrase.
+_WRAPUP_RE = re.compile(r"\bthank you for your time\b", re.IGNORECASE)
+
+# (graph.products_version, joined names) so each turn doesn't re-list the products
+_product_names_cache: tuple[int, str] | None = None
+
 
 def _get_interviewer() -> Interviewer:
     global _interviewer
@@ -33,13 +42,17 @@ def _get_interviewer() -> Interviewer:
 
 def _get_product_names() -> str:
     """Get a comma-separated list of all product names from the graph."""
+    global _product_names_cache
     graph = get_graph()
-    names = [
-        data.get("name", nid)
-        for nid, data in graph.graph.nodes(data=True)
-        if data.get("node_type") == "Product"
-    ]
-    return ", ".join(names) if names else "the company's products"
+    # Read before listing, so a product added meanwhile forces a refresh.
+    version = graph.products_version
+    if _product_names_cache is not None and _product_names_cache[0] == version:
+        return _product_names_cache[1]
+
+    names = [data.get("name", nid) for nid, data in graph.snapshot().nodes_of_type("Product")]
+    joined = ", ".join(names) if names else "the company's products"
+    _product_names_cache = (version, joined)
+    return joined
 
 
 # ---------------------------------------------------------------------------
@@ -96,7 +109,7 @@ def get_interview(session_id: str):
     return SessionDetailOut(
         session_id=session.id,
         status=session.status,
-        messages=[m.model_dump() for m in session.messages],
+        messages=[asdict(m) for m in session.messages],
         created_at=session.created_at,
         completed_at=session.completed_at,
     )
@@ -118,8 +131,9 @@ def send_message(session_id: str, req: MessageRequest):
     if session.status == "pending":
         greeting = interviewer.start_interview(product_names)
         session.status = "active"
-        session.messages.append(ChatMessage(role="assistant", content=greeting))
-        save_session(session)
+        greeting_msg = ChatMessage(role="assistant", content=greeting)
+        session.messages.append(greeting_msg)
+        append_to_session(session, greeting_msg)
 
         # Now process the user's actual message as a follow-up
         # (unless the "message" is empty — meaning they just want the greeting)
@@ -127,7 +141,8 @@ def send_message(session_id: str, req: MessageRequest):
             return MessageOut(role="assistant", content=greeting, is_complete=False)
 
     # Append the user's message
-    session.messages.append(ChatMessage(role="user", content=req.message))
+    user_msg = ChatMessage(role="user", content=req.message)
+    session.messages.append(user_msg)
 
     # Build conversation history for the LLM
     history = [{"role": m.role, "content": m.content} for m in session.messages]
@@ -136,10 +151,11 @@ def send_message(session_id: str, req: MessageRequest):
     ai_response = interviewer.next_turn(history, product_names)
 
     # Check if the interview is wrapping up
-    is_complete = "thank you for your time" in ai_response.lower()
+    is_complete = _WRAPUP_RE.search(ai_response) is not None
 
-    session.messages.append(ChatMessage(role="assistant", content=ai_response))
-    save_session(session)
+    ai_msg = ChatMessage(role="assistant", content=ai_response)
+    session.messages.append(ai_msg)
+    append_to_session(session, user_msg, ai_msg)
 
     # Auto-complete if the AI wrapped up
     if is_complete:
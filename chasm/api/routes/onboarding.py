@@ -7,7 +7,7 @@ from pydantic import BaseModel
 
 from chasm.agents.cataloger import ProductCataloger
 from chasm.api.deps import get_graph
-from chasm.graph.persistence import save_graph_to_disk
+from chasm.graph.persistence import mark_dirty
 from chasm.models.schema import Product
 
 router = APIRouter(prefix="/api", tags=["onboarding"])
@@ -68,7 +68,7 @@ def confirm_onboarding(req: SelectProductsRequest):
         graph.add_product(product)
         added.append(p.name)
 
-    save_graph_to_disk(graph)
+    mark_dirty()  # written by the API's debounced saver
     return {
         "status": "ok",
         "added": added,
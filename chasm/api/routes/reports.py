@@ -2,22 +2,41 @@
 
 from __future__ import annotations
 
+import asyncio
+
 from fastapi import APIRouter, HTTPException
 
+from chasm.agents.publisher import read_report_index
 from chasm.core.config import settings
 
 router = APIRouter(prefix="/api", tags=["reports"])
 
 
 @router.get("/reports/{product_id}")
-def list_reports(product_id: str):
+async def list_reports(product_id: str):
     """List available Monday Briefing reports for a product."""
     reports_dir = settings.reports_dir / product_id
-    if not reports_dir.exists():
+    # Directory scans stat every entry; keep them off the event loop.
+    if not await asyncio.to_thread(reports_dir.exists):
         return []
 
+    index = await asyncio.to_thread(read_report_index, reports_dir)
+    if index is not None:
+        return [
+            {
+                "filename": entry["filename"],
+                "product_id": product_id,
+                "path": str(reports_dir / entry["filename"]),
+            }
+            for entry in index
+        ]
+
+    # Reports written before the index existed.
+    md_files = await asyncio.to_thread(
+        lambda: sorted(reports_dir.glob("*.md"), reverse=True)
+    )
     reports: list[dict[str, str]] = []
-    for md_file in sorted(reports_dir.glob("*.md"), reverse=True):
+    for md_file in md_files:
         reports.append({
             "filename": md_file.name,
             "product_id": product_id,
@@ -27,9 +46,9 @@ def list_reports(product_id: str):
 
 
 @router.get("/reports/{product_id}/{filename}")
-def get_report(product_id: str, filename: str):
+async def get_report(product_id: str, filename: str):
     """Return the content of a specific report."""
     filepath = settings.reports_dir / product_id / filename
-    if not filepath.exists():
+    if not await asyncio.to_thread(filepath.exists):
         raise HTTPException(status_code=404, detail="Report not found")
-    return {"content": filepath.read_text(encoding="utf-8")}
+    return {"content": await asyncio.to_thread(filepath.read_text, encoding="utf-8")}
@@ -34,26 +34,70 @@ class Settings(BaseSettings):
     data_dir: Path = _PROJECT_ROOT
     raw_data_dir: Path = _PROJECT_ROOT / "chasm" / "data" / "raw"
     reports_dir: Path = _PROJECT_ROOT / "chasm" / "reports"
+    http_cache_dir: Path = _PROJECT_ROOT / "chasm" / "data" / "cache" / "http"
+    embedding_cache_path: Path = _PROJECT_ROOT / "chasm" / "data" / "cache" / "embeddings.sqlite3"
+    # The API coalesces graph saves: at most one write per interval.
+    graph_save_interval: float = 2.0  # seconds
 
     # ---- LLM ----
     google_api_key: str = ""
     gemini_model: str = "gemini-3-pro-preview"
+    # Static system prompts at least this long are stored with the Gemini
+    # caches API and referenced by name; shorter ones are sent inline.
+    prompt_cache_min_chars: int = 16_000
+    prompt_cache_ttl: int = 3600  # seconds
+    # Max concurrent LLM requests per agent, and the combined text budget
+    # when several scraped files are packed into one extraction request.
+    llm_concurrency: int = 4
+    extraction_batch_chars: int = 15_000
+    # Gemini Batch Mode jobs (latency-tolerant background work)
+    batch_poll_interval: int = 30  # seconds
+    # The weekly pipeline blocks on these jobs; past this they are cancelled
+    # and the work is sent as direct requests instead.
+    batch_max_wait: int = 3600  # seconds
+    # Briefings over more insights than this are condensed chunk by chunk
+    # (one batch job) before the final briefing call.
+    briefing_chunk_size: int = 50
+
+    # ---- Scraping ----
+    http_cache_ttl: int = 86_400  # seconds; 0 disables the page cache
+    http_per_host: int = 4  # concurrent requests to one host in fetch_many
 
     # ---- Reddit ----
     reddit_client_id: str = "YOUR_ID"
     reddit_client_secret: str = "YOUR_SECRET"
     reddit_user_agent: str = "chasm_proto"
+    reddit_concurrency: int = 8  # posts whose comments are fetched in parallel
+    scrape_workers: int = 4  # subreddits scraped in parallel per product
 
     # ---- Embeddings ----
     embedding_model: str = "all-MiniLM-L6-v2"
     similarity_threshold: float = 0.75
+    embedding_batch_size: int = 64  # texts per forward pass in generate_embeddings
+    embedding_cache: bool = True  # reuse vectors for texts embedded before
+    # >1 shards large encode jobs (thousands of texts) across CPU processes.
+    embedding_processes: int = 1
+    # "float16" runs the embedding model in half precision on CUDA (ignored on
+    # CPU, where fp16 matmuls are slower); "float32" keeps full precision.
+    embedding_dtype: str = "float32"
+    # Store Insight embeddings as int8 + scale in the graph export (loaded
+    # back as floats); False writes plain float lists.
+    embedding_quantized: bool = True
 
     # ---- CORS ----
     cors_origins: str = ""
 
+    # ---- Graph persistence ----
+    # "pickle" (gzipped, fast to load) or "json" (node-link, human-readable).
+    graph_format: str = "pickle"
+
     @property
     def export_path(self) -> Path:
         return self.data_dir / "export.json"
 
+    @property
+    def graph_pickle_path(self) -> Path:
+        return self.data_dir / "export.pkl.gz"
+
 
 settings = Settings()
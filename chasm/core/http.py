@@ -0,0 +1,192 @@
+"""Shared HTTP client for scraping.
+
+A single ``requests.Session`` keeps connections alive across fetches, so
+scraping a homepage and its sub-pages pays one TCP+TLS handshake per host
+instead of one per page.  Transient network errors are retried with
+exponential backoff.  ``cached_fetch`` adds an on-disk page cache under
+``settings.http_cache_dir`` so repeat scrapes skip the network.
+``fetch_many`` downloads a list of URLs concurrently on an asyncio client;
+``cached_fetch_many`` is its cached counterpart.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import os
+import time
+from hashlib import blake2b
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from tenacity import (
+    AsyncRetrying,
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential,
+)
+from trafilatura.utils import decode_file
+
+from chasm.core.config import settings
+from chasm.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+_TIMEOUT = 15  # seconds
+_HEADERS = {"User-Agent": f"Mozilla/5.0 (compatible; {settings.app_name}/{settings.version})"}
+
+# Pool size matches the widest fan-out (cataloger sub-page fetches).
+_SESSION = requests.Session()
+_SESSION.headers.update(_HEADERS)
+for _scheme in ("https://", "http://"):
+    _SESSION.mount(_scheme, HTTPAdapter(pool_connections=16, pool_maxsize=16))
+
+
+class _TransientHTTPError(Exception):
+    """A 429/5xx response that is worth retrying."""
+
+
+@retry(
+    retry=retry_if_exception_type(
+        (requests.ConnectionError, requests.Timeout, _TransientHTTPError)
+    ),
+    stop=stop_after_attempt(3),
+    wait=wait_exponential(multiplier=0.5, max=4),
+    reraise=True,
+)
+def _get(url: str) -> requests.Response:
+    resp = _SESSION.get(url, timeout=_TIMEOUT)
+    if resp.status_code == 429 or resp.status_code >= 500:
+        raise _TransientHTTPError(f"HTTP {resp.status_code}")
+    return resp
+
+
+def fetch(url: str) -> str | None:
+    """Download *url* and return its decoded HTML, or None on failure."""
+    try:
+        resp = _get(url)
+    except Exception as exc:
+        logger.warning("Fetch failed for %s: %s", url, exc)
+        return None
+
+    if not resp.ok:
+        logger.warning("Fetch failed for %s: HTTP %d", url, resp.status_code)
+        return None
+    # Same charset sniffing trafilatura.fetch_url applies to the raw bytes.
+    return decode_file(resp.content)
+
+
+def _cache_path(url: str) -> Path:
+    key = blake2b(url.encode("utf-8"), digest_size=16).hexdigest()
+    return settings.http_cache_dir / f"{key}.html.gz"
+
+
+def _read_cache(url: str, ttl: int) -> str | None:
+    """Return the cached page for *url* if it is younger than *ttl* seconds."""
+    path = _cache_path(url)
+    try:
+        if time.time() - path.stat().st_mtime < ttl:
+            return gzip.decompress(path.read_bytes()).decode("utf-8")
+    except FileNotFoundError:
+        pass
+    except (OSError, EOFError, UnicodeDecodeError) as exc:
+        logger.warning("Ignoring unreadable cache entry for %s: %s", url, exc)
+    return None
+
+
+def _write_cache(url: str, html: str) -> None:
+    path = _cache_path(url)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        # Level 1: nearly free to compress, still shrinks HTML several-fold.
+        tmp.write_bytes(gzip.compress(html.encode("utf-8"), compresslevel=1))
+        os.replace(tmp, path)
+    except OSError as exc:
+        logger.warning("Could not cache %s: %s", url, exc)
+
+
+def cached_fetch(url: str) -> str | None:
+    """Like `fetch`, but serve pages younger than ``settings.http_cache_ttl`` from disk."""
+    ttl = settings.http_cache_ttl
+    if ttl <= 0:
+        return fetch(url)
+
+    html = _read_cache(url, ttl)
+    if html is not None:
+        return html
+
+    html = fetch(url)
+    if html is not None:
+        _write_cache(url, html)
+    return html
+
+
+async def _get_async(client: httpx.AsyncClient, url: str) -> httpx.Response:
+    async for attempt in AsyncRetrying(
+        retry=retry_if_exception_type((httpx.TransportError, _TransientHTTPError)),
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=0.5, max=4),
+        reraise=True,
+    ):
+        with attempt:
+            resp = await client.get(url)
+            if resp.status_code == 429 or resp.status_code >= 500:
+                raise _TransientHTTPError(f"HTTP {resp.status_code}")
+    return resp
+
+
+async def fetch_many(urls: list[str], concurrency: int = 20) -> dict[str, str | None]:
+    """Download *urls* concurrently; like `fetch` for each, keyed by URL.
+
+    At most *concurrency* requests are in flight overall, and at most
+    ``settings.http_per_host`` to any one host.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    per_host = max(1, settings.http_per_host)
+    host_semaphores: dict[str, asyncio.Semaphore] = {}
+
+    async def one(client: httpx.AsyncClient, url: str) -> str | None:
+        host = urlsplit(url).netloc.lower()
+        host_semaphore = host_semaphores.setdefault(host, asyncio.Semaphore(per_host))
+        async with host_semaphore, semaphore:
+            try:
+                resp = await _get_async(client, url)
+            except Exception as exc:
+                logger.warning("Fetch failed for %s: %s", url, exc)
+                return None
+        if resp.is_error:
+            logger.warning("Fetch failed for %s: HTTP %d", url, resp.status_code)
+            return None
+        return decode_file(resp.content)
+
+    unique = list(dict.fromkeys(urls))
+    async with httpx.AsyncClient(
+        headers=_HEADERS,
+        timeout=_TIMEOUT,
+        follow_redirects=True,
+        limits=httpx.Limits(max_connections=concurrency),
+    ) as client:
+        pages = await asyncio.gather(*(one(client, url) for url in unique))
+    return dict(zip(unique, pages))
+
+
+async def cached_fetch_many(urls: list[str], concurrency: int = 20) -> dict[str, str | None]:
+    """Like `fetch_many`, but through the same on-disk cache as `cached_fetch`."""
+    ttl = settings.http_cache_ttl
+    if ttl <= 0:
+        return await fetch_many(urls, concurrency)
+
+    pages = {url: _read_cache(url, ttl) for url in dict.fromkeys(urls)}
+    misses = [url for url, html in pages.items() if html is None]
+    if misses:
+        fetched = await fetch_many(misses, concurrency)
+        for url, html in fetched.items():
+            if html is not None:
+                _write_cache(url, html)
+        pages.update(fetched)
+    return pages
@@ -7,23 +7,244 @@ to Gemini should inherit from GeminiAgent.
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import os
+import re
+import tempfile
+import threading
+import time
+from collections.abc import Coroutine, Iterable, Iterator
+from typing import Any, ClassVar, TypeVar
+
+import orjson
 from google import genai
+from google.genai import types
 
 from chasm.core.config import settings
 from chasm.core.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Characters that matter when balancing a JSON array embedded in prose
+_ARRAY_TOKEN_RE = re.compile(r'[\[\]"\\]')
+
+
+def _find_json_array(text: str) -> str | None:
+    """Return the first balanced ``[...]`` in *text*, or None.
+
+    Single linear pass over bracket/quote/backslash positions, tracking
+    string state so brackets inside JSON strings don't count.
+    """
+    start = text.find("[")
+    if start < 0:
+        return None
+
+    depth = 0
+    in_string = False
+    escaped_pos = -1
+    for match in _ARRAY_TOKEN_RE.finditer(text, start):
+        pos = match.start()
+        if pos == escaped_pos:
+            continue
+        ch = text[pos]
+        if in_string:
+            if ch == "\\":
+                escaped_pos = pos + 1
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == "[":
+            depth += 1
+        elif ch == "]":
+            depth -= 1
+            if depth == 0:
+                return text[start : pos + 1]
+    return None  # unbalanced, e.g. a truncated response
+
+
+# Structural characters for decoding array elements from a stream
+_STREAM_TOKEN_RE = re.compile(r'[\[\]{}",\\]')
+
+
+class JsonArrayStream:
+    """Incrementally decode the elements of the first JSON array in a text stream.
+
+    ``feed`` each chunk as it arrives; it returns the top-level elements
+    completed so far.  Text before the opening ``[`` (fences, prose) is
+    skipped, and everything after the closing ``]`` is ignored.  Only the
+    element currently being received is buffered.
+    """
+
+    def __init__(self) -> None:
+        self._buf = ""
+        self._pos = 0  # next index in _buf to scan
+        self._elem_start = -1  # start of the current element; -1 before "["
+        self._depth = 0
+        self._in_string = False
+        self._escaped_pos = -1
+        self.done = False
+
+    def feed(self, text: str) -> list[Any]:
+        if self.done or not text:
+            return []
+        self._buf += text
+        if self._elem_start < 0:
+            start = self._buf.find("[", self._pos)
+            if start < 0:
+                self._buf, self._pos = "", 0
+                return []
+            self._elem_start = self._pos = start + 1
+            self._depth = 1
+
+        items: list[Any] = []
+        for match in _STREAM_TOKEN_RE.finditer(self._buf, self._pos):
+            pos = match.start()
+            if pos == self._escaped_pos:
+                continue
+            ch = self._buf[pos]
+            if self._in_string:
+                if ch == "\\":
+                    self._escaped_pos = pos + 1
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = True
+            elif ch in "[{":
+                self._depth += 1
+            elif ch in "]}":
+                self._depth -= 1
+                if self._depth == 0:
+                    self._emit(self._buf[self._elem_start : pos], items)
+                    self.done = True
+                    self._buf = ""
+                    return items
+            elif ch == "," and self._depth == 1:
+                self._emit(self._buf[self._elem_start : pos], items)
+                self._elem_start = pos + 1
+
+        # Drop consumed text, keeping only the element in progress.
+        trim = self._elem_start
+        self._buf = self._buf[trim:]
+        self._pos = len(self._buf)
+        self._elem_start = 0
+        self._escaped_pos -= trim
+        return items
+
+    @staticmethod
+    def _emit(fragment: str, items: list[Any]) -> None:
+        fragment = fragment.strip()
+        if not fragment:
+            return
+        try:
+            items.append(orjson.loads(fragment.encode()))
+        except orjson.JSONDecodeError:
+            logger.warning("Skipping unparseable array element: %.200s", fragment)
+
+
+def iter_json_array(chunks: Iterable[str]) -> Iterator[Any]:
+    """Yield array elements from streamed text chunks as each one completes."""
+    stream = JsonArrayStream()
+    for chunk in chunks:
+        yield from stream.feed(chunk)
+        if stream.done:
+            return
+
+
+# Terminal Batch Mode job states
+_BATCH_DONE_STATES = frozenset({
+    "JOB_STATE_SUCCEEDED",
+    "JOB_STATE_FAILED",
+    "JOB_STATE_CANCELLED",
+    "JOB_STATE_EXPIRED",
+    "JOB_STATE_PARTIALLY_SUCCEEDED",
+})
+
+
+def _batch_response_text(response: dict | None) -> str:
+    """Concatenate the text parts of a batch result's first candidate."""
+    candidates = (response or {}).get("candidates") or [{}]
+    parts = (candidates[0].get("content") or {}).get("parts") or []
+    return "".join(part.get("text", "") for part in parts if not part.get("thought"))
+
+
+_T = TypeVar("_T")
+
+# One long-lived event loop for sync callers of async agent methods.  The
+# genai client's async HTTP pool binds to the loop that first uses it, so a
+# fresh asyncio.run() per call would strand its connections.
+_agent_loop: asyncio.AbstractEventLoop | None = None
+_agent_loop_lock = threading.Lock()
+
+
+def run_sync(coro: Coroutine[Any, Any, _T]) -> _T:
+    """Run *coro* on the shared agent event loop and block for its result.
+
+    Safe to call from any thread, including one already running its own
+    event loop (e.g. a FastAPI worker).
+    """
+    global _agent_loop
+    with _agent_loop_lock:
+        if _agent_loop is None:
+            _agent_loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_agent_loop.run_forever,
+                name="chasm-agent-loop",
+                daemon=True,
+            ).start()
+        loop = _agent_loop
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+
+def parse_json_array(raw: str) -> list | None:
+    """Decode the JSON array in an LLM response that may add fences or prose.
+
+    Returns:
+        The decoded list, or None if no parseable array was found.
+    """
+    # Common case: the model returned bare (or simply fenced) JSON.
+    try:
+        data = orjson.loads(raw.strip("`\n ").encode())
+        if isinstance(data, list):
+            return data
+    except orjson.JSONDecodeError:
+        pass
+
+    candidate = _find_json_array(raw)
+    if candidate is None:
+        return None
+    try:
+        data = orjson.loads(candidate.encode())
+    except orjson.JSONDecodeError:
+        return None
+    return data if isinstance(data, list) else None
+
 
 class GeminiAgent:
     """Base class for agents that use Google Gemini."""
 
+    # Gemini service tier for this agent's requests: "flex" (discounted,
+    # slower) suits background work, "priority" interactive paths; None
+    # uses the API default.  Subclasses override; __init__ can too.
+    service_tier: str | None = None
+
+    # (model, sha256 of system prompt) -> (cache name or None, expiry).
+    # Shared by all agents so each static prompt is uploaded once per TTL.
+    _prompt_caches: ClassVar[dict[tuple[str, str], tuple[str | None, float]]] = {}
+    _prompt_cache_lock: ClassVar[threading.Lock] = threading.Lock()
+    # model -> measured characters per token, learned from one count_tokens call.
+    _chars_per_token: ClassVar[dict[str, float]] = {}
+
     def __init__(
         self,
         model: str | None = None,
         api_key: str | None = None,
+        service_tier: str | None = None,
     ) -> None:
         self.model = model or settings.gemini_model
+        if service_tier is not None:
+            self.service_tier = service_tier
         resolved_key = api_key or settings.google_api_key
         if not resolved_key:
             raise EnvironmentError(
@@ -31,3 +252,207 @@ class GeminiAgent:
             )
         self.client = genai.Client(api_key=resolved_key)
         logger.info("%s ready (model=%s)", self.__class__.__name__, self.model)
+
+    # ------------------------------------------------------------------
+    # Prompt caching
+    # ------------------------------------------------------------------
+
+    def _get_cached_prompt(self, text: str) -> str | None:
+        """Return the name of a server-side cache holding *text* as system prompt.
+
+        Prompts shorter than ``settings.prompt_cache_min_chars`` are not worth
+        the cache-write premium and return None, as does any caching failure
+        (the caller then sends the prompt inline).
+        """
+        if len(text) < settings.prompt_cache_min_chars:
+            return None
+
+        key = (self.model, hashlib.sha256(text.encode("utf-8")).hexdigest())
+        now = time.monotonic()
+        with self._prompt_cache_lock:
+            entry = self._prompt_caches.get(key)
+            if entry is not None and entry[1] > now:
+                return entry[0]
+
+            ttl = settings.prompt_cache_ttl
+            try:
+                cache = self.client.caches.create(
+                    model=self.model,
+                    config=types.CreateCachedContentConfig(
+                        system_instruction=text,
+                        ttl=f"{ttl}s",
+                    ),
+                )
+                name = cache.name
+                logger.info("Cached %d-char system prompt as %s", len(text), name)
+            except Exception as exc:
+                # Remember the failure for one TTL so we don't retry every call.
+                logger.warning("Prompt caching unavailable, sending inline: %s", exc)
+                name = None
+
+            # Expire locally a little before the server does.
+            self._prompt_caches[key] = (name, now + ttl * 0.9)
+            return name
+
+    # ------------------------------------------------------------------
+    # Token budgeting
+    # ------------------------------------------------------------------
+
+    def _truncate_to_tokens(self, text: str, max_tokens: int) -> str:
+        """Trim *text* to roughly *max_tokens* tokens for this agent's model.
+
+        The first call per model measures the chars-per-token ratio with
+        ``count_tokens``; later calls reuse it and make no request.
+        """
+        ratio = self._chars_per_token.get(self.model)
+        if ratio is None:
+            try:
+                total = self.client.models.count_tokens(
+                    model=self.model, contents=text
+                ).total_tokens or 0
+            except Exception as exc:
+                logger.warning("count_tokens failed, assuming 4 chars/token: %s", exc)
+                total = 0
+            ratio = len(text) / total if total else 4.0
+            self._chars_per_token[self.model] = ratio
+            if total and total <= max_tokens:
+                return text
+
+        max_chars = int(max_tokens * ratio)
+        return text if len(text) <= max_chars else text[:max_chars]
+
+    # ------------------------------------------------------------------
+    # Generation
+    # ------------------------------------------------------------------
+
+    def _generation_config(
+        self,
+        system_instruction: str | None,
+    ) -> types.GenerateContentConfig | None:
+        """Build the request config, sending *system_instruction* cached when possible."""
+        config: dict[str, Any] = {}
+        if system_instruction:
+            cached = self._get_cached_prompt(system_instruction)
+            if cached:
+                config["cached_content"] = cached
+            else:
+                config["system_instruction"] = system_instruction
+        if self.service_tier:
+            config["service_tier"] = self.service_tier
+        return types.GenerateContentConfig(**config) if config else None
+
+    def _generate(
+        self,
+        contents: Any,
+        system_instruction: str | None = None,
+    ) -> types.GenerateContentResponse:
+        """Call ``generate_content`` with this agent's model and config."""
+        return self.client.models.generate_content(
+            model=self.model,
+            contents=contents,
+            config=self._generation_config(system_instruction),
+        )
+
+    def _generate_stream(
+        self,
+        contents: Any,
+        system_instruction: str | None = None,
+    ) -> Iterator[str]:
+        """Stream the response text of a ``generate_content`` call chunk by chunk."""
+        for chunk in self.client.models.generate_content_stream(
+            model=self.model,
+            contents=contents,
+            config=self._generation_config(system_instruction),
+        ):
+            if chunk.text:
+                yield chunk.text
+
+    async def _generate_async(
+        self,
+        contents: Any,
+        system_instruction: str | None = None,
+    ) -> types.GenerateContentResponse:
+        """Async twin of `_generate`, via the client's ``aio`` interface."""
+        # Resolving the prompt cache may create one (a blocking request).
+        config = await asyncio.to_thread(self._generation_config, system_instruction)
+        return await self.client.aio.models.generate_content(
+            model=self.model,
+            contents=contents,
+            config=config,
+        )
+
+    # ------------------------------------------------------------------
+    # Batch Mode
+    # ------------------------------------------------------------------
+
+    def _run_batch(self, prompts: dict[str, str], display_name: str) -> dict[str, str]:
+        """Run *prompts* as one Gemini Batch Mode job and wait for it to finish.
+
+        Batch jobs are billed at a discount but may take minutes to hours, so
+        this is for background work only.  Polls every
+        ``settings.batch_poll_interval`` seconds, up to ``settings.batch_max_wait``.
+
+        Args:
+            prompts: Request key → prompt text.
+            display_name: Label for the uploaded file and the job.
+
+        Returns:
+            Request key → response text.  Keys whose request failed are absent.
+
+        Raises:
+            RuntimeError: If the job does not succeed.
+            TimeoutError: If it is still running after ``batch_max_wait``
+                (the job is cancelled first).
+        """
+        lines = [
+            orjson.dumps({
+                "key": key,
+                "request": {"contents": [{"role": "user", "parts": [{"text": prompt}]}]},
+            })
+            for key, prompt in prompts.items()
+        ]
+        fd, tmp_path = tempfile.mkstemp(suffix=".jsonl")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(b"\n".join(lines))
+            uploaded = self.client.files.upload(
+                file=tmp_path,
+                config=types.UploadFileConfig(display_name=display_name, mime_type="jsonl"),
+            )
+        finally:
+            os.unlink(tmp_path)
+
+        job = self.client.batches.create(
+            model=self.model,
+            src=uploaded.name,
+            config=types.CreateBatchJobConfig(display_name=display_name),
+        )
+        logger.info("Submitted batch job %s (%d request(s))", job.name, len(prompts))
+
+        deadline = time.monotonic() + settings.batch_max_wait
+        while job.state.name not in _BATCH_DONE_STATES:
+            if time.monotonic() > deadline:
+                # Callers fall back to direct requests; don't pay for both.
+                try:
+                    self.client.batches.cancel(name=job.name)
+                except Exception as exc:
+                    logger.warning("Could not cancel batch job %s: %s", job.name, exc)
+                raise TimeoutError(f"Batch job {job.name} still {job.state.name}; cancelled")
+            time.sleep(settings.batch_poll_interval)
+            job = self.client.batches.get(name=job.name)
+
+        if job.state.name not in ("JOB_STATE_SUCCEEDED", "JOB_STATE_PARTIALLY_SUCCEEDED"):
+            raise RuntimeError(f"Batch job {job.name} ended {job.state.name}: {job.error}")
+
+        results: dict[str, str] = {}
+        for line in self.client.files.download(file=job.dest.file_name).splitlines():
+            if not line.strip():
+                continue
+            record = orjson.loads(line)
+            if record.get("error"):
+                logger.warning("Batch request %s failed: %s", record.get("key"), record["error"])
+                continue
+            results[str(record.get("key"))] = _batch_response_text(record.get("response"))
+
+        logger.info("Batch job %s done: %d/%d result(s)", job.name, len(results), len(prompts))
+        return results
@@ -6,41 +6,333 @@ relationships as a directed graph.
 
 from __future__ import annotations
 
-import json
+import gzip
+import math
+import os
+import pickle
+import tempfile
+import threading
+from bisect import bisect_left, insort
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from contextlib import contextmanager, suppress
+from datetime import datetime, timezone
+from functools import wraps
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO, NamedTuple, TypeVar
 
 import networkx as nx
-from networkx.readwrite import json_graph
+import numpy as np
+import orjson
 
+from chasm.core.config import settings
 from chasm.core.logger import get_logger
 from chasm.models.schema import Component, Insight, Product, Source
+from chasm.vector.quantize import quantize_embedding
 
 logger = get_logger(__name__)
 
 
+def _date_key(date_added: Any) -> float:
+    """Sort key for an Insight's ``date_added``.
+
+    Missing, unparseable or naive timestamps map to +inf so they always
+    count as recent, matching the old per-node check.
+    """
+    if not date_added:
+        return math.inf
+    try:
+        parsed = datetime.fromisoformat(str(date_added))
+    except ValueError:
+        return math.inf
+    return parsed.timestamp() if parsed.tzinfo is not None else math.inf
+
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+_JSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _stream_node_link(graph: nx.DiGraph, fh: BinaryIO) -> None:
+    """Write *graph* to *fh* as node-link JSON, one node or edge per line.
+
+    Produces the same document as ``json_graph.node_link_data`` (readable by
+    ``node_link_graph``) without building it in memory first, except that
+    embeddings are int8-quantized when ``settings.embedding_quantized`` is set.
+    """
+    fh.write(b'{"directed": %s, "multigraph": false, "graph": ' % (b"true" if graph.is_directed() else b"false"))
+    fh.write(orjson.dumps(graph.graph, default=str, option=_JSON_OPTIONS))
+
+    quantize = settings.embedding_quantized
+    fh.write(b', "nodes": [')
+    for i, (nid, attrs) in enumerate(graph.nodes(data=True)):
+        fh.write(b",\n" if i else b"\n")
+        if quantize and attrs.get("embedding") is not None:
+            attrs = {**attrs, "embedding": quantize_embedding(attrs["embedding"])}
+        fh.write(orjson.dumps({**attrs, "id": nid}, default=str, option=_JSON_OPTIONS))
+
+    fh.write(b'\n], "edges": [')
+    for i, (src, dst, attrs) in enumerate(graph.edges(data=True)):
+        fh.write(b",\n" if i else b"\n")
+        fh.write(orjson.dumps({**attrs, "source": src, "target": dst}, default=str, option=_JSON_OPTIONS))
+    fh.write(b"\n]}\n")
+
+
+@contextmanager
+def _replacing(path: Path) -> Iterator[BinaryIO]:
+    """Write to a temp file of its own beside *path*; swap it in if the block succeeds.
+
+    The temp name is unique per call, so saves that overlap (the API's
+    debounced saver, the pipeline, interview completion) never share one.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            yield fh
+        os.chmod(tmp, 0o644)  # mkstemp creates it 0600
+        os.replace(tmp, path)
+    except BaseException:
+        with suppress(FileNotFoundError):
+            os.unlink(tmp)
+        raise
+
+
+def _split_embeddings(
+    nodes: list[tuple[str, dict[str, Any]]],
+) -> tuple[list[tuple[str, dict[str, Any]]], list[str], np.ndarray | None]:
+    """Pull node embeddings out into one contiguous float32 matrix.
+
+    Returns the nodes without their ``embedding`` attribute, the ids of the
+    nodes that had one (in row order) and the ``(N, dim)`` matrix.  Ragged
+    embeddings (mixed models) are left inline and the matrix is None.
+    """
+    embedded = [(nid, attrs["embedding"]) for nid, attrs in nodes if attrs.get("embedding") is not None]
+    if not embedded:
+        return nodes, [], None
+    try:
+        matrix = np.asarray([vec for _, vec in embedded], dtype=np.float32)
+    except ValueError:
+        return nodes, [], None
+    stripped = [
+        (nid, {k: v for k, v in attrs.items() if k != "embedding"}) if "embedding" in attrs else (nid, attrs)
+        for nid, attrs in nodes
+    ]
+    return stripped, [nid for nid, _ in embedded], matrix
+
+
+def _locked(method: _F) -> _F:
+    """Run a ChasmGraph mutator while holding the graph's write lock."""
+
+    @wraps(method)
+    def wrapper(self: ChasmGraph, *args: Any, **kwargs: Any) -> Any:
+        with self._lock:
+            return method(self, *args, **kwargs)
+
+    return wrapper  # type: ignore[return-value]
+
+
+class GraphSnapshot(NamedTuple):
+    """Frozen copy of a ChasmGraph taken at one ``version``.
+
+    Safe to read from any thread while writers keep mutating the live graph.
+    """
+
+    version: int
+    graph: nx.DiGraph
+    nodes_by_type: Mapping[str, tuple[str, ...]]
+
+    def nodes_of_type(self, node_type: str) -> list[tuple[str, dict[str, Any]]]:
+        """Return ``(node_id, attrs)`` for every node of *node_type*, in insertion order."""
+        nodes = self.graph.nodes
+        return [(nid, nodes[nid]) for nid in self.nodes_by_type.get(node_type, ())]
+
+
 class ChasmGraph:
     """Directed graph that models hardware feedback relationships.
 
     Node types: Product, Component, Source, Insight
     Edge relations: HAS_COMPONENT, YIELDS, ABOUT
+
+    Alongside the NetworkX graph it keeps lookup indexes (nodes by type,
+    Insights by date, each Insight's ABOUT/YIELDS neighbours) that are
+    updated by the ``add_*`` methods and rebuilt when ``graph`` is replaced.
+    Index entries are checked against the graph when read, so nodes removed
+    directly through ``graph`` are simply skipped.
+
+    ``version`` increases on every mutation made through this class, so
+    callers can cache derived data (e.g. the API's serialised graph).
+    Code that edits ``graph`` directly should do so under ``lock`` and call
+    `touch` afterwards.
+
+    Writers serialise on ``lock``.  Readers that may run alongside them (API
+    routes) should use `snapshot`, a frozen copy rebuilt at most once per
+    version, so they never see the graph half-way through a mutation.
     """
 
     def __init__(self) -> None:
+        self._version = 0
+        self._products_version = 0
+        self._lock = threading.RLock()
+        self._snapshot: GraphSnapshot | None = None
         self.graph = nx.DiGraph()
         logger.info("ChasmGraph initialised (empty).")
 
+    @property
+    def graph(self) -> nx.DiGraph:
+        return self._graph
+
+    @graph.setter
+    def graph(self, value: nx.DiGraph) -> None:
+        with self._lock:
+            self._graph = value
+            self.reindex()
+
+    @property
+    def lock(self) -> threading.RLock:
+        """Write lock; hold it while editing ``graph`` directly."""
+        return self._lock
+
+    @property
+    def version(self) -> int:
+        """Counter bumped whenever the graph changes."""
+        return self._version
+
+    @property
+    def products_version(self) -> int:
+        """Like `version`, but bumped only when Product nodes may have changed."""
+        return self._products_version
+
+    def touch(self) -> None:
+        """Mark the graph as changed after editing ``graph`` directly."""
+        self._version += 1
+        self._products_version += 1
+
+    def snapshot(self) -> GraphSnapshot:
+        """Return a frozen copy of the graph as of the current version.
+
+        Cheap when nothing has changed since the last call; otherwise copies
+        the graph once under the write lock.
+        """
+        snap = self._snapshot
+        if snap is not None and snap.version == self._version:
+            return snap
+        with self._lock:
+            snap = self._snapshot
+            if snap is None or snap.version != self._version:
+                frozen = nx.freeze(self._graph.copy())
+                by_type = {
+                    node_type: tuple(nid for nid, _ in self.nodes_of_type(node_type))
+                    for node_type in self._nodes_by_type
+                }
+                snap = GraphSnapshot(self._version, frozen, by_type)
+                self._snapshot = snap
+            return snap
+
+    # ------------------------------------------------------------------
+    # Indexes
+    # ------------------------------------------------------------------
+
+    @_locked
+    def reindex(self) -> None:
+        """Rebuild all lookup indexes from the current graph contents."""
+        self.touch()
+        # dict-as-ordered-set: keeps graph insertion order for listings.
+        self._nodes_by_type: dict[str, dict[str, None]] = defaultdict(dict)
+        self._insight_dates: dict[str, float] = {}
+        self._insight_links: dict[str, dict[str, str]] = {}
+
+        for nid, data in self._graph.nodes(data=True):
+            node_type = data.get("node_type")
+            if node_type:
+                self._nodes_by_type[node_type][nid] = None
+            if node_type == "Insight":
+                self._insight_dates[nid] = _date_key(data.get("date_added"))
+        self._insights_by_date: list[tuple[float, str]] = sorted(
+            (ts, nid) for nid, ts in self._insight_dates.items()
+        )
+
+        for src, dst, relation in self._graph.edges(data="relation"):
+            if relation == "ABOUT":
+                self._insight_links.setdefault(src, {})["ABOUT"] = dst
+            elif relation == "YIELDS":
+                self._insight_links.setdefault(dst, {})["YIELDS"] = src
+
+    def _index_node(self, nid: str, attrs: dict[str, Any]) -> None:
+        self._version += 1
+        node_type = attrs["node_type"]
+        self._nodes_by_type[node_type][nid] = None
+        if node_type != "Insight":
+            return
+
+        previous = self._insight_dates.pop(nid, None)
+        if previous is not None:
+            idx = bisect_left(self._insights_by_date, (previous, nid))
+            if idx < len(self._insights_by_date) and self._insights_by_date[idx] == (previous, nid):
+                del self._insights_by_date[idx]
+        ts = _date_key(attrs.get("date_added"))
+        insort(self._insights_by_date, (ts, nid))
+        self._insight_dates[nid] = ts
+
+    def nodes_of_type(self, node_type: str) -> list[tuple[str, dict[str, Any]]]:
+        """Return ``(node_id, attrs)`` for every node of *node_type*, in insertion order."""
+        nodes = self._graph.nodes
+        return [
+            (nid, nodes[nid])
+            for nid in self._nodes_by_type.get(node_type, ())
+            if nid in nodes and nodes[nid].get("node_type") == node_type
+        ]
+
+    def insights_since(self, cutoff: datetime) -> list[str]:
+        """Return Insight ids dated at or after *cutoff* (undated ones included).
+
+        Oldest first; a bisect into the date index, so cost scales with the
+        number of matching insights rather than the graph size.
+        """
+        start = bisect_left(self._insights_by_date, (cutoff.timestamp(), ""))
+        nodes = self._graph.nodes
+        return [
+            nid
+            for _, nid in self._insights_by_date[start:]
+            if nid in nodes and nodes[nid].get("node_type") == "Insight"
+        ]
+
+    def get_node_relations(self, nid: str) -> dict[str, str]:
+        """Return an Insight's ``{"ABOUT": target_id, "YIELDS": source_id}`` links.
+
+        Served from the link index; falls back to scanning the node's edges
+        for Insights wired up outside ``add_insight``.
+        """
+        links = self._insight_links.get(nid)
+        if links is not None:
+            return {rel: other for rel, other in links.items() if other in self._graph}
+
+        links = {}
+        if nid in self._graph:
+            for _, dst, relation in self._graph.out_edges(nid, data="relation"):
+                if relation == "ABOUT":
+                    links["ABOUT"] = dst
+            for src, _, relation in self._graph.in_edges(nid, data="relation"):
+                if relation == "YIELDS":
+                    links["YIELDS"] = src
+        return links
+
     # ------------------------------------------------------------------
     # Node methods
     # ------------------------------------------------------------------
 
+    @_locked
     def add_product(self, product: Product) -> None:
         """Add a Product node to the graph."""
-        attrs: dict[str, Any] = product.model_dump(mode="json")
+        # Every Product field is already JSON-native; skip the JSON coercion pass.
+        attrs: dict[str, Any] = product.model_dump()
         attrs["node_type"] = "Product"
         self.graph.add_node(product.id, **attrs)
-        logger.info("Added Product node: %s (%s)", product.id, product.name)
+        self._index_node(product.id, attrs)
+        self._products_version += 1
+        logger.debug("Added Product node: %s (%s)", product.id, product.name)
 
+    @_locked
     def add_component(self, component: Component, product_id: str) -> None:
         """Add a Component node and link it to its parent Product.
 
@@ -49,47 +341,108 @@ class ChasmGraph:
         attrs: dict[str, Any] = component.model_dump(mode="json")
         attrs["node_type"] = "Component"
         self.graph.add_node(component.id, **attrs)
+        self._index_node(component.id, attrs)
         self.graph.add_edge(product_id, component.id, relation="HAS_COMPONENT")
-        logger.info(
+        logger.debug(
             "Added Component node: %s (%s) → linked to Product %s",
             component.id,
             component.name,
             product_id,
         )
 
+    @_locked
     def add_source(self, source: Source) -> None:
         """Add a Source node to the graph."""
         attrs: dict[str, Any] = source.model_dump(mode="json")
         attrs["node_type"] = "Source"
         self.graph.add_node(source.id, **attrs)
-        logger.info("Added Source node: %s (%s)", source.id, attrs["type"])
+        self._index_node(source.id, attrs)
+        logger.debug("Added Source node: %s (%s)", source.id, attrs["type"])
 
     # ------------------------------------------------------------------
     # Edge / connection method
     # ------------------------------------------------------------------
 
+    @_locked
     def add_insight(self, insight: Insight, source_id: str, target_id: str) -> None:
         """Add an Insight node and wire it between a Source and a target.
 
         Creates:
             Source —[YIELDS]→ Insight —[ABOUT]→ Target (Product or Component)
         """
-        attrs: dict[str, Any] = insight.model_dump(mode="json")
+        # JSON-native fields only, so the plain dump matches mode="json" without
+        # re-checking each of the embedding's floats.
+        attrs: dict[str, Any] = insight.model_dump()
         attrs["node_type"] = "Insight"
+        # Stamped so WeeklyBriefing can select recent insights from the index
+        attrs["date_added"] = datetime.now(timezone.utc).isoformat()
+        # Denormalise what readers want from the neighbours, so they needn't
+        # follow the edges (only when those nodes already exist).
+        nodes = self.graph.nodes
+        if target_id in nodes:
+            attrs["component_name"] = nodes[target_id].get("name", "General")
+        if source_id in nodes:
+            attrs["source_url"] = nodes[source_id].get("url") or ""
         self.graph.add_node(insight.id, **attrs)
+        self._index_node(insight.id, attrs)
 
         # Source → Insight
         self.graph.add_edge(source_id, insight.id, relation="YIELDS")
         # Insight → Target (Product or Component)
         self.graph.add_edge(insight.id, target_id, relation="ABOUT")
+        self._insight_links[insight.id] = {"YIELDS": source_id, "ABOUT": target_id}
 
-        logger.info(
+        logger.debug(
             "Added Insight node: %s | Source(%s) → Insight → Target(%s)",
             insight.id,
             source_id,
             target_id,
         )
 
+    @_locked
+    def add_insights_bulk(self, items: Iterable[tuple[Component, str, Source, Insight]]) -> list[str]:
+        """Add many ``(component, product_id, source, insight)`` findings at once.
+
+        Equivalent to calling `add_component`, `add_source` and `add_insight`
+        for each item in turn, but the nodes and edges go in through one
+        ``add_nodes_from`` / ``add_edges_from`` pair and a single log line.
+
+        Returns:
+            The ids of the Insight nodes added, in order, so callers can
+            follow up on just those (e.g. embed them) without a graph scan.
+        """
+        date_added = datetime.now(timezone.utc).isoformat()
+        nodes: list[tuple[str, dict[str, Any]]] = []
+        edges: list[tuple[str, str, dict[str, str]]] = []
+        links: dict[str, dict[str, str]] = {}
+        for component, product_id, source, insight in items:
+            component_attrs: dict[str, Any] = component.model_dump(mode="json")
+            component_attrs["node_type"] = "Component"
+            source_attrs: dict[str, Any] = source.model_dump(mode="json")
+            source_attrs["node_type"] = "Source"
+            insight_attrs: dict[str, Any] = insight.model_dump()
+            insight_attrs["node_type"] = "Insight"
+            insight_attrs["date_added"] = date_added
+            insight_attrs["component_name"] = component.name
+            insight_attrs["source_url"] = source.url or ""
+
+            nodes += [(component.id, component_attrs), (source.id, source_attrs), (insight.id, insight_attrs)]
+            edges += [
+                (product_id, component.id, {"relation": "HAS_COMPONENT"}),
+                (source.id, insight.id, {"relation": "YIELDS"}),
+                (insight.id, component.id, {"relation": "ABOUT"}),
+            ]
+            links[insight.id] = {"YIELDS": source.id, "ABOUT": component.id}
+
+        self.graph.add_nodes_from(nodes)
+        self.graph.add_edges_from(edges)
+        for nid, attrs in nodes:
+            self._index_node(nid, attrs)
+        self._insight_links.update(links)
+
+        logger.info("Added %d Insight node(s) with their Components and Sources", len(links))
+        return list(links)
+
     # ------------------------------------------------------------------
     # Utility methods
     # ------------------------------------------------------------------
@@ -108,13 +461,66 @@ class ChasmGraph:
         return components
 
     def export_graph(self, filepath: str) -> None:
-        """Persist the graph to a JSON file using NetworkX's node-link format."""
-        data = json_graph.node_link_data(self.graph)
-        path = Path(filepath)
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("w", encoding="utf-8") as fh:
-            json.dump(data, fh, indent=2, default=str)
-        logger.info("Graph exported to %s (%d nodes, %d edges)", filepath, self.node_count, self.edge_count)
+        """Persist the graph to a JSON file using NetworkX's node-link format.
+
+        Nodes and edges are encoded one at a time (see `_stream_node_link`),
+        so memory stays flat however many embeddings the graph carries.  The
+        file is written next to *filepath* and swapped in when complete.
+        """
+        snapshot = self.snapshot()
+        with _replacing(Path(filepath)) as fh:
+            _stream_node_link(snapshot.graph, fh)
+        logger.info(
+            "Graph exported to %s (%d nodes, %d edges)",
+            filepath,
+            snapshot.graph.number_of_nodes(),
+            snapshot.graph.number_of_edges(),
+        )
+
+    def export_pickle(self, filepath: str) -> None:
+        """Persist the graph as a gzipped pickle (see `load_pickle`).
+
+        Much faster to write and read back than node-link JSON, at the cost
+        of not being human-readable.  Embeddings are stored as one float32
+        matrix rather than per-node float lists, so they pickle as a single
+        buffer.  Written atomically like `export_graph`.
+        """
+        snapshot = self.snapshot()
+        nodes, embedding_ids, embeddings = _split_embeddings(list(snapshot.graph.nodes(data=True)))
+        payload = {
+            "format": 2,
+            "graph": dict(snapshot.graph.graph),
+            "nodes": nodes,
+            "edges": list(snapshot.graph.edges(data=True)),
+            "embedding_ids": embedding_ids,
+            "embeddings": embeddings,
+        }
+        with _replacing(Path(filepath)) as raw, gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=1) as fh:
+            pickle.dump(payload, fh, protocol=5)
+        logger.info(
+            "Graph exported to %s (%d nodes, %d edges)",
+            filepath,
+            snapshot.graph.number_of_nodes(),
+            snapshot.graph.number_of_edges(),
+        )
+
+    @staticmethod
+    def load_pickle(filepath: str) -> nx.DiGraph:
+        """Read a graph written by `export_pickle`.
+
+        Only load files this application wrote: unpickling runs code.
+        """
+        with gzip.open(filepath, "rb") as fh:
+            payload = pickle.load(fh)
+        graph = nx.DiGraph(**payload["graph"])
+        graph.add_nodes_from(payload["nodes"])
+        graph.add_edges_from(payload["edges"])
+        # Format 1 files kept embeddings inline on the nodes.
+        if payload.get("embeddings") is not None:
+            nodes = graph.nodes
+            for nid, row in zip(payload["embedding_ids"], payload["embeddings"].tolist()):
+                nodes[nid]["embedding"] = row
+        return graph
 
     # ------------------------------------------------------------------
     # Properties
@@ -126,5 +532,8 @@ class ChasmGraph:
 
     @property
     def edge_count(self) -> int:
-        return self.graph.number_of_edges()
+        # number_of_edges() sums degree views in Python; counting the
+        # successor dicts directly is several times faster.  Counted, not
+        # tracked, because VectorEngine and loading mutate ``self.graph``.
+        return sum(map(len, self.graph._succ.values()))
 
@@ -1,40 +1,100 @@
-"""Graph persistence — load/save the ChasmGraph to JSON on disk."""
+"""Graph persistence — load/save the ChasmGraph on disk.
+
+``settings.graph_format`` picks the format written: a gzipped pickle
+(default, fast) or node-link JSON (``export.json``, human-readable).  Loading
+reads whichever of the two files is newer, so switching formats, or
+upgrading from JSON-only installs, keeps the existing graph.
+"""
 
 from __future__ import annotations
 
-import json
+import asyncio
+import threading
 from pathlib import Path
 
+import networkx as nx
+import orjson
 from networkx.readwrite import json_graph
 
 from chasm.core.config import settings
 from chasm.core.logger import get_logger
+from chasm.graph.builder import ChasmGraph
+from chasm.vector.quantize import dequantize_embedding, is_quantized
 
 logger = get_logger(__name__)
 
+# Set by mark_dirty(); cleared by the debounced saver when it writes.
+_dirty = threading.Event()
+# The debounced saver, the pipeline, interview completion and shutdown all
+# save; one at a time, each exporting a snapshot taken under the lock.
+_save_lock = threading.Lock()
+
+
+def _load_json(path: Path) -> nx.DiGraph:
+    data = orjson.loads(path.read_bytes())
+    for node in data.get("nodes", ()):
+        if is_quantized(node.get("embedding")):
+            node["embedding"] = dequantize_embedding(node["embedding"]).tolist()
+    # Exports write "edges"; files from networkx < 3.6 say "links", which is
+    # also the key node_link_graph reads there.  Offer both so every pairing
+    # loads the edges.
+    edges = data.get("edges", data.get("links", []))
+    data["edges"] = data["links"] = edges
+    return json_graph.node_link_graph(data)
+
 
 def load_graph_from_disk(graph) -> None:
     """Load a previously exported graph if the file exists."""
-    export_path = settings.export_path
-    if export_path.exists():
+    candidates = [
+        p for p in (settings.graph_pickle_path, settings.export_path) if p.exists()
+    ]
+    if not candidates:
+        return
+    path = max(candidates, key=lambda p: p.stat().st_mtime)
+    try:
+        if path == settings.graph_pickle_path:
+            graph.graph = ChasmGraph.load_pickle(str(path))
+        else:
+            graph.graph = _load_json(path)
+        logger.info(
+            "Loaded graph from %s (%d nodes, %d edges)",
+            path,
+            graph.node_count,
+            graph.edge_count,
+        )
+    except Exception as exc:
+        logger.warning("Failed to load graph from disk: %s", exc)
+
+
+def save_graph_to_disk(graph) -> bool:
+    """Persist the graph in ``settings.graph_format``; return whether it was written."""
+    with _save_lock:
         try:
-            with export_path.open("r", encoding="utf-8") as fh:
-                data = json.load(fh)
-            graph.graph = json_graph.node_link_graph(data)
-            logger.info(
-                "Loaded graph from %s (%d nodes, %d edges)",
-                export_path,
-                graph.node_count,
-                graph.edge_count,
-            )
+            if settings.graph_format == "json":
+                path = settings.export_path
+                graph.export_graph(str(path))
+            else:
+                path = settings.graph_pickle_path
+                graph.export_pickle(str(path))
+            logger.info("Graph saved to %s.", path)
         except Exception as exc:
-            logger.warning("Failed to load graph from disk: %s", exc)
+            logger.error("Failed to save graph: %s", exc)
+            return False
+    return True
 
 
-def save_graph_to_disk(graph) -> None:
-    """Persist the graph to JSON."""
-    try:
-        graph.export_graph(str(settings.export_path))
-        logger.info("Graph saved to %s.", settings.export_path)
-    except Exception as exc:
-        logger.error("Failed to save graph: %s", exc)
+def mark_dirty() -> None:
+    """Request a save; the API's debounced saver writes it within ``settings.graph_save_interval``."""
+    _dirty.set()
+
+
+async def run_debounced_saver(graph) -> None:
+    """Save *graph* at most once per ``settings.graph_save_interval`` while it is dirty.
+
+    Runs until cancelled; the caller does a final `save_graph_to_disk` on shutdown.
+    """
+    while True:
+        await asyncio.sleep(settings.graph_save_interval)
+        if _dirty.is_set():
+            _dirty.clear()
+            await asyncio.to_thread(save_graph_to_disk, graph)
@@ -7,27 +7,52 @@ Each harvester writes clean Markdown with YAML frontmatter to
 from __future__ import annotations
 
 
+import asyncio
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import TYPE_CHECKING
 from urllib.parse import urlparse
 
-import praw
+import prawcore
 import trafilatura
 import yaml
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential,
+)
+
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _YamlDumper
 
 from chasm.core.config import settings
+from chasm.core.http import cached_fetch, cached_fetch_many
 from chasm.core.logger import get_logger
 
+if TYPE_CHECKING:
+    import praw
+
 logger = get_logger(__name__)
 
+_NON_WORD_RE = re.compile(r"[^\w\s-]")
+_SPACE_RE = re.compile(r"[\s_]+")
+
 
 def _slugify(text: str, max_len: int = 80) -> str:
     """Turn arbitrary text into a filesystem-safe slug."""
-    text = text.lower().strip()
-    text = re.sub(r"[^\w\s-]", "", text)
-    text = re.sub(r"[\s_]+", "_", text)
-    return text[:max_len].rstrip("_")
+    text = _NON_WORD_RE.sub("", text.lower().strip())
+    return _SPACE_RE.sub("_", text)[:max_len].rstrip("_")
+
+
+def _frontmatter_block(frontmatter: dict) -> str:
+    """Render *frontmatter* as a ``---``-fenced YAML block."""
+    return f"---\n{yaml.dump(frontmatter, Dumper=_YamlDumper, default_flow_style=False).strip()}\n---\n\n"
 
 
 # ======================================================================
@@ -48,7 +73,28 @@ class WebHarvester:
             Cleaned article text, or an empty string on failure.
         """
         logger.info("WebHarvester: fetching %s", url)
-        html = trafilatura.fetch_url(url)
+        return self._extract(url, cached_fetch(url))
+
+    async def scrape_urls(self, urls: list[str]) -> dict[str, str]:
+        """Fetch many URLs concurrently and extract each article body.
+
+        Args:
+            urls: The pages to scrape.
+
+        Returns:
+            ``{url: text}`` with the same semantics as `scrape_url` per URL
+            (empty string on failure).
+        """
+        logger.info("WebHarvester: fetching %d URL(s) concurrently", len(urls))
+        pages = await cached_fetch_many(urls)
+        # Extraction is CPU-bound; lxml releases the GIL while parsing.
+        texts = await asyncio.gather(*(
+            asyncio.to_thread(self._extract, url, html) for url, html in pages.items()
+        ))
+        return dict(zip(pages, texts))
+
+    @staticmethod
+    def _extract(url: str, html: str | None) -> str:
         if html is None:
             logger.warning("WebHarvester: could not download %s", url)
             return ""
@@ -58,16 +104,20 @@ class WebHarvester:
             logger.warning("WebHarvester: no extractable text at %s", url)
             return ""
 
-        logger.info("WebHarvester: extracted %d chars from %s", len(text), url)
+        logger.debug("WebHarvester: extracted %d chars from %s", len(text), url)
         return text
 
-    def save_to_markdown(self, url: str, text: str, product_id: str) -> Path:
+    def save_to_markdown(
+        self, url: str, text: str, product_id: str, scraped_at: str | None = None
+    ) -> Path:
         """Save scraped text as a Markdown file with YAML frontmatter.
 
         Args:
             url: Original source URL.
             text: Cleaned article body.
             product_id: Groups the file under ``chasm/data/raw/{product_id}/``.
+            scraped_at: ISO timestamp for ``date_scraped``; pass one shared
+                value when saving a batch.  Defaults to now.
 
         Returns:
             Path to the created file.
@@ -84,11 +134,11 @@ class WebHarvester:
         frontmatter = {
             "source_url": url,
             "source_type": "Review",
-            "date_scraped": datetime.now(timezone.utc).isoformat(),
+            "date_scraped": scraped_at or datetime.now(timezone.utc).isoformat(),
             "product_id": product_id,
         }
 
-        content = f"---\n{yaml.dump(frontmatter, default_flow_style=False).strip()}\n---\n\n{text}\n"
+        content = f"{_frontmatter_block(frontmatter)}{text}\n"
 
         filepath.write_text(content, encoding="utf-8")
         logger.info("WebHarvester: saved %s (%d bytes)", filepath, len(content))
@@ -101,7 +151,13 @@ class WebHarvester:
 
 
 class RedditHarvester:
-    """Scrape Reddit posts and comments, saving each as a Markdown file."""
+    """Scrape Reddit posts and comments, saving each as a Markdown file.
+
+    The search runs on the calling thread's client; each post's comments are
+    then fetched on a worker thread (``settings.reddit_concurrency`` at a
+    time).  PRAW clients aren't thread-safe, so every thread gets its own,
+    which also lets several subreddits be scraped at once.
+    """
 
     def __init__(
         self,
@@ -109,13 +165,91 @@ class RedditHarvester:
         client_secret: str | None = None,
         user_agent: str | None = None,
     ) -> None:
-        self.reddit = praw.Reddit(
-            client_id=client_id or settings.reddit_client_id,
-            client_secret=client_secret or settings.reddit_client_secret,
-            user_agent=user_agent or settings.reddit_user_agent,
-        )
+        self._credentials = {
+            "client_id": client_id or settings.reddit_client_id,
+            "client_secret": client_secret or settings.reddit_client_secret,
+            "user_agent": user_agent or settings.reddit_user_agent,
+        }
+        self.reddit = self._new_client()
+        self._local = threading.local()
+        self._local.reddit = self.reddit  # the constructing thread's client
         logger.info("RedditHarvester ready (read-only=%s)", self.reddit.read_only)
 
+    def _new_client(self) -> praw.Reddit:
+        # Imported on first use so the web-only pipeline never loads PRAW.
+        import praw
+
+        return praw.Reddit(**self._credentials)
+
+    def _thread_client(self) -> praw.Reddit:
+        client = getattr(self._local, "reddit", None)
+        if client is None:
+            client = self._local.reddit = self._new_client()
+        return client
+
+    @retry(
+        retry=retry_if_exception_type(
+            (prawcore.ServerError, prawcore.RequestException, prawcore.TooManyRequests)
+        ),
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, max=8),
+        reraise=True,
+    )
+    def _top_comments(self, submission_id: str, count: int = 5) -> list:
+        submission = self._thread_client().submission(id=submission_id)
+        submission.comment_sort = "top"
+        submission.comments.replace_more(limit=0)
+        return submission.comments[:count]
+
+    def _save_submission(
+        self, submission, subreddit_name: str, product_id: str, out_dir: Path, scraped_at: str
+    ) -> Path:
+        """Fetch one post's top comments and write it out as Markdown."""
+        # --- Build the body text ---
+        body_parts: list[str] = []
+        body_parts.append(f"# {submission.title}\n")
+
+        if submission.selftext:
+            body_parts.append(submission.selftext)
+
+        # Top 5 comments
+        top_comments = self._top_comments(submission.id)
+
+        if top_comments:
+            body_parts.append("\n## Top Comments\n")
+            for idx, comment in enumerate(top_comments, 1):
+                body_parts.append(
+                    f"**Comment {idx}** (u/{comment.author}, score {comment.score}):\n"
+                    f"> {comment.body}\n"
+                )
+
+        full_text = "\n".join(body_parts)
+
+        # --- Frontmatter ---
+        frontmatter = {
+            "source_url": f"https://reddit.com{submission.permalink}",
+            "source_type": "Reddit",
+            "subreddit": subreddit_name,
+            "author": str(submission.author),
+            "score": submission.score,
+            "date_scraped": scraped_at,
+            "product_id": product_id,
+        }
+
+        content = f"{_frontmatter_block(frontmatter)}{full_text}\n"
+
+        slug = _slugify(f"reddit_{subreddit_name}_{submission.id}")
+        filepath = out_dir / f"{slug}.md"
+        filepath.write_text(content, encoding="utf-8")
+
+        logger.debug(
+            "  + Saved post '%s' → %s (%d bytes)",
+            submission.title[:50],
+            filepath.name,
+            len(content),
+        )
+        return filepath
+
     def scrape_subreddit(
         self,
         subreddit_name: str,
@@ -132,7 +266,7 @@ class RedditHarvester:
             limit: Maximum number of posts to fetch.
 
         Returns:
-            List of Paths to the created Markdown files.
+            List of Paths to the created Markdown files, in search order.
         """
         logger.info(
             "RedditHarvester: searching r/%s for '%s' (limit=%d)",
@@ -141,59 +275,21 @@ class RedditHarvester:
             limit,
         )
 
-        subreddit = self.reddit.subreddit(subreddit_name)
+        # Per-thread client: the pipeline scrapes several subreddits at once.
+        subreddit = self._thread_client().subreddit(subreddit_name)
         out_dir = settings.raw_data_dir / product_id
         out_dir.mkdir(parents=True, exist_ok=True)
 
+        submissions = list(subreddit.search(search_term, limit=limit))
         saved_files: list[Path] = []
-
-        for submission in subreddit.search(search_term, limit=limit):
-            # --- Build the body text ---
-            body_parts: list[str] = []
-            body_parts.append(f"# {submission.title}\n")
-
-            if submission.selftext:
-                body_parts.append(submission.selftext)
-
-            # Top 5 comments
-            submission.comment_sort = "top"
-            submission.comments.replace_more(limit=0)
-            top_comments = submission.comments[:5]
-
-            if top_comments:
-                body_parts.append("\n## Top Comments\n")
-                for idx, comment in enumerate(top_comments, 1):
-                    body_parts.append(
-                        f"**Comment {idx}** (u/{comment.author}, score {comment.score}):\n"
-                        f"> {comment.body}\n"
-                    )
-
-            full_text = "\n".join(body_parts)
-
-            # --- Frontmatter ---
-            frontmatter = {
-                "source_url": f"https://reddit.com{submission.permalink}",
-                "source_type": "Reddit",
-                "subreddit": subreddit_name,
-                "author": str(submission.author),
-                "score": submission.score,
-                "date_scraped": datetime.now(timezone.utc).isoformat(),
-                "product_id": product_id,
-            }
-
-            content = f"---\n{yaml.dump(frontmatter, default_flow_style=False).strip()}\n---\n\n{full_text}\n"
-
-            slug = _slugify(f"reddit_{subreddit_name}_{submission.id}")
-            filepath = out_dir / f"{slug}.md"
-            filepath.write_text(content, encoding="utf-8")
-            saved_files.append(filepath)
-
-            logger.info(
-                "  + Saved post '%s' → %s (%d bytes)",
-                submission.title[:50],
-                filepath.name,
-                len(content),
-            )
+        if submissions:
+            scraped_at = datetime.now(timezone.utc).isoformat()  # one timestamp per batch
+            workers = max(1, min(settings.reddit_concurrency, len(submissions)))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="reddit") as pool:
+                saved_files = list(pool.map(
+                    lambda sub: self._save_submission(sub, subreddit_name, product_id, out_dir, scraped_at),
+                    submissions,
+                ))
 
         logger.info(
             "RedditHarvester: saved %d post(s) from r/%s",
@@ -1,19 +1,27 @@
 """Interview session model and file-based persistence.
 
-Each interview session is stored as a JSON file under
-``chasm/data/interviews/{session_id}.json``.  When a session is completed,
+Each interview session is stored as an append-only JSON Lines file under
+``chasm/data/interviews/{session_id}.jsonl``: ``"session"`` records carry
+the session state (the last one wins) and ``"message"`` records are the
+transcript, so a turn only appends its new lines.  Older ``.json`` files
+are still read.  When a session is completed,
 insights are extracted from the transcript via InsightExtractor and
 injected into the Knowledge Graph with SourceType.EMPLOYEE_INTERVIEW.
 """
 
 from __future__ import annotations
 
-import json
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
+from secrets import token_hex
 from typing import Optional
-from uuid import uuid4
 
+import orjson
 from pydantic import BaseModel, Field
 
 from chasm.core.config import settings
@@ -24,23 +32,34 @@ logger = get_logger(__name__)
 # Directory where interview session files live
 INTERVIEWS_DIR = settings.project_root / "chasm" / "data" / "interviews"
 
+# Threads used to read session files in `list_sessions`
+_LIST_WORKERS = 16
+
 
 # ---------------------------------------------------------------------------
 # Models
 # ---------------------------------------------------------------------------
 
-class ChatMessage(BaseModel):
-    """A single message in the interview conversation."""
-    role: str = Field(..., description="'assistant' or 'user'")
-    content: str = Field(..., description="The message text")
-    timestamp: str = Field(
-        default_factory=lambda: datetime.now(timezone.utc).isoformat(),
-    )
+def _utc_now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+@dataclass(slots=True)
+class ChatMessage:
+    """A single message in the interview conversation.
+
+    A slotted dataclass rather than a BaseModel: sessions hold one per turn,
+    and these are built and dumped on every request.  Pydantic still
+    validates them as ``InterviewSession.messages`` items.
+    """
+    role: str  # 'assistant' or 'user'
+    content: str  # the message text
+    timestamp: str = field(default_factory=_utc_now)
 
 
 class InterviewSession(BaseModel):
     """Represents a single employee interview session."""
-    id: str = Field(default_factory=lambda: uuid4().hex[:12])
+    id: str = Field(default_factory=lambda: token_hex(6))
     status: str = Field(default="pending", description="pending | active | completed")
     messages: list[ChatMessage] = Field(default_factory=list)
     created_at: str = Field(
@@ -54,9 +73,45 @@ class InterviewSession(BaseModel):
 # ---------------------------------------------------------------------------
 
 def _session_path(session_id: str) -> Path:
+    return INTERVIEWS_DIR / f"{session_id}.jsonl"
+
+
+def _legacy_session_path(session_id: str) -> Path:
     return INTERVIEWS_DIR / f"{session_id}.json"
 
 
+def _state_line(session: InterviewSession) -> bytes:
+    return orjson.dumps({"type": "session", **session.model_dump(exclude={"messages"})}) + b"\n"
+
+
+def _message_line(message: ChatMessage) -> bytes:
+    return orjson.dumps({"type": "message", **asdict(message)}) + b"\n"
+
+
+def _read_session_file(path: Path) -> InterviewSession:
+    if path.suffix == ".json":
+        return InterviewSession(**orjson.loads(path.read_bytes()))
+
+    state: dict = {}
+    messages: list[ChatMessage] = []
+    with path.open("rb") as fh:
+        for line in fh:
+            if not line.strip():
+                continue
+            try:
+                record = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                # A torn append (crash mid-write); every complete line still loads.
+                logger.warning("Skipping undecodable line in session file %s", path)
+                continue
+            kind = record.pop("type", None)
+            if kind == "session":
+                state = record
+            elif kind == "message":
+                messages.append(ChatMessage(**record))
+    return InterviewSession(**state, messages=messages)
+
+
 def create_session() -> InterviewSession:
     """Create a new empty interview session and persist it."""
     INTERVIEWS_DIR.mkdir(parents=True, exist_ok=True)
@@ -68,35 +123,81 @@ def create_session() -> InterviewSession:
 
 def load_session(session_id: str) -> InterviewSession | None:
     """Load a session from disk, or return None if not found."""
-    path = _session_path(session_id)
-    if not path.exists():
-        return None
-    data = json.loads(path.read_text(encoding="utf-8"))
-    return InterviewSession(**data)
+    for path in (_session_path(session_id), _legacy_session_path(session_id)):
+        if path.exists():
+            return _read_session_file(path)
+    return None
 
 
 def save_session(session: InterviewSession) -> None:
-    """Persist session state to disk."""
+    """Rewrite the session's file from scratch with its full current state.
+
+    Use `append_to_session` for per-turn updates.
+    """
     INTERVIEWS_DIR.mkdir(parents=True, exist_ok=True)
     path = _session_path(session.id)
-    path.write_text(
-        session.model_dump_json(indent=2),
-        encoding="utf-8",
-    )
+    # Publish atomically: a crash mid-write must not truncate the transcript.
+    # A temp file per call, so overlapping saves of one session can't collide.
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(_state_line(session) + b"".join(_message_line(m) for m in session.messages))
+        os.replace(tmp, path)
+    except BaseException:
+        with suppress(FileNotFoundError):
+            os.unlink(tmp)
+        raise
+    _legacy_session_path(session.id).unlink(missing_ok=True)
+
+
+def append_to_session(session: InterviewSession, *messages: ChatMessage) -> None:
+    """Persist the session's current state plus *messages* without rewriting the file.
+
+    The caller has already appended *messages* to ``session.messages``.
+    Everything goes out in a single write.
+    """
+    path = _session_path(session.id)
+    if not path.exists():
+        # First write for this session (or a legacy .json file): start fresh.
+        save_session(session)
+        return
+    with path.open("a+b") as fh:
+        # If a previous append was torn, start on a fresh line so this
+        # write doesn't get glued onto the partial one.
+        torn = False
+        if fh.seek(0, os.SEEK_END) > 0:
+            fh.seek(-1, os.SEEK_END)
+            torn = fh.read(1) != b"\n"
+        fh.write(
+            (b"\n" if torn else b"")
+            + _state_line(session)
+            + b"".join(_message_line(m) for m in messages)
+        )
+
+
+def _try_read_session_file(path: Path) -> Optional[InterviewSession]:
+    try:
+        return _read_session_file(path)
+    except Exception:
+        logger.warning("Skipping invalid session file: %s", path)
+        return None
 
 
 def list_sessions() -> list[InterviewSession]:
-    """Return all sessions on disk."""
+    """Return all sessions on disk, ordered by id.
+
+    Files are independent, so they're read on a small thread pool to
+    overlap disk latency.
+    """
     if not INTERVIEWS_DIR.exists():
         return []
-    sessions = []
-    for p in sorted(INTERVIEWS_DIR.glob("*.json")):
-        try:
-            data = json.loads(p.read_text(encoding="utf-8"))
-            sessions.append(InterviewSession(**data))
-        except Exception:
-            logger.warning("Skipping invalid session file: %s", p)
-    return sessions
+    paths: dict[str, Path] = {p.stem: p for p in INTERVIEWS_DIR.glob("*.json")}
+    paths.update({p.stem: p for p in INTERVIEWS_DIR.glob("*.jsonl")})
+    if not paths:
+        return []
+    ordered = [paths[stem] for stem in sorted(paths)]
+    with ThreadPoolExecutor(max_workers=min(_LIST_WORKERS, len(ordered))) as pool:
+        return [s for s in pool.map(_try_read_session_file, ordered) if s is not None]
 
 
 # ---------------------------------------------------------------------------
@@ -116,14 +217,16 @@ def complete_session(session: InterviewSession) -> int:
 
     session.status = "completed"
     session.completed_at = datetime.now(timezone.utc).isoformat()
-    save_session(session)
+    append_to_session(session)
 
-    # Build transcript text from user messages
-    transcript = "\n\n".join(
-        f"Q: {session.messages[i - 1].content}\nA: {msg.content}"
-        for i, msg in enumerate(session.messages)
-        if msg.role == "user" and i > 0
-    )
+    # Build transcript text from user messages, each paired with the
+    # message it answers.  A list lets str.join size the result up front.
+    messages = session.messages
+    transcript = "\n\n".join([
+        f"Q: {question.content}\nA: {answer.content}"
+        for question, answer in zip(messages, messages[1:])
+        if answer.role == "user"
+    ])
 
     if not transcript.strip():
         logger.warning("Session %s has no user messages to extract.", session.id)
@@ -134,11 +237,7 @@ def complete_session(session: InterviewSession) -> int:
     graph = get_graph()
 
     # Get all products from the graph
-    product_nodes = [
-        (nid, data)
-        for nid, data in graph.graph.nodes(data=True)
-        if data.get("node_type") == "Product"
-    ]
+    product_nodes = graph.nodes_of_type("Product")
 
     if not product_nodes:
         logger.warning("No products in graph; cannot attach interview insights.")
@@ -147,45 +246,50 @@ def complete_session(session: InterviewSession) -> int:
     product_names = ", ".join(d.get("name", nid) for nid, d in product_nodes)
     results = extractor.extract_from_transcript(transcript, product_names)
 
-    injected = 0
-    for component, insight, product_id_hint in results:
-        # Try to match the product_id_hint to a real product
-        target_product_id = product_nodes[0][0]  # default to first
-        for pid, pdata in product_nodes:
-            if pdata.get("name", "").lower() in product_id_hint.lower():
-                target_product_id = pid
-                break
-
-        graph.add_component(component, product_id=target_product_id)
+    # Lower-case the product names once rather than once per insight.
+    lowered_products = [(pid, pdata.get("name", "").lower()) for pid, pdata in product_nodes]
 
+    findings = []
+    for component, insight, product_id_hint in results:
+        # Try to match the product_id_hint to a real product, defaulting to the first
+        hint = product_id_hint.lower()
+        target_product_id = next(
+            (pid for pid, name in lowered_products if name in hint), product_nodes[0][0]
+        )
         source = Source(
             id=f"src-interview-{insight.id}",
             type=SourceType.EMPLOYEE_INTERVIEW,
             raw_text=insight.summary,
             url=f"interview://{session.id}",
         )
-        graph.add_source(source)
-        graph.add_insight(
-            insight=insight,
-            source_id=source.id,
-            target_id=component.id,
-        )
-        injected += 1
+        findings.append((component, target_product_id, source, insight))
+    new_ids = graph.add_insights_bulk(findings)
+    injected = len(new_ids)
 
     # Generate embeddings for the new interview insights and run semantic linking
     # so they are connected to existing insights immediately (not just on weekly run)
     if injected > 0:
-        from chasm.vector.engine import VectorEngine
-
-        vector_engine = VectorEngine()
-        for nid, data in graph.graph.nodes(data=True):
-            if data.get("node_type") == "Insight" and not data.get("embedding"):
-                summary = data.get("summary", "")
-                if summary:
-                    embedding = vector_engine.generate_embedding(summary)
-                    graph.graph.nodes[nid]["embedding"] = embedding
-
-        vector_engine.link_semantic_matches(graph.graph)
+        from chasm.vector.engine import get_vector_engine
+
+        vector_engine = get_vector_engine()
+        # Only the insights just added can lack an embedding here; older ones
+        # are backfilled by the weekly pipeline, so no graph scan is needed.
+        nodes = graph.graph.nodes
+        pending = [
+            (nid, nodes[nid]["summary"])
+            for nid in new_ids
+            if not nodes[nid].get("embedding") and nodes[nid].get("summary")
+        ]
+        vectors = vector_engine.generate_embeddings([summary for _, summary in pending]) if pending else []
+
+        with graph.lock:
+            for (nid, _), vector in zip(pending, vectors):
+                if nid in graph.graph:
+                    graph.graph.nodes[nid]["embedding"] = vector.tolist()
+            vector_engine.link_semantic_matches(
+                graph.graph, insight_ids=[nid for nid, _ in graph.nodes_of_type("Insight")]
+            )
+            graph.touch()
 
     save_graph_to_disk(graph)
     logger.info(
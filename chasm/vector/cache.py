@@ -0,0 +1,77 @@
+"""On-disk embedding cache keyed by model and text.
+
+Re-running the pipeline (after a crash, or on a rebuilt graph) would
+otherwise re-encode summaries it has already seen.  Vectors are stored
+as raw float32 bytes in a small SQLite table under
+``settings.embedding_cache_path``.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from contextlib import closing
+from hashlib import sha256
+from pathlib import Path
+
+import numpy as np
+
+from chasm.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+_SCHEMA = "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB NOT NULL)"
+# Stay well under SQLite's bound-parameter limit.
+_CHUNK = 500
+
+
+def cache_key(model_name: str, text: str) -> str:
+    """Stable key for *text* embedded by *model_name*."""
+    return sha256(f"{model_name}\0{text}".encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """Batch get/put of float32 vectors; one short-lived connection per call.
+
+    An unusable cache location (unwritable directory, corrupt file) only
+    logs a warning: lookups miss and writes are dropped.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path)
+        conn.execute(_SCHEMA)
+        return conn
+
+    def get_many(self, keys: list[str]) -> dict[str, np.ndarray]:
+        """Return the cached vectors among *keys* (missing keys are omitted)."""
+        found: dict[str, np.ndarray] = {}
+        try:
+            with closing(self._connect()) as conn:
+                for start in range(0, len(keys), _CHUNK):
+                    chunk = keys[start:start + _CHUNK]
+                    rows = conn.execute(
+                        f"SELECT key, vector FROM embeddings WHERE key IN ({','.join('?' * len(chunk))})",
+                        chunk,
+                    )
+                    for key, blob in rows:
+                        found[key] = np.frombuffer(blob, dtype=np.float32)
+        except (sqlite3.Error, OSError) as exc:
+            logger.warning("Embedding cache unreadable (%s); encoding everything.", exc)
+            return {}
+        return found
+
+    def put_many(self, items: list[tuple[str, np.ndarray]]) -> None:
+        """Store ``(key, vector)`` pairs, replacing existing entries."""
+        if not items:
+            return
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                    [(key, np.asarray(vec, dtype=np.float32).tobytes()) for key, vec in items],
+                )
+        except (sqlite3.Error, OSError) as exc:
+            logger.warning("Could not write embedding cache: %s", exc)
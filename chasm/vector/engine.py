@@ -1,28 +1,51 @@
 """VectorEngine — embedding generation and semantic linking for ChasmGraph.
 
 Uses sentence-transformers to encode text into dense vectors and
-scikit-learn to compute cosine similarity for discovering hidden
-relationships between Insight nodes.
+blockwise cosine similarity for discovering hidden relationships
+between Insight nodes.
 """
 
 from __future__ import annotations
 
+import logging
+import threading
+from collections.abc import Iterable
+
 import numpy as np
-from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import cosine_similarity
 
 from chasm.core.config import settings
 from chasm.core.logger import get_logger
+from chasm.vector.cache import EmbeddingCache, cache_key
 
 logger = get_logger(__name__)
 
+# Similarity scores held in memory at once while linking (4 bytes each), so
+# memory stays flat instead of growing with the full N×N matrix.
+_LINK_BLOCK_ELEMENTS = 1 << 22
+
+# Worker processes only pay off once the job dwarfs their start-up
+# (each loads its own model copy).
+_MULTIPROCESS_MIN_TEXTS = 2_000
+
 
 class VectorEngine:
     """Generate embeddings and discover semantic matches across Insight nodes."""
 
     def __init__(self, model_name: str = "all-MiniLM-L6-v2") -> None:
+        # Deferred: sentence-transformers pulls in torch, which takes seconds
+        # to import and isn't needed by callers that never build an engine.
+        from sentence_transformers import SentenceTransformer
+
         logger.info("Loading embedding model: %s …", model_name)
+        self.model_name = model_name
         self.model = SentenceTransformer(model_name)
+        if settings.embedding_dtype == "float16":
+            if self.model.device.type == "cuda":
+                self.model.half()
+                logger.info("Embedding model running in float16 on %s.", self.model.device)
+            else:
+                logger.info("embedding_dtype=float16 needs CUDA; staying in float32 on CPU.")
+        self.cache = EmbeddingCache(settings.embedding_cache_path) if settings.embedding_cache else None
         logger.info("VectorEngine ready.")
 
     # ------------------------------------------------------------------
@@ -41,6 +64,69 @@ class VectorEngine:
         vector: np.ndarray = self.model.encode(text, show_progress_bar=False)
         return vector.tolist()
 
+    def generate_embeddings(self, texts: list[str], batch_size: int | None = None) -> np.ndarray:
+        """Encode many strings in batched forward passes.
+
+        Much faster than calling `generate_embedding` per text.  Vectors are
+        L2-normalised, which leaves cosine similarity unchanged.
+        ``encode`` already sorts texts by length before batching (so a batch
+        pads to similar lengths) and returns rows in input order, so callers
+        need not sort themselves.
+
+        Texts already in the embedding cache (``settings.embedding_cache``)
+        are served from it; only the rest are encoded, then cached.
+
+        Args:
+            texts: The input texts to embed.
+            batch_size: Texts per forward pass (default
+                ``settings.embedding_batch_size``).
+
+        Returns:
+            A ``(len(texts), dim)`` float32 array, one row per text.
+        """
+        if self.cache is None or not texts:
+            return self._encode(texts, batch_size)
+
+        keys = [cache_key(self.model_name, text) for text in texts]
+        cached = self.cache.get_many(list(dict.fromkeys(keys)))
+        misses = list(dict.fromkeys(key for key in keys if key not in cached))
+        if misses:
+            text_by_key = dict(zip(keys, texts))
+            encoded = self._encode([text_by_key[key] for key in misses], batch_size)
+            fresh = list(zip(misses, encoded))
+            self.cache.put_many(fresh)
+            cached.update(fresh)
+        logger.debug("Embedding cache: %d hit(s), %d miss(es).", len(texts) - len(misses), len(misses))
+        return np.stack([cached[key] for key in keys])
+
+    def _encode(self, texts: list[str], batch_size: int | None) -> np.ndarray:
+        batch_size = batch_size or settings.embedding_batch_size
+        processes = settings.embedding_processes
+        if processes > 1 and len(texts) >= _MULTIPROCESS_MIN_TEXTS:
+            return self._encode_multi_process(texts, batch_size, processes)
+        vectors = self.model.encode(
+            texts,
+            batch_size=batch_size,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=False,
+        )
+        # A float16 model hands back float16 rows; keep callers on float32.
+        return vectors.astype(np.float32, copy=False)
+
+    def _encode_multi_process(self, texts: list[str], batch_size: int, processes: int) -> np.ndarray:
+        """Shard *texts* across CPU worker processes, each with its own model copy."""
+        logger.info("Encoding %d texts on %d worker processes …", len(texts), processes)
+        pool = self.model.start_multi_process_pool(target_devices=["cpu"] * processes)
+        try:
+            vectors = self.model.encode_multi_process(texts, pool, batch_size=batch_size)
+        finally:
+            self.model.stop_multi_process_pool(pool)
+        vectors = np.asarray(vectors, dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return vectors / norms
+
     # ------------------------------------------------------------------
     # Semantic linking on the graph
     # ------------------------------------------------------------------
@@ -49,6 +135,7 @@ class VectorEngine:
         self,
         nx_graph,
         threshold: float | None = None,
+        insight_ids: Iterable[str] | None = None,
     ) -> int:
         """Find semantically similar Insight nodes and link them in the graph.
 
@@ -59,6 +146,8 @@ class VectorEngine:
         Args:
             nx_graph: A ``networkx.DiGraph`` (typically ``ChasmGraph.graph``).
             threshold: Minimum cosine similarity to create an edge.
+            insight_ids: The graph's Insight node ids, if the caller has them
+                indexed (``ChasmGraph.nodes_of_type``); saves a full node scan.
 
         Returns:
             The number of new SEMANTIC_MATCH edges added.
@@ -67,40 +156,85 @@ class VectorEngine:
             threshold = settings.similarity_threshold
 
         # Collect Insight nodes that have embeddings
-        insight_ids: list[str] = []
-        embeddings: list[list[float]] = []
+        if insight_ids is None:
+            candidates = (
+                (nid, data) for nid, data in nx_graph.nodes(data=True)
+                if data.get("node_type") == "Insight"
+            )
+        else:
+            nodes = nx_graph.nodes
+            candidates = ((nid, nodes[nid]) for nid in insight_ids if nid in nodes)
 
-        for node_id, data in nx_graph.nodes(data=True):
-            if data.get("node_type") == "Insight" and data.get("embedding"):
-                insight_ids.append(node_id)
+        ids: list[str] = []
+        embeddings: list[list[float]] = []
+        for node_id, data in candidates:
+            if data.get("embedding"):
+                ids.append(node_id)
                 embeddings.append(data["embedding"])
+        insight_ids = ids
 
         if len(insight_ids) < 2:
             logger.info("Fewer than 2 embedded Insight nodes — nothing to link.")
             return 0
 
-        # Compute pairwise cosine similarity
-        matrix = cosine_similarity(np.array(embeddings))
+        return self.link_from_matrix(
+            nx_graph, insight_ids, np.asarray(embeddings, dtype=np.float32), threshold
+        )
 
+    def link_from_matrix(
+        self,
+        nx_graph,
+        ids: list[str],
+        matrix: np.ndarray,
+        threshold: float | None = None,
+    ) -> int:
+        """Add ``SEMANTIC_MATCH`` edges between rows of an embedding matrix.
+
+        The core of `link_semantic_matches`, for callers that already hold
+        the embeddings as one ``(len(ids), dim)`` array.
+
+        Args:
+            nx_graph: The graph to add edges to.
+            ids: Node id for each row of *matrix*.
+            matrix: One embedding per row; need not be normalised.
+            threshold: Minimum cosine similarity to create an edge.
+
+        Returns:
+            The number of SEMANTIC_MATCH edges added.
+        """
+        if threshold is None:
+            threshold = settings.similarity_threshold
+
+        # Unit-normalise once so each block of cosine scores is a plain
+        # float32 matrix product (zero vectors stay zero, as in sklearn).
+        vectors = np.asarray(matrix, dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        vectors = vectors / norms  # not in place: *matrix* is the caller's
+
+        # Score row blocks against the columns at or after the block, keeping
+        # the upper triangle; pairs come out in the same row-major order.
+        n = len(ids)
+        step = max(1, _LINK_BLOCK_ELEMENTS // n) if n else 1
+        debug = logger.isEnabledFor(logging.DEBUG)
         edges_added = 0
-        n = len(insight_ids)
-        for i in range(n):
-            for j in range(i + 1, n):
-                score = float(matrix[i, j])
-                if score >= threshold:
-                    nx_graph.add_edge(
-                        insight_ids[i],
-                        insight_ids[j],
-                        relation="SEMANTIC_MATCH",
-                        weight=round(score, 4),
-                    )
-                    logger.info(
-                        "SEMANTIC_MATCH: %s ↔ %s (score=%.4f)",
-                        insight_ids[i],
-                        insight_ids[j],
-                        score,
-                    )
-                    edges_added += 1
+        for start in range(0, n, step):
+            block = vectors[start:start + step] @ vectors[start:].T
+            rows, cols = np.nonzero(block >= threshold)
+            upper = cols > rows
+            rows, cols = rows[upper], cols[upper]
+            scores = block[rows, cols]
+            pairs = [
+                (ids[i], ids[j], score)
+                for i, j, score in zip((rows + start).tolist(), (cols + start).tolist(), scores.tolist())
+            ]
+            nx_graph.add_edges_from(
+                (a, b, {"relation": "SEMANTIC_MATCH", "weight": round(score, 4)}) for a, b, score in pairs
+            )
+            if debug:
+                for a, b, score in pairs:
+                    logger.debug("SEMANTIC_MATCH: %s ↔ %s (score=%.4f)", a, b, score)
+            edges_added += len(pairs)
 
         logger.info(
             "Semantic linking complete: %d match(es) from %d Insight nodes.",
@@ -108,3 +242,20 @@ class VectorEngine:
             n,
         )
         return edges_added
+
+
+_engine: VectorEngine | None = None
+_engine_lock = threading.Lock()
+
+
+def get_vector_engine() -> VectorEngine:
+    """Return the process-wide VectorEngine for ``settings.embedding_model``.
+
+    Loading the model takes seconds, so the pipeline and interview
+    completion share one instance instead of each building their own.
+    """
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            _engine = VectorEngine(settings.embedding_model)
+        return _engine
@@ -0,0 +1,34 @@
+"""Compact int8 encoding for persisted embeddings.
+
+Each vector is scaled by its largest absolute component so it fits in
+int8, and stored as base64 alongside that scale.  Cosine similarity is
+unaffected by the scale and barely by the rounding, at a quarter of the
+float32 size and a fraction of the JSON text cost of a float list.
+"""
+
+from __future__ import annotations
+
+import base64
+from typing import Any
+
+import numpy as np
+
+
+def quantize_embedding(vector: Any) -> dict[str, Any]:
+    """Encode a float vector as ``{"dtype": "int8", "scale": s, "data": base64}``."""
+    arr = np.asarray(vector, dtype=np.float32)
+    peak = float(np.abs(arr).max()) if arr.size else 0.0
+    scale = peak / 127.0 if peak > 0 else 1.0
+    q = np.round(arr / scale).astype(np.int8)
+    return {"dtype": "int8", "scale": scale, "data": base64.b64encode(q.tobytes()).decode("ascii")}
+
+
+def is_quantized(value: Any) -> bool:
+    """True if *value* came from `quantize_embedding`."""
+    return isinstance(value, dict) and value.get("dtype") == "int8" and "data" in value
+
+
+def dequantize_embedding(value: dict[str, Any]) -> np.ndarray:
+    """Decode a `quantize_embedding` payload back to a float32 vector."""
+    q = np.frombuffer(base64.b64decode(value["data"]), dtype=np.int8)
+    return q.astype(np.float32) * np.float32(value["scale"])
@@ -6,20 +6,71 @@ extracts insights, and finally runs semantic linking across the entire graph.
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from pathlib import Path
 
-from chasm.agents.extractor import InsightExtractor
+from chasm.agents.extractor import InsightExtractor, write_manifest
 from chasm.agents.scout import SourceScout
 from chasm.core.config import settings
+from chasm.core.llm import run_sync
 from chasm.core.logger import get_logger
 from chasm.graph.builder import ChasmGraph
+from chasm.graph.persistence import save_graph_to_disk
 from chasm.ingest.harvester import RedditHarvester, WebHarvester
 from chasm.models.schema import Source, SourceType
-from chasm.vector.engine import VectorEngine
+from chasm.vector.engine import VectorEngine, get_vector_engine
 
 logger = get_logger(__name__)
 
 
-def run_weekly_research(graph: ChasmGraph) -> None:
+def _extract_and_inject(
+    graph: ChasmGraph,
+    extractor: InsightExtractor,
+    product_id: str,
+    product_name: str,
+    raw_dir: Path,
+) -> dict[str, str]:
+    """Steps 3 and 4 for one product: extract its scraped files, add the results.
+
+    Returns the extraction manifest to record for *raw_dir* once the graph
+    is saved.
+    """
+    # ---- Step 3: Extract insights ----
+    logger.info("[Extractor] Processing scraped files for '%s' …", product_name)
+    manifest: dict[str, str] = {}
+    results = extractor.process_directory(
+        raw_dir=str(raw_dir),
+        product_id=product_id,
+        product_name=product_name,
+        skip_unchanged=True,
+        manifest=manifest,
+    )
+
+    # ---- Step 4: Inject into graph ----
+    logger.info("[Graph] Adding %d (Component, Insight) pairs …", len(results))
+    findings = []
+    for component, insight, source_url in results:
+        # A Source node for the URL; the Insight links it to the Component
+        source = Source(
+            id=f"src-{insight.id}",
+            type=SourceType.REVIEW,
+            raw_text=insight.summary,
+            url=source_url,
+        )
+        findings.append((component, product_id, source, insight))
+    graph.add_insights_bulk(findings)
+
+    logger.info(
+        "Product '%s' complete: graph now has %d nodes, %d edges.",
+        product_name,
+        graph.node_count,
+        graph.edge_count,
+    )
+    return manifest
+
+
+def run_weekly_research(graph: ChasmGraph, vector_engine: VectorEngine | None = None) -> None:
     """Execute the full weekly research pipeline across all tracked products.
 
     Steps:
@@ -27,21 +78,21 @@ def run_weekly_research(graph: ChasmGraph) -> None:
         2. Scrape discovered sources → save as Markdown (Harvesters)
         3. Extract Insights + Components from Markdown (InsightExtractor)
         4. Inject everything into the ChasmGraph
+           (3 and 4 run in the background, overlapping the next product's 2)
         5. Run semantic linking across all Insight nodes (VectorEngine)
+        6. Save the graph, then record which scraped files were extracted
 
     Args:
         graph: The ChasmGraph to read Products from and write results into.
+        vector_engine: Engine for Step 5; defaults to the shared
+            `get_vector_engine` instance.
     """
     logger.info("=" * 60)
     logger.info("  Weekly Research Pipeline — STARTING")
     logger.info("=" * 60)
 
     # --- Collect all Product nodes ---
-    product_nodes = [
-        (nid, data)
-        for nid, data in graph.graph.nodes(data=True)
-        if data.get("node_type") == "Product"
-    ]
+    product_nodes = graph.nodes_of_type("Product")
 
     if not product_nodes:
         logger.warning("No Product nodes in the graph. Nothing to research.")
@@ -56,7 +107,31 @@ def run_weekly_research(graph: ChasmGraph) -> None:
     reddit_harvester = RedditHarvester()
     extractor = InsightExtractor()
 
+    # --- Discover sources for every product in one batch job ---
+    logger.info("[Scout] Identifying sources for %d product(s) …", len(product_nodes))
+    sources_by_product = scout.discover_all(
+        [data.get("name", nid) for nid, data in product_nodes]
+    )
+
+    # ---- Step 2a: Scrape every product's review sites in one wave ----
+    # All URLs go out together on the async client (capped per host), in
+    # the background while the loop below starts on Reddit.
+    site_urls_by_product: dict[str, list[str]] = {}
+    for product_id, product_data in product_nodes:
+        review_sites = sources_by_product.get(product_data.get("name", product_id), {}).get("review_sites", [])
+        site_urls_by_product[product_id] = [
+            f"https://{site_url}" if not site_url.startswith("http") else site_url
+            for site_url in review_sites
+        ]
+    all_site_urls = [url for urls in site_urls_by_product.values() for url in urls]
+    web_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="web")
+    web_wave = web_pool.submit(run_sync, web_harvester.scrape_urls(all_site_urls)) if all_site_urls else None
+    web_pool.shutdown(wait=False)
+    site_texts: dict[str, str] | None = None
+
     # --- Process each product ---
+    extract_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="extract")
+    extractions = []
     for product_id, product_data in product_nodes:
         product_name = product_data.get("name", product_id)
         logger.info("-" * 40)
@@ -65,91 +140,104 @@ def run_weekly_research(graph: ChasmGraph) -> None:
         raw_dir = settings.raw_data_dir / product_id
         raw_dir.mkdir(parents=True, exist_ok=True)
 
-        # ---- Step 1: Discover sources ----
-        logger.info("[Scout] Identifying sources for '%s' …", product_name)
-        subreddits = scout.identify_subreddits(product_name)
-        review_sites = scout.find_review_sites(product_name)
+        # ---- Step 1: Discovered sources ----
+        sources = sources_by_product.get(product_name, {})
+        subreddits = sources.get("subreddits", [])
+        review_sites = sources.get("review_sites", [])
 
         logger.info("  Subreddits: %s", subreddits)
         logger.info("  Review sites: %s", review_sites)
 
-        # ---- Step 2a: Scrape review sites ----
-        for site_url in review_sites:
-            full_url = f"https://{site_url}" if not site_url.startswith("http") else site_url
-            try:
-                text = web_harvester.scrape_url(full_url)
-                if text:
-                    web_harvester.save_to_markdown(full_url, text, product_id)
-            except Exception as exc:
-                logger.warning("  Web scrape failed for %s: %s", full_url, exc)
-
-        # ---- Step 2b: Scrape Reddit ----
-        for sub in subreddits:
-            sub_name = sub.replace("r/", "").strip()
-            try:
-                reddit_harvester.scrape_subreddit(
+        # ---- Step 2b: Scrape Reddit (in the background) ----
+        # Subreddits run on worker threads while the review-site pages are
+        # saved below, so the two kinds of network wait overlap.
+        with ThreadPoolExecutor(
+            max_workers=max(1, settings.scrape_workers), thread_name_prefix="scrape"
+        ) as pool:
+            reddit_jobs = {}
+            for sub in subreddits:
+                sub_name = sub.replace("r/", "").strip()
+                future = pool.submit(
+                    reddit_harvester.scrape_subreddit,
                     subreddit_name=sub_name,
                     product_id=product_id,
                     search_term=product_name,
                     limit=5,
                 )
-            except Exception as exc:
-                logger.warning("  Reddit scrape failed for r/%s: %s", sub_name, exc)
-
-        # ---- Step 3: Extract insights ----
-        logger.info("[Extractor] Processing scraped files for '%s' …", product_name)
-        results = extractor.process_directory(
-            raw_dir=str(raw_dir),
-            product_id=product_id,
-            product_name=product_name,
-        )
-
-        # ---- Step 4: Inject into graph ----
-        logger.info("[Graph] Adding %d (Component, Insight) pairs …", len(results))
-        for component, insight, source_url in results:
-            # Add the component (linked to the product)
-            graph.add_component(component, product_id=product_id)
-
-            # Create a Source node for the URL
-            source = Source(
-                id=f"src-{insight.id}",
-                type=SourceType.REVIEW,
-                raw_text=insight.summary,
-                url=source_url,
-            )
-            graph.add_source(source)
-
-            # Add the Insight, linked from Source and pointing to Component
-            graph.add_insight(
-                insight=insight,
-                source_id=source.id,
-                target_id=component.id,
-            )
-
-        logger.info(
-            "Product '%s' complete: graph now has %d nodes, %d edges.",
-            product_name,
-            graph.node_count,
-            graph.edge_count,
-        )
+                reddit_jobs[future] = sub_name
+
+            # ---- Step 2a (cont.): Save this product's review sites ----
+            if site_texts is None:
+                try:
+                    site_texts = web_wave.result() if web_wave is not None else {}
+                except Exception as exc:
+                    logger.warning("  Web scraping failed: %s", exc)
+                    site_texts = {}
+            scraped_at = datetime.now(timezone.utc).isoformat()
+            for full_url in dict.fromkeys(site_urls_by_product[product_id]):
+                text = site_texts.get(full_url)
+                if text:
+                    try:
+                        web_harvester.save_to_markdown(full_url, text, product_id, scraped_at)
+                    except Exception as exc:
+                        logger.warning("  Saving %s failed: %s", full_url, exc)
+
+            for future in as_completed(reddit_jobs):
+                try:
+                    future.result()
+                except Exception as exc:
+                    logger.warning("  Reddit scrape failed for r/%s: %s", reddit_jobs[future], exc)
+
+        # ---- Steps 3 + 4: Extract and inject (in the background) ----
+        # One worker, so products reach the graph in order while the next
+        # product's sources are already being scraped.
+        extractions.append((
+            raw_dir,
+            extract_pool.submit(_extract_and_inject, graph, extractor, product_id, product_name, raw_dir),
+        ))
+
+    try:
+        manifests = [(raw_dir, extraction.result()) for raw_dir, extraction in extractions]
+    finally:
+        extract_pool.shutdown()
 
     # ---- Step 5: Semantic linking ----
     logger.info("=" * 40)
     logger.info("[VectorEngine] Generating embeddings and linking …")
 
-    vector_engine = VectorEngine()
+    vector_engine = vector_engine or get_vector_engine()
 
     # Generate embeddings for all Insight nodes that don't have them yet
-    for nid, data in graph.graph.nodes(data=True):
-        if data.get("node_type") == "Insight" and not data.get("embedding"):
-            summary = data.get("summary", "")
-            if summary:
-                embedding = vector_engine.generate_embedding(summary)
-                graph.graph.nodes[nid]["embedding"] = embedding
-
-    matches = vector_engine.link_semantic_matches(graph.graph)
+    # (computed outside the lock; only the writes hold it).  The type index
+    # hands back just the Insights, without copying the whole graph into a
+    # snapshot right after the ingest steps changed it.
+    with graph.lock:
+        pending = [
+            (nid, data.get("summary", ""))
+            for nid, data in graph.nodes_of_type("Insight")
+            if not data.get("embedding") and data.get("summary")
+        ]
+    vectors = vector_engine.generate_embeddings([summary for _, summary in pending]) if pending else []
+
+    with graph.lock:
+        for (nid, _), vector in zip(pending, vectors):
+            if nid in graph.graph:
+                graph.graph.nodes[nid]["embedding"] = vector.tolist()
+        matches = vector_engine.link_semantic_matches(
+            graph.graph, insight_ids=[nid for nid, _ in graph.nodes_of_type("Insight")]
+        )
+        graph.touch()
     logger.info("Semantic linking added %d SEMANTIC_MATCH edge(s).", matches)
 
+    # ---- Step 6: Persist ----
+    # Manifests only after the graph is on disk: a file they list is never
+    # extracted again, so a crash before the save must leave it pending.
+    if save_graph_to_disk(graph):
+        for raw_dir, manifest in manifests:
+            write_manifest(raw_dir, manifest)
+    else:
+        logger.warning("Graph not saved; scraped files will be re-extracted next run.")
+
     # ---- Done ----
     logger.info("=" * 60)
     logger.info("  Weekly Research Pipeline Complete.")
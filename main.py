@@ -7,7 +7,8 @@ using NetworkX, and uses Vector Embeddings for semantic linking.
 """
 
 import argparse
-import time
+import signal
+import threading
 
 from chasm.core.config import settings
 from chasm.core.logger import get_logger
@@ -47,13 +48,17 @@ def main() -> None:
         scheduler = ChasmScheduler()
         scheduler.start_weekly_pulse(graph)
 
+        # Block in the kernel until Ctrl-C or SIGTERM (e.g. `docker stop`)
+        # instead of waking up every second.
+        stop = threading.Event()
+        signal.signal(signal.SIGTERM, lambda *_: stop.set())
         try:
-            while True:
-                time.sleep(1)
+            stop.wait()
         except KeyboardInterrupt:
-            print("\n[!] Shutting down scheduler …")
-            scheduler.shutdown()
-            print("    Scheduler stopped. Goodbye.\n")
+            pass
+        print("\n[!] Shutting down scheduler …")
+        scheduler.shutdown()
+        print("    Scheduler stopped. Goodbye.\n")
 
     else:
         logger.info("Chasm System Initialized.")
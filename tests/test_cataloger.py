@@ -0,0 +1,37 @@
+"""Unit tests for ProductCataloger link discovery (no network / LLM)."""
+
+from __future__ import annotations
+
+from chasm.agents.cataloger import ProductCataloger
+
+_HOMEPAGE = """
+<html><head><title>Acme</title><script>var x = "<a href='/drone/fake'>";</script></head>
+<body>
+  <nav><a href="/">Home</a> <a href="/about">About</a></nav>
+  <a href="/products/widget-pro/">Widget Pro</a>
+  <a href="/products/widget-pro">Widget Pro (dup)</a>
+  <a href="https://www.acme.com/drone/air-2?ref=nav">Air 2</a>
+  <a href="https://other.com/product/x">Elsewhere</a>
+  <a href="//cdn.acme.com/shop/logo.png">CDN</a>
+  <a href="camera/zoom">Relative camera</a>
+  <a href="https://www.acme.com.evil.com/store/">Lookalike host</a>
+  <a href="#shop">Jump</a> <a href="mailto:shop@acme.com">Mail</a> <a href="javascript:void(0)">JS</a>
+  <a href="http://www.acme.com/mini/3">Mini 3 over http</a>
+  <a>No href</a>
+</body></html>
+"""
+
+
+def test_find_product_links():
+    links = ProductCataloger._find_product_links(_HOMEPAGE, "https://www.acme.com/")
+    assert links == [
+        "https://www.acme.com/products/widget-pro/",
+        "https://www.acme.com/drone/air-2?ref=nav",
+        "https://www.acme.com/camera/zoom",
+        "http://www.acme.com/mini/3",
+    ]
+
+
+def test_find_product_links_respects_max():
+    links = ProductCataloger._find_product_links(_HOMEPAGE, "https://www.acme.com/", max_links=1)
+    assert links == ["https://www.acme.com/products/widget-pro/"]
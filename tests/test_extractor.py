@@ -0,0 +1,164 @@
+"""Unit tests for InsightExtractor helpers that don't touch the LLM."""
+
+from __future__ import annotations
+
+import json
+
+from chasm.agents.extractor import (
+    InsightExtractor,
+    _clamp_sentiments,
+    _guess_category,
+    _sanitize_items,
+    write_manifest,
+)
+from chasm.core.config import settings
+from chasm.models.schema import ComponentCategory
+
+
+def test_guess_category_keyword_match():
+    assert _guess_category("Intelligent Flight Battery") == ComponentCategory.ELECTRICAL
+    assert _guess_category("Landing Gear") == ComponentCategory.MECHANICAL
+    assert _guess_category("Retail Packaging") == ComponentCategory.PACKAGING
+
+
+def test_guess_category_first_map_entry_wins():
+    # Both "camera" and "gimbal" occur; "camera" comes first in the map.
+    assert _guess_category("Gimbal camera") == ComponentCategory.ELECTRICAL
+
+
+def test_guess_category_unknown():
+    assert _guess_category("General") == ComponentCategory.UNKNOWN
+    assert _guess_category("") == ComponentCategory.UNKNOWN
+
+
+def test_clamp_sentiments():
+    assert _clamp_sentiments([0.5, -3, 2.0, "0.25"]) == [0.5, -1.0, 1.0, 0.25]
+    assert _clamp_sentiments([]) == []
+
+
+def test_sanitize_items_coerces_llm_fields():
+    items = _sanitize_items([
+        {"component_name": "Battery", "summary": "Hot", "sentiment": "-0.5", "tags": ["heat", 3], "file_id": "0"},
+        {"sentiment": "n/a", "tags": "not-a-list"},
+        "stray string",
+    ])
+    assert items == [
+        {"component_name": "Battery", "summary": "Hot", "sentiment": -0.5, "tags": ["heat", "3"], "file_id": "0"},
+        {"component_name": "General", "summary": "", "sentiment": 0.0, "tags": []},
+    ]
+
+
+def test_parse_markdown_file(tmp_path):
+    md = tmp_path / "post.md"
+    md.write_text("---\nsource_url: https://example.com\n---\n\nBody text\n", encoding="utf-8")
+
+    parsed = InsightExtractor.parse_markdown_file(str(md))
+    assert parsed["frontmatter"] == {"source_url": "https://example.com"}
+    assert parsed["content"] == "Body text"
+
+
+def test_parse_markdown_file_sees_edits(tmp_path):
+    md = tmp_path / "post.md"
+    md.write_text("---\nscore: 1\n---\nfirst", encoding="utf-8")
+    assert InsightExtractor.parse_markdown_file(str(md))["content"] == "first"
+
+    md.write_text("---\nscore: 2\n---\nsecond edit", encoding="utf-8")
+    parsed = InsightExtractor.parse_markdown_file(str(md))
+    assert parsed["frontmatter"]["score"] == 2
+    assert parsed["content"] == "second edit"
+
+
+def test_parse_markdown_file_keeps_rules_in_body(tmp_path):
+    md = tmp_path / "post.md"
+    md.write_text("---\nscore: 3\n---\n\nIntro\n\n---\n\nOutro ---\n", encoding="utf-8")
+    parsed = InsightExtractor.parse_markdown_file(str(md))
+    assert parsed == {"frontmatter": {"score": 3}, "content": "Intro\n\n---\n\nOutro ---"}
+
+
+def test_parse_markdown_file_without_frontmatter(tmp_path):
+    md = tmp_path / "plain.md"
+    md.write_text("  just text  ", encoding="utf-8")
+    assert InsightExtractor.parse_markdown_file(str(md)) == {"frontmatter": {}, "content": "just text"}
+
+
+class _FakeAioModels:
+    """Answers every extraction request with one insight per file_id header."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def generate_content(self, model, contents, config=None):
+        self.calls += 1
+        ids = [line.split("file_id: ")[1].split(" ")[0] for line in contents.splitlines() if "file_id: " in line]
+        items = [{"file_id": i, "component_name": "Battery", "summary": f"file {i}", "sentiment": 5} for i in ids]
+        if not ids:  # single-document request
+            items = [{"component_name": "Retail Packaging", "summary": "single", "sentiment": -5}]
+        return type("Resp", (), {"text": json.dumps(items)})()
+
+
+def test_process_directory_batches_and_maps_sources(tmp_path, monkeypatch):
+    for idx in range(3):
+        (tmp_path / f"{idx}.md").write_text(f"---\nsource_url: https://s/{idx}\n---\n{'x' * 40}", encoding="utf-8")
+    monkeypatch.setattr(settings, "extraction_batch_chars", 100)
+
+    extractor = object.__new__(InsightExtractor)
+    extractor.model = "test-model"
+    models = _FakeAioModels()
+    extractor.client = type("Client", (), {"aio": type("Aio", (), {"models": models})()})()
+
+    results = extractor.process_directory(str(tmp_path), "prod-1", "Widget")
+
+    # Files 0+1 share a batched request; file 2 goes alone.
+    assert models.calls == 2
+    assert [(c.name, i.summary, i.sentiment, url) for c, i, url in results] == [
+        ("Battery", "file 0", 1.0, "https://s/0"),
+        ("Battery", "file 1", 1.0, "https://s/1"),
+        ("Retail Packaging", "single", -1.0, "https://s/2"),
+    ]
+    assert results[2][0].category == ComponentCategory.PACKAGING
+
+
+def test_process_directory_skips_unchanged_files(tmp_path):
+    for idx in range(2):
+        (tmp_path / f"{idx}.md").write_text(f"---\nsource_url: https://s/{idx}\n---\nbody {idx}", encoding="utf-8")
+
+    extractor = object.__new__(InsightExtractor)
+    extractor.model = "test-model"
+    models = _FakeAioModels()
+    extractor.client = type("Client", (), {"aio": type("Aio", (), {"models": models})()})()
+
+    manifest: dict[str, str] = {}
+    assert len(extractor.process_directory(str(tmp_path), "prod-1", "Widget", True, manifest)) == 2
+    # Nothing is recorded until the caller has persisted the results.
+    assert extractor.process_directory(str(tmp_path), "prod-1", "Widget", skip_unchanged=True) != []
+    write_manifest(tmp_path, manifest)
+
+    # Re-scraped with a new date but the same body, plus one edited file.
+    (tmp_path / "0.md").write_text("---\nsource_url: https://s/0\ndate_scraped: later\n---\nbody 0", encoding="utf-8")
+    (tmp_path / "1.md").write_text("---\nsource_url: https://s/1\n---\nbody 1 edited", encoding="utf-8")
+    manifest = {}
+    results = extractor.process_directory(str(tmp_path), "prod-1", "Widget", True, manifest)
+    assert [url for _, _, url in results] == ["https://s/1"]
+    assert sorted(manifest) == ["0.md", "1.md"]
+
+
+def test_process_directory_leaves_unparseable_files_out_of_manifest(tmp_path, monkeypatch):
+    (tmp_path / "good.md").write_text("---\nsource_url: https://s/good\n---\nfine", encoding="utf-8")
+    (tmp_path / "bad.md").write_text("---\nsource_url: https://s/bad\n---\ngarbled", encoding="utf-8")
+    monkeypatch.setattr(settings, "extraction_batch_chars", 8)  # one request per file
+
+    class _Models(_FakeAioModels):
+        async def generate_content(self, model, contents, config=None):
+            if "garbled" in contents:
+                self.calls += 1
+                return type("Resp", (), {"text": "Sorry, I can't help with that."})()
+            return await super().generate_content(model, contents, config)
+
+    extractor = object.__new__(InsightExtractor)
+    extractor.model = "test-model"
+    extractor.client = type("Client", (), {"aio": type("Aio", (), {"models": _Models()})()})()
+
+    manifest: dict[str, str] = {}
+    results = extractor.process_directory(str(tmp_path), "prod-1", "Widget", True, manifest)
+    assert [url for _, _, url in results] == ["https://s/good"]
+    assert list(manifest) == ["good.md"]
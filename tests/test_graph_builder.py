@@ -1,9 +1,14 @@
 """Integration tests for ChasmGraph — extracted from builder.py __main__ block."""
 
+import json
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
+import networkx as nx
+from networkx.readwrite import json_graph
 import pytest
 
+from chasm.core.config import settings
 from chasm.graph.builder import ChasmGraph
 from chasm.models.schema import (
     Component,
@@ -86,7 +91,145 @@ def test_counts(populated_graph: ChasmGraph):
     assert populated_graph.edge_count == 3
 
 
+def test_edge_count_sees_edges_added_directly(populated_graph: ChasmGraph):
+    populated_graph.graph.add_edge("prod-001", "ins-001", relation="SEMANTIC_MATCH")
+    assert populated_graph.edge_count == populated_graph.graph.number_of_edges() == 4
+
+
 def test_export(populated_graph: ChasmGraph, tmp_path: Path):
     export_path = tmp_path / "test_graph.json"
     populated_graph.export_graph(str(export_path))
     assert export_path.exists()
+
+
+def test_nodes_of_type(populated_graph: ChasmGraph):
+    assert [nid for nid, _ in populated_graph.nodes_of_type("Product")] == ["prod-001"]
+    assert populated_graph.nodes_of_type("Insight")[0][1]["summary"].startswith("Device overheats")
+    assert populated_graph.nodes_of_type("Unknown") == []
+
+
+def test_nodes_of_type_keeps_insertion_order():
+    g = ChasmGraph()
+    ids = [f"p{i}" for i in range(20)]
+    for nid in ids:
+        g.add_product(Product(id=nid, name=nid))
+    assert [nid for nid, _ in g.nodes_of_type("Product")] == ids
+
+
+def test_indexes_skip_nodes_removed_directly(populated_graph: ChasmGraph):
+    populated_graph.graph.clear()
+    assert populated_graph.nodes_of_type("Product") == []
+    assert populated_graph.insights_since(datetime(2000, 1, 1, tzinfo=timezone.utc)) == []
+
+
+def test_insights_since(populated_graph: ChasmGraph):
+    g = populated_graph
+    g.add_insight(
+        Insight(id="ins-002", summary="Old news", sentiment=0.1),
+        source_id="src-001",
+        target_id="comp-001",
+    )
+    g.graph.nodes["ins-002"]["date_added"] = "2020-01-01T00:00:00+00:00"
+    g.graph.add_node("ins-legacy", node_type="Insight", summary="No date")
+    g.reindex()
+
+    recent = g.insights_since(datetime.now(timezone.utc) - timedelta(days=7))
+    assert recent == ["ins-001", "ins-legacy"]  # undated insights always count
+    assert "ins-002" in g.insights_since(datetime(2019, 1, 1, tzinfo=timezone.utc))
+
+
+def test_get_node_relations(populated_graph: ChasmGraph):
+    assert populated_graph.get_node_relations("ins-001") == {"YIELDS": "src-001", "ABOUT": "comp-001"}
+
+    # Wired up without add_insight — found by scanning edges
+    populated_graph.graph.add_edge("ins-x", "comp-001", relation="ABOUT")
+    assert populated_graph.get_node_relations("ins-x") == {"ABOUT": "comp-001"}
+
+
+def test_replacing_graph_rebuilds_indexes(populated_graph: ChasmGraph):
+    g = ChasmGraph()
+    g.graph = populated_graph.graph.copy()
+    assert [nid for nid, _ in g.nodes_of_type("Component")] == ["comp-001"]
+    assert g.get_node_relations("ins-001") == {"ABOUT": "comp-001", "YIELDS": "src-001"}
+
+
+def test_insight_denormalises_neighbours(populated_graph: ChasmGraph):
+    data = populated_graph.graph.nodes["ins-001"]
+    assert data["component_name"] == "Intelligent Flight Battery"
+    assert data["source_url"] == "https://reddit.com/r/dji/comments/abc123"
+
+
+def test_add_insights_bulk_matches_one_by_one():
+    def items():
+        for i in range(3):
+            component = Component(id=f"comp-{i % 2}", name=f"Part {i % 2}", category=ComponentCategory.MECHANICAL)
+            source = Source(id=f"src-{i}", type=SourceType.REVIEW, raw_text="...", url=f"https://r/{i}")
+            yield component, "prod-001", source, Insight(id=f"ins-{i}", summary=f"finding {i}", sentiment=0.1)
+
+    one_by_one, bulk = ChasmGraph(), ChasmGraph()
+    for g in (one_by_one, bulk):
+        g.add_product(Product(id="prod-001", name="Drone"))
+    for component, product_id, source, insight in items():
+        one_by_one.add_component(component, product_id=product_id)
+        one_by_one.add_source(source)
+        one_by_one.add_insight(insight, source_id=source.id, target_id=component.id)
+    assert bulk.add_insights_bulk(items()) == ["ins-0", "ins-1", "ins-2"]
+
+    def undated(g):
+        return [(nid, {k: v for k, v in d.items() if k != "date_added"}) for nid, d in g.graph.nodes(data=True)]
+
+    assert undated(bulk) == undated(one_by_one)
+    assert list(bulk.graph.edges(data=True)) == list(one_by_one.graph.edges(data=True))
+    assert [nid for nid, _ in bulk.nodes_of_type("Insight")] == ["ins-0", "ins-1", "ins-2"]
+    assert bulk.get_node_relations("ins-2") == {"YIELDS": "src-2", "ABOUT": "comp-0"}
+    assert len(bulk.insights_since(datetime.now(timezone.utc) - timedelta(minutes=1))) == 3
+
+
+def test_version_bumps_on_mutation():
+    g = ChasmGraph()
+    v0 = g.version
+    g.add_product(Product(id="p1", name="Drone"))
+    v1 = g.version
+    assert v1 > v0
+
+    g.graph.nodes["p1"]["name"] = "Renamed"
+    assert g.version == v1  # direct edits are invisible until touched
+    g.touch()
+    assert g.version > v1
+
+
+def test_products_version_ignores_other_nodes():
+    g = ChasmGraph()
+    g.add_product(Product(id="p1", name="Drone"))
+    pv = g.products_version
+    g.add_component(Component(id="c1", name="Hinge", category=ComponentCategory.MECHANICAL), product_id="p1")
+    assert g.products_version == pv
+    g.add_product(Product(id="p2", name="Mini"))
+    assert g.products_version > pv
+
+
+def test_snapshot_is_frozen_and_per_version():
+    g = ChasmGraph()
+    g.add_product(Product(id="p1", name="Drone"))
+    snap = g.snapshot()
+    assert g.snapshot() is snap
+    assert [nid for nid, _ in snap.nodes_of_type("Product")] == ["p1"]
+    with pytest.raises(nx.NetworkXError):
+        snap.graph.add_node("x")
+
+    g.add_product(Product(id="p2", name="Mini"))
+    assert [nid for nid, _ in snap.nodes_of_type("Product")] == ["p1"]  # old view unchanged
+    assert [nid for nid, _ in g.snapshot().nodes_of_type("Product")] == ["p1", "p2"]
+
+
+def test_export_round_trips_through_node_link_graph(populated_graph: ChasmGraph, tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(settings, "embedding_quantized", False)
+    populated_graph.graph.nodes["prod-001"]["embedding"] = [0.25, -0.5]
+    export_path = tmp_path / "graph.json"
+    populated_graph.export_graph(str(export_path))
+
+    data = json.loads(export_path.read_text(encoding="utf-8"))
+    assert data == json.loads(json.dumps(json_graph.node_link_data(populated_graph.graph)))
+    restored = json_graph.node_link_graph(data)
+    assert list(restored.nodes) == list(populated_graph.graph.nodes)
+    assert list(restored.edges) == list(populated_graph.graph.edges)
@@ -0,0 +1,54 @@
+"""Tests for RedditHarvester with a fake PRAW client (no network)."""
+
+from __future__ import annotations
+
+import threading
+from types import SimpleNamespace
+
+from chasm.core.config import settings
+from chasm.ingest.harvester import RedditHarvester
+
+
+class _Comments(list):
+    def __init__(self, items, replace_more):
+        super().__init__(items)
+        self.replace_more = replace_more
+
+
+class _FakeReddit:
+    def __init__(self, posts):
+        self.posts = posts
+        self.comment_threads: set[str] = set()
+
+    def subreddit(self, name):
+        return SimpleNamespace(search=lambda term, limit: self.posts[:limit])
+
+    def submission(self, id):
+        def replace_more(limit):
+            self.comment_threads.add(threading.current_thread().name)
+
+        comments = [SimpleNamespace(author="bob", score=3, body=f"comment on {id}")]
+        return SimpleNamespace(comments=_Comments(comments, replace_more))
+
+
+def test_scrape_subreddit_saves_posts_in_search_order(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "raw_data_dir", tmp_path)
+    posts = [
+        SimpleNamespace(id=f"p{i}", title=f"Post {i}", selftext="Body", permalink=f"/r/x/{i}", author="amy", score=i)
+        for i in range(4)
+    ]
+    fake = _FakeReddit(posts)
+
+    harvester = object.__new__(RedditHarvester)  # skip PRAW setup
+    harvester.reddit = fake
+    harvester._thread_client = lambda: fake  # the fake is safe to share across workers
+
+    files = harvester.scrape_subreddit("drones", "prod-1", "Mavic", limit=3)
+
+    assert [f.name for f in files] == ["reddit_drones_p0.md", "reddit_drones_p1.md", "reddit_drones_p2.md"]
+    text = files[1].read_text(encoding="utf-8")
+    assert "source_url: https://reddit.com/r/x/1" in text
+    assert "> comment on p1" in text
+    assert all(name.startswith("reddit") for name in fake.comment_threads)
+    stamps = {line for f in files for line in f.read_text(encoding="utf-8").splitlines() if line.startswith("date_scraped:")}
+    assert len(stamps) == 1  # one timestamp for the whole batch
@@ -0,0 +1,123 @@
+"""Tests for chasm.core.http: the on-disk page cache and concurrent fetches (network is stubbed)."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+
+import httpx
+import pytest
+
+from chasm.core import http
+from chasm.core.config import settings
+
+
+@pytest.fixture
+def fake_fetch(tmp_path, monkeypatch):
+    calls: list[str] = []
+
+    def _fetch(url: str) -> str | None:
+        calls.append(url)
+        return None if "missing" in url else f"<html>{url} ✓</html>"
+
+    monkeypatch.setattr(settings, "http_cache_dir", tmp_path / "cache")
+    monkeypatch.setattr(settings, "http_cache_ttl", 60)
+    monkeypatch.setattr(http, "fetch", _fetch)
+    return calls
+
+
+def test_cached_fetch_hits_disk_on_repeat(fake_fetch):
+    url = "https://example.com/a"
+    assert http.cached_fetch(url) == f"<html>{url} ✓</html>"
+    assert http.cached_fetch(url) == f"<html>{url} ✓</html>"
+    assert fake_fetch == [url]
+
+
+def test_cached_fetch_refetches_expired_entries(fake_fetch):
+    url = "https://example.com/b"
+    http.cached_fetch(url)
+    stale = http._cache_path(url)
+    os.utime(stale, (0, 0))
+    http.cached_fetch(url)
+    assert fake_fetch == [url, url]
+
+
+def test_cached_fetch_does_not_cache_failures(fake_fetch):
+    url = "https://example.com/missing"
+    assert http.cached_fetch(url) is None
+    assert http.cached_fetch(url) is None
+    assert fake_fetch == [url, url]
+
+
+def test_fetch_many_decodes_and_retries(monkeypatch):
+    attempts: dict[str, int] = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        attempts[path] = attempts.get(path, 0) + 1
+        if path == "/flaky" and attempts[path] == 1:
+            return httpx.Response(503)
+        if path == "/gone":
+            return httpx.Response(404)
+        return httpx.Response(200, content=f"<p>{path} ✓</p>".encode("utf-8"))
+
+    real_client = httpx.AsyncClient
+    monkeypatch.setattr(
+        http.httpx, "AsyncClient",
+        lambda **kwargs: real_client(transport=httpx.MockTransport(handler), **kwargs),
+    )
+    monkeypatch.setattr(http, "wait_exponential", lambda **kwargs: lambda retry_state: 0)
+
+    urls = ["https://x.test/ok", "https://x.test/flaky", "https://x.test/gone", "https://x.test/ok"]
+    pages = asyncio.run(http.fetch_many(urls))
+
+    assert pages == {
+        "https://x.test/ok": "<p>/ok ✓</p>",
+        "https://x.test/flaky": "<p>/flaky ✓</p>",
+        "https://x.test/gone": None,
+    }
+    assert attempts == {"/ok": 1, "/flaky": 2, "/gone": 1}
+
+
+def test_cached_fetch_many_only_downloads_misses(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "http_cache_dir", tmp_path / "cache")
+    monkeypatch.setattr(settings, "http_cache_ttl", 60)
+    requested: list[list[str]] = []
+
+    async def _fetch_many(urls, concurrency=20):
+        requested.append(urls)
+        return {url: None if "missing" in url else f"<p>{url}</p>" for url in urls}
+
+    monkeypatch.setattr(http, "fetch_many", _fetch_many)
+    urls = ["https://x.test/a", "https://x.test/missing", "https://x.test/b"]
+    first = asyncio.run(http.cached_fetch_many(urls))
+    second = asyncio.run(http.cached_fetch_many(urls))
+
+    assert first == second == {
+        "https://x.test/a": "<p>https://x.test/a</p>",
+        "https://x.test/missing": None,
+        "https://x.test/b": "<p>https://x.test/b</p>",
+    }
+    assert list(second) == urls
+    assert requested == [urls, ["https://x.test/missing"]]
+
+
+def test_fetch_many_caps_requests_per_host(monkeypatch):
+    in_flight: dict[str, int] = {}
+    peak: dict[str, int] = {}
+
+    async def _get_async(client, url):
+        host = http.urlsplit(url).netloc
+        in_flight[host] = in_flight.get(host, 0) + 1
+        peak[host] = max(peak.get(host, 0), in_flight[host])
+        await asyncio.sleep(0.01)
+        in_flight[host] -= 1
+        return httpx.Response(200, content=b"ok")
+
+    monkeypatch.setattr(settings, "http_per_host", 2)
+    monkeypatch.setattr(http, "_get_async", _get_async)
+    urls = [f"https://a.test/{i}" for i in range(6)] + [f"https://b.test/{i}" for i in range(3)]
+    pages = asyncio.run(http.fetch_many(urls))
+
+    assert list(pages) == urls and set(pages.values()) == {"ok"}
+    assert peak == {"a.test": 2, "b.test": 2}
@@ -3,15 +3,19 @@
 from __future__ import annotations
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
 
 from chasm.interviews.sessions import (
     ChatMessage,
     InterviewSession,
+    append_to_session,
     create_session,
+    list_sessions,
     load_session,
     save_session,
     INTERVIEWS_DIR,
@@ -84,6 +88,74 @@ class TestSessionPersistence:
         assert loaded is not None
         assert loaded.status == "active"
         assert len(loaded.messages) == 1
+        assert [p.name for p in self.tmp.iterdir()] == [f"{session.id}.jsonl"]
+
+    def test_overlapping_saves_of_one_session(self):
+        session = create_session()
+        session.messages.append(ChatMessage(role="assistant", content="Welcome"))
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(lambda _: save_session(session), range(20)))
+
+        assert [p.name for p in self.tmp.iterdir()] == [f"{session.id}.jsonl"]
+        assert [m.content for m in load_session(session.id).messages] == ["Welcome"]
+
+    def test_append_writes_only_new_lines(self):
+        session = create_session()
+        first = ChatMessage(role="assistant", content="Welcome")
+        session.status = "active"
+        session.messages.append(first)
+        append_to_session(session, first)
+
+        path = self.tmp / f"{session.id}.jsonl"
+        before = path.read_text(encoding="utf-8")
+        reply = ChatMessage(role="user", content="Hi")
+        session.messages.append(reply)
+        append_to_session(session, reply)
+        assert path.read_text(encoding="utf-8").startswith(before)
+
+        loaded = load_session(session.id)
+        assert loaded.status == "active"
+        assert [m.content for m in loaded.messages] == ["Welcome", "Hi"]
+
+    def test_torn_append_keeps_complete_records(self):
+        session = create_session()
+        first = ChatMessage(role="assistant", content="Welcome")
+        session.messages.append(first)
+        append_to_session(session, first)
+
+        path = self.tmp / f"{session.id}.jsonl"
+        with path.open("ab") as fh:
+            fh.write(b'{"type": "message", "role": "us')  # crash mid-write
+        assert [m.content for m in load_session(session.id).messages] == ["Welcome"]
+
+        reply = ChatMessage(role="user", content="Hi")
+        session.messages.append(reply)
+        append_to_session(session, reply)
+        assert [m.content for m in load_session(session.id).messages] == ["Welcome", "Hi"]
+
+    def test_load_legacy_json(self):
+        self.tmp.mkdir(parents=True)
+        legacy = InterviewSession(id="old1", status="active")
+        legacy.messages.append(ChatMessage(role="assistant", content="Hi"))
+        (self.tmp / "old1.json").write_text(legacy.model_dump_json(), encoding="utf-8")
+
+        loaded = load_session("old1")
+        assert loaded == legacy
+
+        msg = ChatMessage(role="user", content="Hello")
+        loaded.messages.append(msg)
+        append_to_session(loaded, msg)  # migrates to .jsonl
+        assert not (self.tmp / "old1.json").exists()
+        assert [m.content for m in load_session("old1").messages] == ["Hi", "Hello"]
+
+    def test_list_sessions_sorted_and_skips_invalid(self):
+        self.tmp.mkdir(parents=True)
+        for sid in ("b2", "a1", "c3"):
+            save_session(InterviewSession(id=sid))
+        (self.tmp / "legacy.json").write_text(InterviewSession(id="legacy").model_dump_json(), encoding="utf-8")
+        (self.tmp / "broken.json").write_text("{not json", encoding="utf-8")
+
+        assert [s.id for s in list_sessions()] == ["a1", "b2", "c3", "legacy"]
 
 
 # ---------------------------------------------------------------------------
@@ -99,7 +171,7 @@ class TestSessionCompletion:
         )
 
     @patch("chasm.graph.persistence.save_graph_to_disk")
-    @patch("chasm.vector.engine.VectorEngine")
+    @patch("chasm.vector.engine.get_vector_engine")
     @patch("chasm.agents.interviewer.InterviewInsightExtractor")
     def test_complete_injects_insights(
         self,
@@ -144,6 +216,7 @@ class TestSessionCompletion:
         # Mock VectorEngine
         mock_ve_instance = MockVectorEngine.return_value
         mock_ve_instance.generate_embedding.return_value = [0.1] * 384
+        mock_ve_instance.generate_embeddings.side_effect = lambda texts: np.full((len(texts), 384), 0.1)
         mock_ve_instance.link_semantic_matches.return_value = 0
 
         injected = complete_session(session)
@@ -159,6 +232,8 @@ class TestSessionCompletion:
             if d.get("node_type") == "Source" and d.get("type") == "Employee_Interview"
         ]
         assert len(source_nodes) == 2
+        assert mock_ve_instance.generate_embeddings.call_count == 1
+        assert graph.graph.nodes["ins-test1"]["embedding"] == [0.1] * 384
 
         # Clean up graph for other tests
         graph.graph.clear()
@@ -0,0 +1,79 @@
+"""Unit tests for the LLM response helpers in chasm.core.llm."""
+
+from __future__ import annotations
+
+from chasm.core.llm import GeminiAgent, iter_json_array, parse_json_array
+
+
+def test_parse_bare_json():
+    assert parse_json_array('[{"a": 1}]') == [{"a": 1}]
+
+
+def test_parse_fenced_json_with_prose():
+    raw = 'Here you go:\n```json\n[{"name": "X"}]\n```\nLet me know [if] you need more.'
+    assert parse_json_array(raw) == [{"name": "X"}]
+
+
+def test_parse_ignores_brackets_inside_strings():
+    raw = 'Result: [{"summary": "bad ] bracket \\" and [ quote"}] trailing ]'
+    assert parse_json_array(raw) == [{"summary": 'bad ] bracket " and [ quote'}]
+
+
+def test_parse_nested_arrays():
+    assert parse_json_array('x [{"tags": ["a", "b"]}, [1]] y') == [{"tags": ["a", "b"]}, [1]]
+
+
+def test_parse_failures_return_none():
+    assert parse_json_array("no array here") is None
+    assert parse_json_array('[{"truncated": ') is None
+    assert parse_json_array("[not json]") is None
+
+
+def test_iter_json_array_across_chunk_boundaries():
+    text = '```json\n[{"s": "a,]\\\\"}, {"tags": ["x", "y"]}, 3]\n``` then [9]'
+    chunks = [text[i : i + 3] for i in range(0, len(text), 3)]
+    assert list(iter_json_array(chunks)) == [{"s": "a,]\\"}, {"tags": ["x", "y"]}, 3]
+
+
+def test_iter_json_array_keeps_items_before_truncation():
+    assert list(iter_json_array(['[{"a": 1}, {"b"', ': 2}, {"tru'])) == [{"a": 1}, {"b": 2}]
+    assert list(iter_json_array(["no array at all"])) == []
+
+
+class _FakeModels:
+    def __init__(self):
+        self.count_calls = 0
+
+    def count_tokens(self, model, contents):
+        self.count_calls += 1
+        return type("Resp", (), {"total_tokens": len(contents) // 5})()
+
+
+def _agent(model: str) -> GeminiAgent:
+    agent = object.__new__(GeminiAgent)
+    agent.model = model
+    agent.client = type("Client", (), {"models": _FakeModels()})()
+    return agent
+
+
+def test_truncate_to_tokens_learns_ratio_once():
+    agent = _agent("test-truncate")
+    text = "x" * 1000  # 200 "tokens" at 5 chars/token
+
+    assert agent._truncate_to_tokens(text, 500) == text
+    assert agent._truncate_to_tokens(text, 100) == "x" * 500
+    assert agent.client.models.count_calls == 1
+
+
+def test_generation_config_includes_service_tier():
+    from chasm.agents.interviewer import Interviewer
+    from chasm.agents.scout import SourceScout
+
+    agent = _agent("test-tier")
+    assert agent._generation_config(None) is None
+
+    scout = object.__new__(SourceScout)
+    config = scout._generation_config("Be brief.")
+    assert config.service_tier.value == "flex"
+    assert config.system_instruction == "Be brief."
+    assert object.__new__(Interviewer)._generation_config(None).service_tier.value == "priority"
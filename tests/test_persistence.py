@@ -0,0 +1,168 @@
+"""Tests for graph persistence: export/load round trip and the debounced saver."""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import os
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+
+import numpy as np
+
+from chasm.core.config import settings
+from chasm.graph import persistence
+from chasm.graph.builder import ChasmGraph
+from chasm.models.schema import Insight, Product, Source, SourceType
+from chasm.vector.quantize import dequantize_embedding, quantize_embedding
+
+
+def test_quantize_embedding_round_trip():
+    vector = np.random.default_rng(0).normal(size=384).astype(np.float32)
+    restored = dequantize_embedding(quantize_embedding(vector))
+    cosine = float(vector @ restored / (np.linalg.norm(vector) * np.linalg.norm(restored)))
+    assert restored.shape == (384,)
+    assert cosine > 0.999
+    assert not dequantize_embedding(quantize_embedding([0.0, 0.0])).any()
+
+
+def _small_graph() -> ChasmGraph:
+    g = ChasmGraph()
+    g.add_product(Product(id="p1", name="Drone"))
+    g.add_source(Source(id="s1", type=SourceType.REDDIT, raw_text="..."))
+    g.add_insight(Insight(id="i1", summary="Hot", sentiment=-0.5, embedding=[0.5, -1.0, 0.25]), "s1", "p1")
+    return g
+
+
+def test_export_quantizes_embeddings_and_load_restores_floats(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "data_dir", tmp_path)
+    monkeypatch.setattr(settings, "graph_format", "json")
+    persistence.save_graph_to_disk(_small_graph())
+    assert '"int8"' in settings.export_path.read_text(encoding="utf-8")
+
+    loaded = ChasmGraph()
+    persistence.load_graph_from_disk(loaded)
+    assert np.allclose(loaded.graph.nodes["i1"]["embedding"], [0.5, -1.0, 0.25], atol=0.01)
+    assert isinstance(loaded.graph.nodes["i1"]["embedding"], list)
+
+
+def test_load_json_reads_edges_under_either_key(tmp_path):
+    for key in ("edges", "links"):
+        path = tmp_path / f"{key}.json"
+        path.write_text(
+            '{"directed": true, "multigraph": false, "graph": {}, "nodes": [{"id": "a"}, {"id": "b"}],'
+            f' "{key}": [{{"source": "a", "target": "b", "relation": "ABOUT"}}]}}',
+            encoding="utf-8",
+        )
+        assert list(persistence._load_json(path).edges(data="relation")) == [("a", "b", "ABOUT")]
+
+
+def test_pickle_round_trip_and_newest_file_wins(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "data_dir", tmp_path)
+    g = _small_graph()
+    persistence.save_graph_to_disk(g)  # default format: pickle
+    assert settings.graph_pickle_path.exists() and not settings.export_path.exists()
+
+    loaded = ChasmGraph()
+    persistence.load_graph_from_disk(loaded)
+    assert dict(loaded.graph.nodes(data=True)) == dict(g.graph.nodes(data=True))
+    assert list(loaded.graph.edges(data=True)) == list(g.graph.edges(data=True))
+    assert [nid for nid, _ in loaded.nodes_of_type("Insight")] == ["i1"]
+    loaded.add_product(Product(id="p2", name="Mini"))  # not left frozen
+
+    # A newer JSON export (e.g. after switching formats) takes precedence.
+    monkeypatch.setattr(settings, "graph_format", "json")
+    persistence.save_graph_to_disk(loaded)
+    os_stat = settings.graph_pickle_path.stat()
+    os.utime(settings.graph_pickle_path, (os_stat.st_atime, os_stat.st_mtime - 10))
+    reloaded = ChasmGraph()
+    persistence.load_graph_from_disk(reloaded)
+    assert "p2" in reloaded.graph
+
+
+def test_overlapping_pickle_exports_each_publish_a_whole_file(tmp_path):
+    path = tmp_path / "export.pkl.gz"
+    graphs = [_small_graph() for _ in range(4)]
+    for i, g in enumerate(graphs):
+        g.add_product(Product(id=f"extra-{i}", name="Mini"))
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(lambda g: g.export_pickle(str(path)), graphs * 5))
+
+    assert [p.name for p in tmp_path.iterdir()] == ["export.pkl.gz"]
+    loaded = ChasmGraph.load_pickle(str(path))
+    assert any(set(loaded.nodes) == set(g.graph.nodes) for g in graphs)
+
+
+def test_overlapping_json_exports_each_publish_a_whole_file(tmp_path):
+    path = tmp_path / "export.json"
+    graphs = [_small_graph() for _ in range(4)]
+    for i, g in enumerate(graphs):
+        g.add_product(Product(id=f"extra-{i}", name="Mini"))
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(lambda g: g.export_graph(str(path)), graphs * 5))
+
+    assert [p.name for p in tmp_path.iterdir()] == ["export.json"]
+    loaded = persistence._load_json(path)
+    assert any(set(loaded.nodes) == set(g.graph.nodes) for g in graphs)
+
+
+def test_saves_run_one_at_a_time(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "data_dir", tmp_path)
+    active, peak = [0], [0]
+    export = ChasmGraph.export_pickle
+
+    def tracking_export(self, filepath):
+        active[0] += 1
+        peak[0] = max(peak[0], active[0])
+        try:
+            export(self, filepath)
+        finally:
+            active[0] -= 1
+
+    monkeypatch.setattr(ChasmGraph, "export_pickle", tracking_export)
+    g = _small_graph()
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        assert all(pool.map(lambda _: persistence.save_graph_to_disk(g), range(8)))
+    assert peak[0] == 1
+
+
+def test_pickle_stores_embeddings_as_one_matrix(tmp_path):
+    path = tmp_path / "g.pkl.gz"
+    _small_graph().export_pickle(str(path))
+    with gzip.open(path, "rb") as fh:
+        payload = pickle.load(fh)
+    assert payload["embedding_ids"] == ["i1"]
+    assert payload["embeddings"].dtype == np.float32 and payload["embeddings"].shape == (1, 3)
+    assert all("embedding" not in attrs for _, attrs in payload["nodes"])
+
+    # Format 1 files (embeddings inline on the nodes) still load.
+    legacy = {"format": 1, "graph": {}, "nodes": [("i1", {"type": "Insight", "embedding": [1.0, 0.0]})], "edges": []}
+    with gzip.open(path, "wb") as fh:
+        pickle.dump(legacy, fh)
+    assert ChasmGraph.load_pickle(str(path)).nodes["i1"]["embedding"] == [1.0, 0.0]
+
+
+def test_debounced_saver_coalesces_writes(monkeypatch):
+    monkeypatch.setattr(settings, "graph_save_interval", 0.01)
+    saves: list[object] = []
+    monkeypatch.setattr(persistence, "save_graph_to_disk", saves.append)
+    graph = object()
+
+    async def scenario():
+        saver = asyncio.create_task(persistence.run_debounced_saver(graph))
+        for _ in range(3):
+            persistence.mark_dirty()
+        await asyncio.sleep(0.05)
+        assert saves == [graph]  # three marks, one write
+
+        persistence.mark_dirty()
+        await asyncio.sleep(0.05)
+        saver.cancel()
+        with suppress(asyncio.CancelledError):
+            await saver
+
+    asyncio.run(scenario())
+    assert saves == [graph, graph]
@@ -0,0 +1,124 @@
+"""Tests for WeeklyBriefing graph queries (no LLM calls)."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from chasm.agents.publisher import (
+    _BRIEFING_PROMPT,
+    WeeklyBriefing,
+    _briefing_prompt,
+    _format_insight_line,
+    read_report_index,
+)
+from chasm.core.config import settings
+from chasm.graph.builder import ChasmGraph
+from chasm.models.schema import Component, ComponentCategory, Insight, Product, Source, SourceType
+
+
+def test_get_new_insights_resolves_component_and_source():
+    g = ChasmGraph()
+    g.add_product(Product(id="p1", name="Drone"))
+    g.add_component(Component(id="c1", name="Hinge", category=ComponentCategory.MECHANICAL), product_id="p1")
+    g.add_source(Source(id="s1", type=SourceType.REDDIT, raw_text="...", url="https://reddit.com/x"))
+    g.add_insight(Insight(id="i1", summary="Hinge cracks", sentiment=-0.6, tags=["hinge"]), "s1", "c1")
+    g.add_insight(Insight(id="i2", summary="Old", sentiment=0.2), "s1", "c1")
+    g.graph.nodes["i2"]["date_added"] = "2001-01-01T00:00:00+00:00"
+    g.reindex()
+
+    briefing = object.__new__(WeeklyBriefing)  # skip API-key setup
+    assert briefing.get_new_insights(g) == [{
+        "id": "i1",
+        "summary": "Hinge cracks",
+        "sentiment": -0.6,
+        "tags": ["hinge"],
+        "component_name": "Hinge",
+        "source_url": "https://reddit.com/x",
+    }]
+
+
+def test_get_new_insights_falls_back_to_edges_for_legacy_nodes():
+    g = ChasmGraph()
+    g.graph.add_node("c1", node_type="Component", name="Gimbal")
+    g.graph.add_node("s1", node_type="Source", url="https://example.com/review")
+    g.graph.add_node("i1", node_type="Insight", summary="Drifts", sentiment=-0.3, tags=[])
+    g.graph.add_edge("s1", "i1", relation="YIELDS")
+    g.graph.add_edge("i1", "c1", relation="ABOUT")
+    g.reindex()
+
+    [insight] = object.__new__(WeeklyBriefing).get_new_insights(g)
+    assert insight["component_name"] == "Gimbal"
+    assert insight["source_url"] == "https://example.com/review"
+
+
+def test_save_report_maintains_index(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "reports_dir", tmp_path)
+    briefing = object.__new__(WeeklyBriefing)
+
+    path = briefing.save_report("# First", "p1")
+    briefing.save_report("# Rerun same day", "p1")  # overwrites, no duplicate entry
+    (tmp_path / "p1" / "_index.json").write_text(
+        '[{"filename": "weekly_briefing_2001-01-01.md", "date": "2001-01-01", "bytes": 1}]',
+        encoding="utf-8",
+    )
+    briefing.save_report("# Again", "p1")
+
+    assert read_report_index(tmp_path / "p1") == [
+        {"filename": path.name, "date": path.stem[-10:], "bytes": 7},
+        {"filename": "weekly_briefing_2001-01-01.md", "date": "2001-01-01", "bytes": 1},
+    ]
+    assert read_report_index(tmp_path / "missing") is None
+
+
+def test_save_report_seeds_index_from_existing_reports(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "reports_dir", tmp_path)
+    (tmp_path / "p1").mkdir()
+    (tmp_path / "p1" / "weekly_briefing_2001-01-01.md").write_text("# Old", encoding="utf-8")
+
+    path = object.__new__(WeeklyBriefing).save_report("# New", "p1")
+
+    assert read_report_index(tmp_path / "p1") == [
+        {"filename": path.name, "date": path.stem[-10:], "bytes": 5},
+        {"filename": "weekly_briefing_2001-01-01.md", "date": "2001-01-01", "bytes": 5},
+    ]
+
+
+def test_format_insight_line():
+    ins = {"summary": "Hinge cracks", "sentiment": -0.6, "tags": ["hinge", "qa"], "component_name": "Hinge"}
+    assert _format_insight_line(3, ins) == "3. [Hinge] Hinge cracks (sentiment: -0.6, tags: hinge, qa)"
+    assert _format_insight_line(1, {}) == "1. [General]  (sentiment: 0.0, tags: )"
+
+
+def test_generate_summary_digests_large_weeks(monkeypatch):
+    monkeypatch.setattr(settings, "briefing_chunk_size", 2)
+    briefing = object.__new__(WeeklyBriefing)
+    batches: list[dict[str, str]] = []
+    prompts: list[str] = []
+
+    def fake_batch(batch_prompts, display_name):
+        batches.append(batch_prompts)
+        return {key: f"digest {key}" for key in batch_prompts}
+
+    def fake_generate(prompt):
+        prompts.append(prompt)
+        return SimpleNamespace(text="# Briefing")
+
+    briefing._run_batch = fake_batch
+    briefing._generate = fake_generate
+    insights = [{"summary": f"s{i}", "tags": []} for i in range(5)]
+
+    assert briefing.generate_summary("Drone", insights) == "# Briefing"
+    assert list(batches[0]) == ["0", "2", "4"]
+    assert "5. [General] s4" in batches[0]["4"]
+    assert "Insights 5-5:\ndigest 4" in prompts[0]
+    assert "s0" not in prompts[0]
+
+    # Small weeks skip the map step.
+    briefing.generate_summary("Drone", insights[:2])
+    assert len(batches) == 1
+    assert "1. [General] s0" in prompts[1]
+
+
+def test_briefing_prompt_matches_template():
+    text = "1. [Hinge] {not a field} cracks"
+    assert _briefing_prompt("Drone", text) == _BRIEFING_PROMPT.format(product_name="Drone", insights=text)
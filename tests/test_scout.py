@@ -0,0 +1,128 @@
+"""Tests for SourceScout batch discovery with a fake Gemini client."""
+
+from __future__ import annotations
+
+import json
+from types import SimpleNamespace
+
+from chasm.agents.scout import SourceScout
+from chasm.core.config import settings
+
+
+class _FakeBatchClient:
+    """Records the uploaded JSONL and answers each key after one poll."""
+
+    def __init__(self, answers):
+        self.answers = answers
+        self.requests: list[dict] = []
+        self.polls = 0
+        self.cancelled: list[str] = []
+        self.files = SimpleNamespace(upload=self._upload, download=self._download)
+        self.batches = SimpleNamespace(create=self._create, get=self._get, cancel=self._cancel)
+
+    def _upload(self, file, config):
+        with open(file, "rb") as fh:
+            self.requests = [json.loads(line) for line in fh.read().splitlines()]
+        return SimpleNamespace(name="files/input")
+
+    def _create(self, model, src, config):
+        assert src == "files/input"
+        return SimpleNamespace(name="batches/1", state=SimpleNamespace(name="JOB_STATE_RUNNING"))
+
+    def _get(self, name):
+        self.polls += 1
+        return SimpleNamespace(
+            name=name,
+            state=SimpleNamespace(name="JOB_STATE_SUCCEEDED"),
+            dest=SimpleNamespace(file_name="files/output"),
+            error=None,
+        )
+
+    def _cancel(self, name):
+        self.cancelled.append(name)
+
+    def _download(self, file):
+        lines = []
+        for req in self.requests:
+            text = self.answers.get(req["key"])
+            if text is None:
+                lines.append({"key": req["key"], "error": {"code": 500}})
+            else:
+                lines.append({"key": req["key"], "response": {"candidates": [{"content": {"parts": [{"text": text}]}}]}})
+        return "\n".join(json.dumps(line) for line in lines).encode()
+
+
+def test_discover_all_routes_batch_results(monkeypatch):
+    monkeypatch.setattr(settings, "batch_poll_interval", 0)
+    scout = object.__new__(SourceScout)
+    scout.model = "test-model"
+    scout.client = _FakeBatchClient({
+        "0:subreddits": '```json\n["r/dji", "r/drones"]\n```',
+        "0:review_sites": '["rtings.com"]',
+        "1:subreddits": "[]",
+    })
+
+    results = scout.discover_all(["Mavic 3", "Mini 4", "Mavic 3"])
+
+    assert len(scout.client.requests) == 4  # duplicates collapsed
+    assert scout.client.polls == 1
+    assert results == {
+        "Mavic 3": {"subreddits": ["r/dji", "r/drones"], "review_sites": ["rtings.com"]},
+        "Mini 4": {"subreddits": [], "review_sites": []},
+    }
+
+
+def test_batch_timeout_cancels_job_before_falling_back(monkeypatch):
+    monkeypatch.setattr(settings, "batch_max_wait", -1)
+    models = _FakeAioModels()
+    scout = object.__new__(SourceScout)
+    scout.model = "test-model"
+    scout.client = _FakeBatchClient({})
+    scout.client.aio = SimpleNamespace(models=models)
+
+    results = scout.discover_all(["Mavic 3"])
+
+    assert scout.client.cancelled == ["batches/1"]
+    assert scout.client.polls == 0
+    assert models.calls == 2
+    assert results == {"Mavic 3": {"subreddits": ["r/drones"], "review_sites": ["ifixit.com"]}}
+
+
+class _FakeAioModels:
+    """Answers subreddit prompts with one sub and review-site prompts with one domain."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def generate_content(self, model, contents, config=None):
+        self.calls += 1
+        answer = ["r/drones"] if "subreddits" in contents else ["ifixit.com"]
+        return SimpleNamespace(text=json.dumps(answer))
+
+
+def test_discover_all_falls_back_to_concurrent_calls():
+    models = _FakeAioModels()
+
+    def broken_upload(file, config):
+        raise RuntimeError("batch unavailable")
+
+    scout = object.__new__(SourceScout)
+    scout.model = "test-model"
+    scout.client = SimpleNamespace(
+        files=SimpleNamespace(upload=broken_upload),
+        aio=SimpleNamespace(models=models),
+    )
+
+    results = scout.discover_all(["Mavic 3", "Mini 4"])
+
+    assert models.calls == 4
+    assert results == {
+        "Mavic 3": {"subreddits": ["r/drones"], "review_sites": ["ifixit.com"]},
+        "Mini 4": {"subreddits": ["r/drones"], "review_sites": ["ifixit.com"]},
+    }
+
+
+def test_parse_json_list_skips_prose_and_fences():
+    raw = 'Sure! ```json\n["r/a", "r/[b]", 3]\n``` Hope this helps [1].'
+    assert SourceScout._parse_json_list(raw) == ["r/a", "r/[b]", "3"]
+    assert SourceScout._parse_json_list("no list here") == []
@@ -1,5 +1,6 @@
 """Integration tests for VectorEngine — extracted from engine.py __main__ block."""
 
+import numpy as np
 import pytest
 from sklearn.metrics.pairwise import cosine_similarity
 
@@ -34,3 +35,131 @@ def test_semantic_similarity(engine: VectorEngine):
     assert sim_ab > sim_ac, f"A↔B ({sim_ab:.4f}) should be > A↔C ({sim_ac:.4f})"
     assert sim_ab > sim_bc, f"A↔B ({sim_ab:.4f}) should be > B↔C ({sim_bc:.4f})"
     assert sim_ab > 0.3, f"A↔B should be meaningfully high, got {sim_ab:.4f}"
+
+
+def test_link_semantic_matches_adds_pairs_above_threshold():
+    import networkx as nx
+
+    engine = object.__new__(VectorEngine)  # linking doesn't need the model
+    g = nx.DiGraph()
+    for i, vec in enumerate([[1, 0], [0.9, 0.1], [0, 1], [0.1, 1]]):
+        g.add_node(f"i{i}", node_type="Insight", embedding=vec)
+    g.add_node("p", node_type="Product", embedding=[1, 0])
+
+    assert engine.link_semantic_matches(g, threshold=0.9) == 2
+    assert sorted(g.edges) == [("i0", "i1"), ("i2", "i3")]
+    assert g.edges["i0", "i1"] == {"relation": "SEMANTIC_MATCH", "weight": 0.9939}
+
+
+def test_link_semantic_matches_uses_given_insight_ids():
+    import networkx as nx
+
+    engine = object.__new__(VectorEngine)
+    g = nx.DiGraph()
+    for nid in ("a", "b", "c"):
+        g.add_node(nid, node_type="Insight", embedding=[1, 0])
+
+    assert engine.link_semantic_matches(g, threshold=0.9, insight_ids=["a", "c", "gone"]) == 1
+    assert list(g.edges) == [("a", "c")]
+
+
+def test_link_semantic_matches_blocks_match_full_matrix(monkeypatch):
+    import networkx as nx
+
+    from chasm.vector import engine as engine_module
+
+    rng = np.random.default_rng(0)
+    vectors = rng.normal(size=(40, 8))
+    vectors[5] = 0  # zero vector: never matches
+    expected_matrix = cosine_similarity(vectors)
+    expected = [(f"i{i}", f"i{j}") for i in range(40) for j in range(i + 1, 40) if expected_matrix[i, j] >= 0.5]
+
+    monkeypatch.setattr(engine_module, "_LINK_BLOCK_ELEMENTS", 7 * 40)  # 7 rows per block
+    g = nx.DiGraph()
+    for i, vec in enumerate(vectors):
+        g.add_node(f"i{i}", node_type="Insight", embedding=vec.tolist())
+
+    assert object.__new__(VectorEngine).link_semantic_matches(g, threshold=0.5) == len(expected)
+    assert list(g.edges) == expected
+
+
+def test_generate_embeddings_reuses_cached_vectors(tmp_path):
+    from chasm.vector.cache import EmbeddingCache
+
+    encoded: list[list[str]] = []
+
+    class _FakeModel:
+        def encode(self, texts, **kwargs):
+            encoded.append(list(texts))
+            return np.array([[len(t), 1.0] for t in texts], dtype=np.float32)
+
+    engine = object.__new__(VectorEngine)
+    engine.model_name = "fake"
+    engine.model = _FakeModel()
+    engine.cache = EmbeddingCache(tmp_path / "emb.sqlite3")
+
+    first = engine.generate_embeddings(["a", "bb", "a"])
+    second = engine.generate_embeddings(["ccc", "bb"])
+
+    assert encoded == [["a", "bb"], ["ccc"]]
+    assert first.tolist() == [[1, 1], [2, 1], [1, 1]]
+    assert second.tolist() == [[3, 1], [2, 1]]
+    assert second.dtype == np.float32
+
+
+def test_unusable_cache_location_falls_back_to_encoding(tmp_path):
+    from chasm.vector.cache import EmbeddingCache
+
+    class _FakeModel:
+        def encode(self, texts, **kwargs):
+            return np.ones((len(texts), 2), dtype=np.float32)
+
+    (tmp_path / "blocked").write_text("a file, not a directory", encoding="utf-8")
+    engine = object.__new__(VectorEngine)
+    engine.model_name = "fake"
+    engine.model = _FakeModel()
+    engine.cache = EmbeddingCache(tmp_path / "blocked" / "emb.sqlite3")
+
+    assert engine.generate_embeddings(["a", "b"]).shape == (2, 2)
+
+
+def test_link_from_matrix_leaves_caller_matrix_alone():
+    import networkx as nx
+
+    matrix = np.array([[2.0, 0.0], [3.0, 0.1], [0.0, 5.0]], dtype=np.float32)
+    before = matrix.copy()
+    g = nx.DiGraph()
+
+    added = object.__new__(VectorEngine).link_from_matrix(g, ["a", "b", "c"], matrix, threshold=0.9)
+    assert added == 1 and list(g.edges) == [("a", "b")]
+    np.testing.assert_array_equal(matrix, before)
+
+
+def test_large_encode_jobs_use_worker_processes(monkeypatch):
+    from chasm.core.config import settings
+    from chasm.vector import engine as engine_module
+
+    class _FakeModel:
+        def __init__(self):
+            self.pools = []
+
+        def start_multi_process_pool(self, target_devices):
+            self.pools.append(target_devices)
+            return "pool"
+
+        def encode_multi_process(self, texts, pool, batch_size):
+            return np.array([[3.0, 4.0]] * len(texts))
+
+        def stop_multi_process_pool(self, pool):
+            self.pools.append("stopped")
+
+    monkeypatch.setattr(settings, "embedding_processes", 2)
+    monkeypatch.setattr(engine_module, "_MULTIPROCESS_MIN_TEXTS", 3)
+    engine = object.__new__(VectorEngine)
+    engine.model = _FakeModel()
+    engine.cache = None
+
+    vectors = engine.generate_embeddings(["a", "b", "c"])
+    assert engine.model.pools == [["cpu", "cpu"], "stopped"]
+    assert vectors.dtype == np.float32
+    np.testing.assert_allclose(vectors, [[0.6, 0.8]] * 3)